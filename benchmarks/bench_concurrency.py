@@ -0,0 +1,120 @@
+"""
+Benchmark of the adaptive concurrency controller against a fake endpoint. The
+endpoint serves a limited number of concurrent calls at full speed, slows down
+above it and throttles calls above the account limit. Fixed limits are measured
+first to find the best throughput, then the adaptive controller is started from
+the minimum and its limit history is reported.
+
+    python benchmarks/bench_concurrency.py [seconds] [shards]
+"""
+from __future__ import print_function, division
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from botocore.exceptions import ClientError
+
+from kinesis.concurrency import ConcurrencyController
+from kinesis.kinesis import KinesisWorker
+
+# concurrent calls served without slowing down
+ENDPOINT_CAPACITY = 8
+
+# concurrent calls above which the endpoint throttles
+ENDPOINT_THROTTLE = 12
+
+# latency of a single call with free capacity
+ENDPOINT_LATENCY = 0.01
+
+# latency added for every call above the capacity, relative to ENDPOINT_LATENCY
+ENDPOINT_QUEUEING = 0.25
+
+RECORDS_PER_CALL = 25
+
+
+class FakeEndpoint(object):
+    def __init__(self, duration):
+        self.deadline = time.time() + duration
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.throttled = 0
+        self.records = 0
+        self.record = {'SequenceNumber': '1', 'ApproximateArrivalTimestamp': 0.0,
+                       'Data': b'{"id": 1}', 'PartitionKey': 'key'}
+
+    def get_shard_iterator(self, **kwargs):
+        return {'ShardIterator': kwargs['ShardId']}
+
+    def get_records(self, ShardIterator, Limit):
+        with self.lock:
+            self.in_flight += 1
+            in_flight = self.in_flight
+        try:
+            if in_flight > ENDPOINT_THROTTLE:
+                with self.lock:
+                    self.throttled += 1
+                raise ClientError({'Error': {'Code': 'ProvisionedThroughputExceededException',
+                                             'Message': 'Rate exceeded'}}, 'GetRecords')
+
+            overload = max(0, in_flight - ENDPOINT_CAPACITY)
+            time.sleep(ENDPOINT_LATENCY * (1 + ENDPOINT_QUEUEING * overload))
+
+            finished = time.time() >= self.deadline
+            with self.lock:
+                self.records += 0 if finished else Limit
+            return {
+                'Records': [] if finished else [self.record] * Limit,
+                'NextShardIterator': ShardIterator,
+                'MillisBehindLatest': 0 if finished else 1000
+            }
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def run(duration, shards, controller):
+    endpoint = FakeEndpoint(duration)
+    options = {'client': endpoint, 'max_record_count': None, 'concurrency': controller}
+    workers = [KinesisWorker('bench', 'shardId-{:012d}'.format(shard),
+                             shard_data={'last_sequence_number': '0', 'last_processed': None},
+                             options=options,
+                             sleep_interval=0.05)
+               for shard in range(shards)]
+
+    started = time.time()
+    for worker in workers:
+        worker.daemon = True
+        worker.start()
+    [worker.join() for worker in workers]
+    elapsed = time.time() - started
+
+    return endpoint.records / elapsed, endpoint.throttled
+
+
+def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 3
+    shards = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    print('fixed limits ({} shards, {:.0f} s each)'.format(shards, duration))
+    best = 0
+    for limit in (1, 2, 4, 8, 12, 16, shards):
+        controller = ConcurrencyController(initial=limit, minimum=limit, maximum=limit)
+        throughput, throttled = run(duration, shards, controller)
+        best = max(best, throughput)
+        print('  limit {:>3}: {:>9.0f} records/s, {:>5} throttled'.format(limit, throughput, throttled))
+
+    controller = ConcurrencyController(initial=1, maximum=shards)
+    throughput, throttled = run(duration * 2, shards, controller)
+    limits = [limit for _, limit in controller.history]
+    print('adaptive:    {:>9.0f} records/s, {:>5} throttled, {:.0%} of best fixed'.format(
+        throughput, throttled, throughput / best))
+    print('final limit: {}'.format(controller.metrics()['limit']))
+    print('limit history: {}'.format(' '.join(str(limit) for limit in limits)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark for the duplicate suppression filter, it reports the measured
+false positive rate and the decoding throughput with and without the filter
+
+    python benchmarks/bench_dedup.py [record_count]
+"""
+from __future__ import print_function, division
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from kinesis.dedup import RecordDeduplicator
+
+
+def make_records(count, offset=0):
+    return [{
+        'SequenceNumber': str(49576779335963694990727001090816802339424332026684112978 + offset + i),
+        'Data': json.dumps({'resource': '/index.html', 'referrer': 'http://www.google.com', 'id': offset + i}).encode('utf-8')
+    } for i in range(count)]
+
+
+def decode(records, deduplicator=None):
+    started = time.time()
+    for record in records:
+        data = json.loads(record['Data'].decode('utf-8'))
+        if deduplicator:
+            deduplicator.is_duplicate('shardId-000000000002', record, data)
+    return time.time() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    records = make_records(count)
+
+    baseline = decode(records)
+    deduplicator = RecordDeduplicator(capacity=count, window=float('inf'))
+    with_filter = decode(records, deduplicator)
+
+    # none of these were inserted, every hit is a false positive
+    deduplicator.duplicates = 0
+    decode(make_records(count, offset=count), deduplicator)
+    false_positive_rate = deduplicator.duplicates / count
+
+    print('records:             {}'.format(count))
+    print('filter memory:       {:.1f} KiB'.format(2 * deduplicator.byte_count / 1024))
+    print('target error rate:   {:.4%}'.format(deduplicator.error_rate))
+    print('false positive rate: {:.4%}'.format(false_positive_rate))
+    print('baseline:            {:.0f} records/s'.format(count / baseline))
+    print('with dedup:          {:.0f} records/s'.format(count / with_filter))
+    print('overhead:            {:.1%}'.format(with_filter / baseline - 1))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Import time benchmark, it runs a fresh interpreter with -X importtime and
+fails when importing the package takes longer than the allowed budget or
+when it pulls in the AWS client libraries
+
+    python benchmarks/bench_import.py [max_milliseconds]
+"""
+from __future__ import print_function, division
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# import time budget of the package in milliseconds
+MAX_IMPORT_TIME = 10
+
+# modules that should be loaded only when a client is created
+HEAVY_MODULES = ('boto3', 'botocore', 'panoply')
+
+
+def measure():
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', 'import kinesis'],
+        cwd=ROOT, stderr=subprocess.STDOUT).decode('utf-8')
+
+    timings = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = [part.strip() for part in line[len('import time:'):].split('|')]
+        timings[name] = int(cumulative)
+
+    return timings
+
+
+def main():
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else MAX_IMPORT_TIME
+    timings = measure()
+    total = timings['kinesis'] / 1000
+    heavy = sorted(name for name in timings if name.split('.')[0] in HEAVY_MODULES)
+
+    print('import kinesis: {:.2f} ms (budget {:.2f} ms)'.format(total, budget))
+    for name, cumulative in sorted(timings.items(), key=lambda item: -item[1])[:10]:
+        print('  {:>10.2f} ms  {}'.format(cumulative / 1000, name))
+
+    if heavy:
+        print('heavy modules imported eagerly: {}'.format(', '.join(heavy)))
+    if heavy or total > budget:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
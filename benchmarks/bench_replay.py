@@ -0,0 +1,57 @@
+"""
+Replays captured GetRecords traffic through read() and reports the import
+throughput, captures are created with the capture option of the stream
+
+    python benchmarks/bench_replay.py capture_path [speed] [options_json]
+"""
+from __future__ import print_function, division
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import kinesis
+from kinesis.replay import decode_payload, read_segment, segment_paths
+
+
+def captured_stream_name(path):
+    for segment in segment_paths(path):
+        for operation, _, _, buffer, offset, length in read_segment(segment):
+            if operation == 'describe_stream':
+                return decode_payload(buffer, offset, length)['request']['StreamName']
+
+
+def main():
+    path = sys.argv[1]
+    speed = float(sys.argv[2]) if len(sys.argv) > 2 else 0
+    options = json.loads(sys.argv[3]) if len(sys.argv) > 3 else {}
+    options['replay'] = {'path': path, 'speed': speed}
+
+    source = {'stream_name': captured_stream_name(path)}
+    stream = kinesis.Stream(source=source, options=options)
+
+    batches = 0
+    records = 0
+    started = time.time()
+    while True:
+        data = stream.read()
+        if data is None:
+            break
+        batches += 1
+        records += len(data)
+    elapsed = time.time() - started
+
+    print('stream:   {}'.format(source['stream_name']))
+    print('speed:    {}'.format(speed or 'unthrottled'))
+    print('batches:  {}'.format(batches))
+    print('records:  {}'.format(records))
+    print('calls:    {}'.format(stream.client.replayed))
+    print('elapsed:  {:.3f} s'.format(elapsed))
+    print('rate:     {:.0f} records/s'.format(records / elapsed if elapsed else 0))
+
+
+if __name__ == '__main__':
+    main()
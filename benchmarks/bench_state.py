@@ -0,0 +1,69 @@
+"""
+Benchmark for the shard state persistence, it compares the encoded size and
+the cost of saving a batch in which only a few shards have changed
+
+    python benchmarks/bench_state.py [shard_count] [changed_count]
+"""
+from __future__ import print_function, division
+
+import copy
+import datetime
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from kinesis.state import ShardStateEncoder, load_shards
+
+SEQUENCE_NUMBER = 49576779325192435059829537036290334312001617382801932322
+
+
+def make_shards(count):
+    return dict(('shardId-{:012d}'.format(i), {
+        'last_sequence_number': str(SEQUENCE_NUMBER + i),
+        'last_processed': datetime.datetime.now()
+    }) for i in range(count))
+
+
+def save_dict(shards, changed, rounds):
+    # the whole state is copied and serialized on every save
+    started = time.time()
+    for _ in range(rounds):
+        for shard_id in changed:
+            shards[shard_id]['last_processed'] = datetime.datetime.now()
+        json.dumps(copy.deepcopy(shards), default=str)
+    return (time.time() - started) / rounds
+
+
+def save_compact(shards, changed, rounds):
+    encoder = ShardStateEncoder(shards)
+    states = load_shards(shards)
+    started = time.time()
+    for _ in range(rounds):
+        for shard_id in changed:
+            states[shard_id]['last_processed'] = datetime.datetime.now()
+        encoder.update(states)
+    return (time.time() - started) / rounds, encoder.encoded
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    changed_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    shards = make_shards(count)
+    changed = sorted(shards)[:changed_count]
+    rounds = 20
+
+    dict_time = save_dict(shards, changed, rounds)
+    compact_time, encoded = save_compact(shards, changed, rounds)
+
+    print('shards:          {} ({} changed per batch)'.format(count, changed_count))
+    print('dict size:       {:.1f} KiB'.format(len(json.dumps(shards, default=str)) / 1024))
+    print('compact size:    {:.1f} KiB'.format(len(json.dumps(encoded)) / 1024))
+    print('dict save:       {:.2f} ms'.format(dict_time * 1000))
+    print('compact save:    {:.2f} ms'.format(compact_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,6 @@
-from . import kinesis
-
-Stream = kinesis.KinesisStream
-Logger = kinesis.Logger
+import importlib
+import os
+import sys
 
 KINESIS_REGIONS = [{
     'name': 'Ohio (us-east-2)',
@@ -60,45 +59,102 @@ KINESIS_REGIONS = [{
     'value': 'sa-east-1'
 }]
 
-CONFIG = {
-    'title': 'AWS Kinesis',
-    'icon': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAASwAAAEsCAYAAAB5fY51AAAKQWlDQ1BJQ0MgUHJvZmlsZQAASA2dlndUU9kWh8+9N73QEiIgJfQaegkg0jtIFQRRiUmAUAKGhCZ2RAVGFBEpVmRUwAFHhyJjRRQLg4Ji1wnyEFDGwVFEReXdjGsJ7601896a/cdZ39nnt9fZZ+9917oAUPyCBMJ0WAGANKFYFO7rwVwSE8vE9wIYEAEOWAHA4WZmBEf4RALU/L09mZmoSMaz9u4ugGS72yy/UCZz1v9/kSI3QyQGAApF1TY8fiYX5QKUU7PFGTL/BMr0lSkyhjEyFqEJoqwi48SvbPan5iu7yZiXJuShGlnOGbw0noy7UN6aJeGjjAShXJgl4GejfAdlvVRJmgDl9yjT0/icTAAwFJlfzOcmoWyJMkUUGe6J8gIACJTEObxyDov5OWieAHimZ+SKBIlJYqYR15hp5ejIZvrxs1P5YjErlMNN4Yh4TM/0tAyOMBeAr2+WRQElWW2ZaJHtrRzt7VnW5mj5v9nfHn5T/T3IevtV8Sbsz55BjJ5Z32zsrC+9FgD2JFqbHbO+lVUAtG0GQOXhrE/vIADyBQC03pzzHoZsXpLE4gwnC4vs7GxzAZ9rLivoN/ufgm/Kv4Y595nL7vtWO6YXP4EjSRUzZUXlpqemS0TMzAwOl89k/fcQ/+PAOWnNycMsnJ/AF/GF6FVR6JQJhIlou4U8gViQLmQKhH/V4X8YNicHGX6daxRodV8AfYU5ULhJB8hvPQBDIwMkbj96An3rWxAxCsi+vGitka9zjzJ6/uf6Hwtcim7hTEEiU+b2DI9kciWiLBmj34RswQISkAd0oAo0gS4wAixgDRyAM3AD3iAAhIBIEAOWAy5IAmlABLJBPtgACkEx2AF2g2pwANSBetAEToI2cAZcBFfADXALDIBHQAqGwUswAd6BaQiC8BAVokGqkBakD5lC1hAbWgh5Q0FQOBQDxUOJkBCSQPnQJqgYKoOqoUNQPfQjdBq6CF2D+qAH0CA0Bv0BfYQRmALTYQ3YALaA2bA7HAhHwsvgRHgVnAcXwNvhSrgWPg63whfhG/AALIVfwpMIQMgIA9FGWAgb8URCkFgkAREha5EipAKpRZqQDqQbuY1IkXHkAwaHoWGYGBbGGeOHWYzhYlZh1mJKMNWYY5hWTBfmNmYQM4H5gqVi1bGmWCesP3YJNhGbjS3EVmCPYFuwl7ED2GHsOxwOx8AZ4hxwfrgYXDJuNa4Etw/XjLuA68MN4SbxeLwq3hTvgg/Bc/BifCG+Cn8cfx7fjx/GvyeQCVoEa4IPIZYgJGwkVBAaCOcI/YQRwjRRgahPdCKGEHnEXGIpsY7YQbxJHCZOkxRJhiQXUiQpmbSBVElqIl0mPSa9IZPJOmRHchhZQF5PriSfIF8lD5I/UJQoJhRPShxFQtlOOUq5QHlAeUOlUg2obtRYqpi6nVpPvUR9Sn0vR5Mzl/OX48mtk6uRa5Xrl3slT5TXl3eXXy6fJ18hf0r+pvy4AlHBQMFTgaOwVqFG4bTCPYVJRZqilWKIYppiiWKD4jXFUSW8koGStxJPqUDpsNIlpSEaQtOledK4tE20Otpl2jAdRzek+9OT6cX0H+i99AllJWVb5SjlHOUa5bPKUgbCMGD4M1IZpYyTjLuMj/M05rnP48/bNq9pXv+8KZX5Km4qfJUilWaVAZWPqkxVb9UU1Z2qbapP1DBqJmphatlq+9Uuq43Pp893ns+dXzT/5PyH6rC6iXq4+mr1w+o96pMamhq+GhkaVRqXNMY1GZpumsma5ZrnNMe0aFoLtQRa5VrntV4wlZnuzFRmJbOLOaGtru2nLdE+pN2rPa1jqLNYZ6NOs84TXZIuWzdBt1y3U3dCT0svWC9fr1HvoT5Rn62fpL9Hv1t/ysDQINpgi0GbwaihiqG/YZ5ho+FjI6qRq9Eqo1qjO8Y4Y7ZxivE+41smsImdSZJJjclNU9jU3lRgus+0zwxr5mgmNKs1u8eisNxZWaxG1qA5wzzIfKN5m/krCz2LWIudFt0WXyztLFMt6ywfWSlZBVhttOqw+sPaxJprXWN9x4Zq42Ozzqbd5rWtqS3fdr/tfTuaXbDdFrtOu8/2DvYi+yb7MQc9h3iHvQ732HR2KLuEfdUR6+jhuM7xjOMHJ3snsdNJp9+dWc4pzg3OowsMF/AX1C0YctFx4bgccpEuZC6MX3hwodRV25XjWuv6zE3Xjed2xG3E3dg92f24+ysPSw+RR4vHlKeT5xrPC16Il69XkVevt5L3Yu9q76c+Oj6JPo0+E752vqt9L/hh/QL9dvrd89fw5/rX+08EOASsCegKpARGBFYHPgsyCRIFdQTDwQHBu4IfL9JfJFzUFgJC/EN2hTwJNQxdFfpzGC4sNKwm7Hm4VXh+eHcELWJFREPEu0iPyNLIR4uNFksWd0bJR8VF1UdNRXtFl0VLl1gsWbPkRoxajCCmPRYfGxV7JHZyqffS3UuH4+ziCuPuLjNclrPs2nK15anLz66QX8FZcSoeGx8d3xD/iRPCqeVMrvRfuXflBNeTu4f7kufGK+eN8V34ZfyRBJeEsoTRRJfEXYljSa5JFUnjAk9BteB1sl/ygeSplJCUoykzqdGpzWmEtPi000IlYYqwK10zPSe9L8M0ozBDuspp1e5VE6JA0ZFMKHNZZruYjv5M9UiMJJslg1kLs2qy3mdHZZ/KUcwR5vTkmuRuyx3J88n7fjVmNXd1Z752/ob8wTXuaw6thdauXNu5Tnddwbrh9b7rj20gbUjZ8MtGy41lG99uit7UUaBRsL5gaLPv5sZCuUJR4b0tzlsObMVsFWzt3WazrWrblyJe0fViy+KK4k8l3JLr31l9V/ndzPaE7b2l9qX7d+B2CHfc3em681iZYlle2dCu4F2t5czyovK3u1fsvlZhW3FgD2mPZI+0MqiyvUqvakfVp+qk6oEaj5rmvep7t+2d2sfb17/fbX/TAY0DxQc+HhQcvH/I91BrrUFtxWHc4azDz+ui6rq/Z39ff0TtSPGRz0eFR6XHwo911TvU1zeoN5Q2wo2SxrHjccdv/eD1Q3sTq+lQM6O5+AQ4ITnx4sf4H++eDDzZeYp9qukn/Z/2ttBailqh1tzWibakNml7THvf6YDTnR3OHS0/m/989Iz2mZqzymdLz5HOFZybOZ93fvJCxoXxi4kXhzpXdD66tOTSna6wrt7LgZevXvG5cqnbvfv8VZerZ645XTt9nX297Yb9jdYeu56WX+x+aem172296XCz/ZbjrY6+BX3n+l37L972un3ljv+dGwOLBvruLr57/17cPel93v3RB6kPXj/Mejj9aP1j7OOiJwpPKp6qP6391fjXZqm99Oyg12DPs4hnj4a4Qy//lfmvT8MFz6nPK0a0RupHrUfPjPmM3Xqx9MXwy4yX0+OFvyn+tveV0auffnf7vWdiycTwa9HrmT9K3qi+OfrW9m3nZOjk03dp76anit6rvj/2gf2h+2P0x5Hp7E/4T5WfjT93fAn88ngmbWbm3/eE8/syOll+AABAAElEQVR4Aey9CZAlx3kmlnW+s8/puWcwBwY3AR7gLdKCeIMkSEoUyJVsyZTCsXY4QrJXEQrvytai4Y2Vd8MRlkMbuzYoUlQwfC0g7crLkKjTolYUwUMQIR4giYvEjZmemZ7u1++sy9/3V9V71d2ve/p4d2d116uqrDz+/PPPr/7M/DNTKX1oDvSIA5FSBs9sdFG0/jn7Tt9rDmgOaA4MnAMCVIvKTBN++P473K/8o7cV0ucI7zRwpdzQ1/1wYN3XcD8R6bAHjwOpNgUhwm18/JsPnLtrquze+/bzpfwNc/ZfLzWDr55YfKzGt+KfP0bHfxJMXzQHdsQBDVg7YpP2lOXARqB6+H5lrfq33WZGwX1+GP60a5s3vevWcuVI2a55QfQnkRH+P2u++rsUuBgXNS4NXFmu6vudcEAD1k64pP20ObCI5h3OkA4P3Xd30TbWbo/M8F0QpE+5lnGbjzeGGYXvuXXq8uGyc8S1DVVtBZfNyPi8YUR/lDeMx41f+/oVhmdTUS2qKKuh0V0fmgNbcUAD1lac0e7rOJAFqsV7lH1q9uY3WCq8N1TGvZGK3mibphWEkcK/AnD577qtTMA6DDfLMglJkfLD6CloVX8K5eoLddv5yuH/7m8qTCRaXARwLWrgWsdx/dCNAxqwunFFu6Uc4Kgfh/l4kePTH7vpddCvPmwa0YfQpns9wCgXAqXggYCjAqCRa6ng3beWLx8CYOEVO+MlGscyFJqIwK7o+3D7UztSX8h96+xfGo88EjByeBJ5zKZHd31oDqQcEAFJH/RVcyDhwDqgYh/VNe/snWbk/DR6nj6APvM7oTS5RCEoTrzwEFmKNaz1gJXxwFvDRmD0dTHks6Fh/Dmc/m25YH7V+JVH64wInjRwkRH62MQBDVibWHKgHTYA1anCWqtwV2iE7wWGfMw1zbvRpFMtaEk4MjjU4RkALG4S3lq6kmpY9NgWNI4QxiGhiZnKtpWqNcNn4fyF0A++GES5b8wsPnpVEqANFwLiP02rk5C+O5AcaMvRgcy9znTKgVQOBBjYX3Xy8RtfbynzY3B4L87XuWj6eSEacwCPGEM6GJRGwis9OBuahHDa5DlxC4FIEfxbBEHE/gMg5v9nKfXvrgbhV9JRRfgV+vDDYPo4wBxIBfUAs+BAZ53lvw4EfuejF24PTfVJuL4fYHIX+qgKwCkCEUcG28ahW3FtqybhdQRN4qbG1QrCAGk/iQS/hLj+7dQ//cZfZdMieCGudTRn3+v7yebAdeRosjN/UHO3sdL/1r0XcvmiumAGxs9DIO4DX27cqo/qejzbqYa1KZ64qUjtzWQfl8c+LmW8CKj8C8swfiffqn7TWPzuWhpuYx5Sd32dbA5owJrs8l2XO1ZyOuAHt0p97p6zeTVvvy4MjQ+iu+iDwIy7c7aJkbyQ5gniJ/ZO3zs7ugHWzkK2fUm6oNEoOCZNIVTTpzlE+Kdoon6h7rW+Nrf4+LW2b31zoDigAesAFDeBKiloAYOH77/fqnqP34mHj6Mt9iH0G91mW0aedlRwo4kBm357kg3qRV3MGvbCZdLKpqIFuy42FdEyNZ4BqP4ZBgF+r+x6Xzd+9VvVvUSsw4wvB/YklOOb3YNFOWr8uv4ePv/ufTffEpjhzwCkPgxIuhVWncWkj4oAwWNfMtENsBjxniNNmopoJZomcuMHkQ9YfRb0/6/FoPQ5Y/FLjY35lFzon4nkAAaV9TFpHGAFZp7wIyD0+Z+7q9So1G/6nTD8KWWG6KcybjBNWQpGUW8RT/vAlCz/mDBH/rJu+7qnaQOipPJHYAXdNgYCbkaz9Q4V1F28a0guJcf7SkkHHgMOaMAag0LaKYkCVIvQqpK5fuyj8masN7TWGu83I3Smm+Zr0aFtBqj4cetPYu55VQe29DxOUAocJGjhDCIY2RtiHb9T3mh/k8EBDVgTUI4CVMgHUCJSiyqiZfqKd+PrMM/vPitSH4GJwO1oT+VQ15UfRSEuBJR+gEpfuQmclb64sSO8r1w5WJFrwBrj8iZQJcgjTbC/vOce+5npF++seOZHjSj6Seg5t8C0Kcc2X6fld31bqpFnCXIN3NW4NfIF1XsCNWD1nqeDiNFYXOw0/T77kVumwii44xnjpfcYpvELGKU7j1YT+6fY9OPB34mq4GgSxjmT7Omfg8IBDVhjVtIAKlmPClc0/e5wKw3vzZEKPmhaxvsBS2+AkWV7rl+CUIkSNpiMdkORXiFlJ55uqQwmfzqV4XJAA9Zw+b/T1NO6iqWj4sXzPvOxm9+84rU+bFgw+IyM12LkzKYdFTrU09o8FBUkJTSbMRLUzT3rZyf3nXgYW5rNnYTUfiaFAxqwRrskBXRQPaV2so/qqfnnX2+G1k/D7V7AwG2wqcSyUrD25Jh/fPQCG/bMlZSIPUewo4CDSWVHpGhPA+WABqyBsnvHibWBiujz+ffdVarnGq9/2njhfVZofgyW37RSl8XwOMyfxDpUoEpzRiJ6aoeVRrzhCkVyJPK7gSz92GcOaMDqM4N3GX1aCaU2LkKjOl1+8U0ts/4xTPF7D2bM3Ak7KqcVimkCm1kEtjTMLpPqn/c+2WFlCAYk0gJeHweOAxqwRqPICTqsgO1K+DksRRxGL34SDu/Fy9cAqHLso8Jk4PYyL23Po5EHoWIwNA0mlRFiqyYl4YAGrCGKAqod7ahY+6QGfu5TZ/PBVfs2dKR/Ctj0Qbw9g01nHCIUgCqtpdddk2qIWeqq7vVKBezEo+2whlnGw0xbA9YQuE+gYrIJWKGP6miplZ++O1jBMi9GdC8Q6S7s7ccVCripQwpUnfo6BJr3kyQz0AviO/HQ5H0og6D7YYMO2wMOaMDqARN3GgWBihU3BaqH/uHdjnWp8nr0SX0cjh+Adfot2FkmF68BhZU397HMy05p6rW/FF2z8fYCrBhfJx7edUspm6q+n0QOaMAaQKkmQMWOdKll3ED089++5TXBUuVn0dBD00/dhLl+eZnr12n6YWnzyTiY6Q7Y7D1PnXiEjXuPSIccWw5owOpj0aFaST1NgQqW6eVK07/1c4+H92PSzM8h6eMAKkGxzFy/XtTtPuZq+6hJvDZr2J5H+u3eOaABa++82zKkANUimn+JVfpD950oOnbxTVXf+4Ayow9Dq7oDK3wa8TIv7c70sQaqLDO0WUOWG/q+lxzQgNVDbq7TqBZVxD4q85Urd5um+VHA0odRkW/FqpmwTG+bJ8QKSQ9pOBhR6SbhwSjnzbnUgLWZJ7t2IVAlyCM1ibvQlIrWnWpp5ePYA+ajeHsBLT+HulSm6TfS5gm7ZsI2AXqlOnbi0WYN27B7ol9pwNpf8a5b5uXh+8/PVFv2XTBNeF8UhJ9yLeuUD22K/eiwq+IhFuwEuP0lO16hmfVeZDgbjzZrGC8Z6BW1GrD2xkkBqkX0UeGMaPAZrdhvWW0ZH4aq9X5EeSc3TKAdFY4sSE288VCMy+uZ2guwYoydeLqlsj5N/TSZHNCAtbtyTesMl3mRWvOZn7rlx4KV6D4sgfkBYNRrsMKnRZzKNP0mHqSyLEwZlHXLakZZ993ed+JhKhq0dsu/SfCvAWtnpSigg2oitYQL5621Gm/EJ/8TURi+F53ot1iGaXEpqlFZ5mVn2eq9r8HAyGBS6T13dIz75YAGrO052AYqftMfes/5GbtovGG12YI2ZX4kZxu3htCmvA0a1fZRTvZb8knbYU12GQ8zdxqwunOf9Y6H9D9hFxp3tXnurdjL8ycx4vcu1MjXONguC1uoSycVPBPY0jBxyAP8q+2wDnDh9znrGrDWM5igw/ZGu83x2z914a2rvvqEYUbvASbdyvWoONfPG/FlXtZna3BPbcb1NcnBpNLXLOjI98QBDVhgG8SfdlSsBVITHr7/VGG5VbgLk/l+wQg56hedtkzTYvNvXJZ52ZM09CBQNzWzm9tekurEo+2w9sK/SQhzoAErASq25QSofus/vTBdrIZvWvXND9lm9AGLa6Zjb3Rsi47O9NgPCr1TbyZBAgaQBzK3F0zrxKOXlxlAsY1kEgcSsBKgaq+eIJbpefNNRjX66UhZ70NJXbCNuOkXBOO5zMuwpE2Qf0PivQArRtmJh3fdUtqQsH6cOA4cKMDaCFSyZvr0K6+LzPA/g+HU+/H+PLbLcqlMoenHDnXWjIlZ5mVY0kto6YDN3qnoxMM7fRxEDhwIwIJ4s4+KlUYkXcwTpszbVfjSP8CLf4BXR2SZF9pRdfb1OzBz/Xop+DGf+28rq3fN6WWpjU9cEw1YBKoHFwFWyTIv/xrrURVa3lsBSh/CLlEfxCq7N0OjIkits0wfn+IbTUq1WcNolsskUDWRgEWgYuGIRrWoIvZRFR3jLYbX/Ai6az9omAqW6ViZCh4zTT8JMwmFOvl5EEW5p9lMZSaNVGQnfdDXkeHARDV7UqGjsPHkpORPf/TWtxdyxr8APH0WYPXfYNDvNmTa5Fw/+KfkkwcarPookr1ibicemjWITe++qKa8LGK5apY/5SV70j2Vp30logP3lAOTomGh1SdCJ5bnn7n/1LzRzL02umZ+wDYCLPNiHoGhJ5t9EHT+y9GR/56yVEe2kQPkdy+YnY1nH8vLyEobpFG6Chbjfk1q4ceOqem3H5sPT+a+vsx3i/DD9ffVAwCzeCVrBtPHEDkw7oDVWeYFssU+qqLfelvUwuqeWOYFQnYLK0qTO5Di4D1uelF3GJ0+unBAGL3BvVcM78TTLZUNiXYeZQTgwUVl3P5dZXziERVAe5IIuMb+it86bQTqPNYwu9NuOjc6TrjcyL35ybV/EXyt1Jj6nrH4JV8tQm7uv99SDz8SUnrwvysCOqTou/1yYFwBqz0pmcLHr+Bn/v7Geyzf+zC0KFim0+AzXjMdDEqFq/9DV/stjQkI3wGVTmZYAN3cOz52dteJh7Glxbo5LN5Icvihp7jtuBgH+Nw92Kx22r4NS+rfttry3mga0WuhQ52FEctRgJZlmdEV3OdgzfK9Nbf655V/9uYvV4Lgq8biI7U0Exvi30yAdukbB8YNsNpARYn8X+5/W2HOW3rL5x43PgHBew/6NW4ETplsF9I8IRFrEd6+cVBHvI4DW8PIOm/7fFifyoMPxlBCV4IUzzQBrqtvv7p22LD8W9EX8PpQWa9F6+410LlvxHUKc9jRuqRv9HBGahkrTYSYL7oAh3diFY63oSfr+VnLenTtN970F3YQ/sfcC+p549OPeWn8iJPh2+ml7vraHw6MS2VuAxXZ8Jn33zFvuM03hoZxL0b87ivY5o2ckMwTRyo845I30jwxBzsIXcvw33Vr6cqhsnMYRcLO61Q52Vc+03i46TO+R/+qaUW/Pv+PH1vZCBoP3XfzgmUHx4zIuB0AdDd83wkKOHH9XA4rLLYwKZSyQlpxyC8ejfmyee3Hb5qqlFzzJHbchsGL5EXZrqlqdb8JJHw0Coy/wSfxr0qu+/fGr37lksQQRyLyhp841vSFvvaUA6OuYaWgI9oSNap578rbfdX6OATwHgzv3AYhVHU/DOkRJ4EtDdNTRunIds4BQEGfywAwBK1mzmr5pIr3D/3UmeO2b99qWOad0LDvVKFxG3ydhUScyFmWbKkGkIr80Mdr0akSkYnlJSU4uYoHRB15UNVb9SCCHpbL2+Y9tSh8B7Ds/qrnPVr9jTf+degbX536p9/4LsK1gYoymH1GPProEQdGFbAoNxSAthB85iPn/hPDW/pkoIyfgCDehA8lNPR4Cg08c2i645kP+hgKB9oF1tfUqf4YwZefjY7+b/fddLtjqXei4/wm6HI3QWs6DQ1syuasdRyEJwy6BLilTMHN6DrVagu62x9AKmQ1oBfaf3bOMm5u+upmPEDDj75f+403fxXI+QdT/+TrXwVSrWuSkgZ99I4DLMSROSA0675MHPVzW97rYYv+ixCUd+P1KXamh5QeQ3HKH+kfqTyMDDOHRAibWQCQ4N23li+nTcJek0JQ+NHl5vN/+1ztasuPjkMkjkI+6CwfLYgHD3ZlUjjaoMPnrQ6GYZPwHjQJi655Cs9byRVj52lSu6fAYjUPam3P4efxKIy+6AbqL3LzCy8Zv/zF5lbpafe9cWAkNCyUPsudEkJBUL/5sbOzM5H9lqjVvA+O78PH8iaM6mAXGpnrR0GkbMoXlP71MdocYKFuVfv3Qjn7rLDcz5m8bZ0JgRX8cqFPK17+tRPhrrTuXdAXiyokMOkzRd4Ms+CY55DPc3UvfK9vRE94K0ufX1l82/89s/jo1Q5J+m6/HBgqYCVA1Vah/+f3HS3N5mbfYkTRxzHEzM0dbnSwbTIFI1AR1XpTA9V+i7y/4eWL098kJHYffUsNPwhhEGzgY7YjLWo7snZNd0YDQ9iohn5UyKaBpbPLjm29udoK6qbp/RXSvJrK+Xbp63c748BQACstQHyqRE449GxcvPYmaFI/h+/ku9lZCiF0qEoBrGKNSi/zsrMSHUFfu9Bedk49hAR6m/RHiRDtPGRXnymNlM2uHrZ3pMaP9R7RSR9GAVQvdLEqp6mMuH6RwL3Eun2aB/LtQAGLwoBya2tUnEJjB4XXhEurPxsa5idR6LNs+kG7hx1VDGYoFd30GyPR7FYvx6m+Uj73zO5Y64rlFR2vDhZa23NcOmBXDgwUsFJh+D+wFHF9zXyH4asPQrO/F+7noUpzTz+9zEvXYhovRyg/e6/045XVrtQKaGMIkYOKXT1oxz1zYKCAla6Z3qqqj8Ey/QP4ltEy3eCk5EzTTxfynotzNAJCOT7YZRgj1mgUxoRRMTDA4lIv4TX1i2jq/xJ6J89hPSr0ra/b0l03/SZAuKha4TS80CjiVqrugUOvA61f9leIBwESIq/1pbCAqe5vRh/VeRNdWWj9Ea9YtHx/4GS6v8U63NhRmAbskYoEruFSsofUx4/iPWRyfIMMTMMSFhkcRFnHLC0e69gxOQ/ri3l88oUxaS2TI1xcg9CwNmVfS8QmlmiHEeEAB6n3TYoIuJbyffOxSwQDBayBJtYls9pJc+B6HOhdM3b/uHc9Wg/ie40hB7HUdZ635AD0ov0jzf5j2JK+g/5CA9ZBlwCd/z5xQDcJ+8FYDVj94KqOUzjQk/6gseWlVrP6UXQasPrBVR2ncAB2K1rN0LLQUw5owOopO3Vk484BDbKjXYKDtcMabV5o6jQHODt//2050Sv5s/+o+lwk7UmfWVU4pRpu6W2fydh59FrD2jmvtM+DwIFszd1rfqWaj1xdlzXDFrH6CShLcykrpyTARILl5DNP+hs1jVNrWHsVSh1uIjnQkwqawsEQOUSw4eaxJOGBxRiAErKwjWfnWFxU5vHH7s6bzsp8zolmLxwuGm87M3VR/epXlghajIFxKcQlO2V3gg7lTgPWUNh+sBLlZzupLCOf8bh+xmTulu62f95IjuWm33mWZl26szUT4+7Wkg8AFZ8X+YODm8iqWZX3nWguiuzjyjdO2X8fHVP2ygmsl3o+8sxTLvbsaLT8p9VvvOkrqyp8dCXvPmf8yqN1RMJl6oxHPnG/ef8jj3CXqoFkLqa886sBq8MLfdcnDowLWG3M/m7pbvuXm57X53Z/E+lEEmkC8Vo+CTilefitey/kymU17fvhnO2bx0MjOuubWM5JGWexDh32bFQL6K87Agw6hP0b81g9hUeAVX+XEflbsZTXx01lPT5b9b5S/2dv/PNG4D9uGI9fU+oRLlUea12kAOEytPBVXw8NWH1l78GOnB3YPWlijRsbUyjZJ92IRpp1i4uyA9CWi4wBnKaLRjBn5JxZbCyMzWvDswCkG0MP+3ZG5gVsqjgHUgpY0amI1e9zspYzCoewk5LKRQmwNh00s8gHAgWOYczB6Sewrd6PYT74pxzT/YvKb7zlC45hPp77Yes52f06Brl95nJ3wTVg7Y5f2vcuODCWYDWESrgFSwkpkUo0p4fvvwOtNeU2g7WpVpQ7oqLwKBa+PIblmk4CbM5jy4Mb8XW4CYsyn8qbFvaRTdZvAuoQlHjyJwLsiYqEB8ZPd2YZV8m5XLEDDFYCFpSERuaapnESKwL/fMMPf95XwWPeafOPKv/87r9Ubu675ap71Vj8kmxoyyT6fWjA6jeHdfxjxYERWV5GMOSzH7llKjIj2cF6tdU8CQQ7ib0tTgOKTsDDUVOZJxzLKBFruGovtSSqtNg4NstzYpIcjFRQCVcCk4BTfN92jz0C1eKXxDdZuhzLl4tOljPNuwMzutsL1P2q6T1asVp/EP3WhT8xfvnpgezBqAFLSkj/aA7EHECtbFfwPfNEUIE/e4tqcVEZOCPLDl+PPav/JbSlM6CrAIyZAUBJ7CG6valFYd14QNTmdMRTTEF628XXNjmMye9wA3dIqA2GOcu8FRvF3Iqlza2VauGvEVMTr0ncZmK2SWa3rzRg7ZZj2v9Ec4CVbt8ZlCq793p7+3djGtB/dAh60F2uaRR9KE2MkQCVpY/Extiynu51nrIButwTZOC/k+8kMC9tR2lBtgNHLah0MOLkdtsFMyoMzJ5zYAm1s6pvNAdGmAOogLup673OCfHBeGLpHsEJNE9JS8unDgWFKklM/NAfT3hoN+2S97u+MI49BGK6INAIp/IWbwdyaA1rIGzWiYwNB3pR9aT682fLyDYCROpRrotf+lJsOhCplkBC3NDaGGboLCVBg9Z4NGANvdgnlwBqK1AORq6i9Z3jCfw4WyeUAlRXH9hhKnfpor0wXzZf6/mGs9YIpVOd7S9hJn6GylQmvm0OumarJ44asHrCRh1JNw4cSLBKGCEd4a4lzbiNzUyaKCyresFsRnkrcEowgDob2RHMEsJzhjJvVNfUqRk7nCo75pHbbsgV6l6kLq8FxuWKryrNgP1Y2MczTmgoADYksGKONWAlAqYvB5sDaR3sFciKdhlwBouyP/NTt520w2gBBp1z6HE6vNZqnLeUiZE/83TkRKegrsxDYylDf5rKYRTQptm5h4C4zpds5dqmOj4TqoYfqZWaD/Dy1Uo9VNS81lqh8gFg7Q4uBBUQ60FxbhkPX6QM60E6u4lCA9ZuuKX9TiwHtqycu80xIqI9FMDk1GPP1/7r//2+G1tG4J8CoByH81EYNs1CiyoA0FzgkWmZcS8/w4T4gQ1V2AoMnCE2o8UZwE4d3ds2/E3nDVXOuerolAN/kQDWct1X12qBWq4G0L464MX8II3+HEMCK2ZGA1Z/ilTHOmYcSOsgNaN9kY4+OxiKq3orvKHWDH8BaINZLjL8z6kvov3ABhOJRIomVEEg+JZiCyEGxuUwF8UNIhLQoaMAGrri6ZGal2MbquSaaqFsqRbAq4FmY6URqIurnrokTUcMMe4wJ4iSXpnMukNoWOeSPMCnDBF2e9dnNw1YfWawjn68OLDDOr5tplj78U8TTyhQMQ4QcGQIIm5MpeDAKxuA64+EiOQSv4On1J80//CSz5g2A0MonJi4M1u01A3zrrpS9dXfPV8T4ErTX5/A+qckqvWO2z0hAGlL6dnOa6/fDXpUstf06/jGgAMU7vE4DAtg0x7c2zPdqMnUoBAXdCjCl9RvskAwJrluXd+zb7oQwdepF74mgAlI4sEC/OXQ5yUG8V3CwutYH1rDGuviGw/i08o18tQGykUTjZVfSO4B3dKm2xduXIeIja/ZD4Z5fzGrN77sVQEw3n1lau+EaA1r77zTIa/DAbSGhiTW1yFsi9foMsJiBxFXXxnusQ+uia1Wv+nfB337ZawGrP1yUIffkgOpprKlh1F8wco4xAopLEkAp9+4s2f2D5EwDVh7LjUdcGI5MMQKmeVpFjeHQdIw0szmv9u9BqxuXNFuB5cDI1RLR4iU9fKQRdL1b/r+pAGr7yzWCYwVB0ahSZgwLIsL2fte8xPA2DX6ro5MfIhIqgGr16Wv49vEgS0Ff5PPEXFIKuTQ6M4mnL3vE3uQxO4gaAA0bZVVDVhbcUa794wDu6sNPUt27xElFXJodGcTzt7vPUcTE1ID1sQU5ehlZNzMGnrGwSFqID3Lw3YRDRFENWBtVzD63b44MJZmDczxfivkfsOPOuANkT4NWPuqkjrwxHGAYDPECin8TAAvi3vZ+0HxfMs0t3zRf8o0YPWfxzqFcePAECvkWLBqiICuAWssJEQTOTAOsDIOsUJm85klI3uf9dOLe+Bz1+i7OjJBBBgWpmvA6kWJ6zgmiwPDqo0pF7dEitRDb69Ibnc5RoABk9jOsAasNiv0Tb84MCzh3nN+EoKHRncWPoZGxJ6519eAGrD6yl4dOTmQrX/jxJGRoHskiNhQakOkSQPWhrLQj73jwNjaYQ2xQgr3R12rGiJ9GrB6Vz91TBs4MLZ2WEOskMLCBDCHjZsbirPzOETCNGB1ikHfaQ7E7dchVshsEWRxcxgkDSPNbP673WvA6sYV7aY5MAIcGEXAELZkkXTAfNKANWCG6+RGnAOsjEOskFnuZMnI3mf99PN+yzSHiKQasPpZ4jpu4cCWgj+q/Ekq5NDoziacvR8Vfg2RJg1YoyIEE0zHED/Ie+NqUiGHRnc24ez93nIzUaE0YE1UcY5WZsbWrGG/bByiBrJf0ncUfoggqgFrRyWkPe2FA2Nr1rDfCrnf8KMOeEOkTwPWXmqiDjO5HCDYDLFCCmMTwMviXvZ+UMzfMs0tX/SfMg1Y/eexTmHcODDECjkWrBoioGvAGgsJ0UQOjAOsjEOskNl8ZsnI3mf99PN+yzQB6MPCdA1Y/Szxgxz3mG1Tv66ohlUbUyK2RIrUw5CvoG9YJGrAGnLZT2zyUecjPCzh3jNvE4KHRncWMIdGxJ6519eAGrD6yl4dOTmQrX/jxJGRoHskiNhQakOkSQPWhrLQj73jwNjaYQ2xQgr3R12rGiJ9GrB6Vz91TBs4MLZ2WEOskMLCBDCHjZsbirPzOETCNGB1ikHfaQ7o5WUyMjBEXMpQsf5WA9Z6fugnzYGR4cAoAoYwZ4gaqAaskRFPTchIcICVcYgVMsuDLBnZ+6yfft5vmeYQkVQDVj9LXMctHNhS8EeVP0mFHBrd2YSz96PCryHSpAFrVIRggukY4gd5b1xNKuTQ6M4mnL3fW24mKpQGrIkqztHKzNiaNeyXjUPUQPZL+o7CDxFENWDtqIS0p71wYGzNGvZbIfcbfi/MHmSYIQKyBqxBFrROa/Q5QLAZYoUUBnVpkg4DA7dMc8sX/S9eDVj957FOYdw4MMQKORasGiKga8AaCwnRRA6MA6yMQ6yQks8EMLNkZO8HxYst0wR9w8J0DViDKv2Dls4BXV5my0q+m/LvSSS7SXCXfkHfsEjUgLXLstLed8iBA7q8TE80j2wkw0KGHRbzoL1pwBo0xw9getn6N07ZHwm6R4KIDaU2RJo0YG0oC/3YIw6gSTi2dlhDrJDC/VHXqoZInwasHtVPHc0GDqBJOLZ2WEOskMLFBDCHjZsbSrTzOETCNGB1ikHfaQ6MxvIyCWBmcXMYGDGMNK8nghqwrsch/V5zYEgcGEXAEFZkkXTAvNGANWCG6+RGnAOsjEOskMKdBKmyZGTvB8XBLdMcIpJqwBpU6R/gdLYU/FHlSRfAGCipWYZl7wdKxDaJDZEmDVjblIt+1RsODPGDvLcMJBVyaHRnE87e7y03ExVKA9ZEFedoZWZszRpGi42Dp+Z6IHm9932keCiANUSNso+s1FFv5MDYmjVszMign4dcQYzIiLbtxxsiffYgy4KmOQBnZpcYzckbm7NO127ugyQ0TWs7WrZ7x/DXe5+m0e3aLWw3t52G7eZvt27bpc93KEnDxG9Iace/UqFBFStikff6YILxgWssL6lU0TmlNb0mfuWSdQsRljTjgNEYqFV0CQ3TCCLkIxtst/cSWH7IGNzEJHd+N8p4+oZX0BSHF9Ik6di7uG5DSsd/miBii4/0VfqcxkJ3uEUhUmX+lcGco9jEGc9yjZm04T4ErYPWogcLWJFyHZN5FM6YG3lH5iQM7vpK3g/yJ6aiOy3bvdtvPrrF3c2tGy926q9b2O3ctos3fie5NixD2Shj21JmDvcRSjmpE9vFvqN3nXgi5cTpqADVDEnwr3OktKbXzpv18mXJC/EVMhJD5VBRHdBt7oVu0seDgu1apoKsgxemPK+T6+vQBToM5stF2JwdnwCHdVmMU1r/S5SxwJecTf6YykL6KIrYU3JZHwJPqXvMizwe84CvfB7phlEkLTB6SfOW3rMW82Xdj9xKI0hj2RR9rx0GBlh+6AZuZDzvhdH3+AnG307KoNf51fH1kQOU2oAVCzdNPyqt1oM8v9T9OBpe1IAs1XASW/Z9JHRGfhjlQXcZ0RI3dk09VRITDYlaK/RAWxWnB/p2RSE9g44IPMyt1sOya4cmFVdBj21yygplW5FRqYdByw9riKOZ4tU2weQV8m/gI9AC6FVAfqHuB0XoeV3zjzjRZAR/4DFQ0XNTBT+4Xvy9ej8IwJJM/9IXn658+r4T/6PK5/+nXhGv4xlNDjRBVmMtMCslL66oK3CY6QGt7XimlWl7YcP0obMDJHsQNaPwvUCFubxRiXLAhtW9xxpNQ8NpRqu1RhS5ZrQX+sw18NBwjZzXNCpWaKh23rchiyTPTANN1iLfbkQh0t7G96ZXLLemqkW5ckHVakhzB0ejobyp//bxuvpHoqztKr0dRK+9aA5oDmgOjC8HdoSivcoe4Nd4cHF36nGv0tbxDJYDDwwguQf7kEYv6d4vffulZS/p7zrNB8Z4VY4+yI+OUnNAc0BzQHNAc0BzQHNAc0BzQHNAc0BzQHNAc0BzQHNAc0BzQHNAc0BzQHNAc0BzQHNAc6DXHBioWUOvidfxDZwD3U2fUzKi9CZzvY6EJa+7hcxEom81B2IOXEecNJtGlQOo4Z2y21Td6dB5veF2k+9RzeP16NI8uB6HJu99RqonL3OjkKN2pWrDRPtmB+SheOL/3QTaQby79yKrLjzyCKasPGGp8ryhgqu4HsYMX8yX9VYtTBs2K1dCc2pm3qgGdUsFXlRyzVC1cDYqocrNh5drdrhwEvPOKq+EagkrAxzGuXR7ZHziE3uZvbL7TFwnhJSVcHqn7M5Un+QWl50Gvg41+nU3DmQ43u315LuJkDKbbTFr37Qz/+CDDxoPtJ+Sm40OD8L9gQfiwJw2m4lxY9BBPEfRoqmennfUi5ajVNFWVsWpNepOsVRympWWY+QczCO1bSMMMBsvtI0owPoKlgsIcTDl38b8VhtrBjhBYOQx8T+HSb050F2wlJGX+8hwMQG2gKzmQiPEOwPIZWCmv/jDs0yha2JSbQMoh2lqRgPhmpg12zBNo4H1TOBm4r3RAu9rphk1sKZLC6ubtKzIaWGmr2erwPd9w4c/386ZrVZTeZjx57uO6zUaHiYSmn7BVV4FawZMFY61VHjJUy+uBuoTi5zEuLkgB8H4JA0BeN5DdtRGWRH3xGN6SWUnfW5fkyqKy7Dz1CZpiDcJN4ZIweakO/0k60Ru3cPmUNl2z8a3G3I57IJHTgy1uBgL8iO3G+rwEwmFZ2xVr7iqrHL1upU37cDFOi0u1Jm84Zl5ZYYACZUzjBD3Vi6ITBcLoeSsKMQ93AUwwrxpWE5oRG4URAQVF6kBtAwXS424UGVymBLrYO0qB2s+IS7DxcIALtYKcRC3a2LSPvy7oNHBehoIixSADJyZjzi4YAAXH8DyUSG8quSdLBlkAIjwht7IYU7oBxTKVXIcAgy5TgcXNOAZ39MD1p/iOwTDggNRgJUJWnjvYbGEFoQBIGZ07uPnZhgqD+m1IiP0EAqgl/gBCOK+BV55BEgQiRnIeG+ZDRWEDSTSFFAMuTKBUQc9zQiLGyjTbIWOWY9ajWboWS0sVdBUC6WGKrziq0sq/BIIumfpu5F64o6IHyYuVQCnoR7C1ZQCUkMp2kTVli/SkEnA5JFxdG43xZa+G9Y1Q17/SUDuJb0k0ZFjBjmwuLhoPnB7AiJTxw11CTJfmIIesWxcrATmUbeI6p83lutL5pydM1aqOWNm2rex+lOh5bWKhmkXDL9VQCWERzMfGNBCCCRRVKJ24kdh0TTMAmp+GZUzD47kwjAqobKWIGwO/GI1I8UTKxRFeMYVCIQK7Ygbl1iC9oPV8bDykYImpLjihoVqbzE87uUZV2EzYIbwwUMu8Q8c6ZC4pB7Ei7i1XwrwMLAcUmIxEPEZd1JBYmd5iv2JKyNK1qFL04GLAJpcU694uVWaSXr0SfCLr0k6BMLYCe+AfcRQPANGCIS8ZdahhUXQ0GRBB7kHSAWAYLhFvhFZHsIG8I9igh+CH8NgGUKQ5MOdYT3EXQP4QSuMajjrQOY6UuBZQ/wNJIqrUccyWjXE24iCoIo46liupY7iwHoGYU2VCw3VtEI11YogU9Flrx4tnD0O2K1HLz5bjU693kbz+RhCLUfq2blQ3f8E8rBIEE+zCVJG4wBBHari4hsYjamojAYntqCC8qgeXOxoJOeXTVVxLbVUs1eKhjNTqqHPBEvGWSa0AtNqookD4UNzx0Slx9WwbYgv3gcWBACahAN3zw6gWdiGXQRgFFAG1GAAMqqAz3wR4l/E+mkAFKOIjz/XdcJHF00i0yiAHHmGsBYRUQFCD00HNSZetZEQgQKFBoIbUE4e4xmNnLi2srCBWaxh/FDHi6zJq7Q02sXPGzq2HdocAj0bjtih7dy+yYROAmVeScwgEU4Z11QcqQfxoF6VHCyLlMzULb52XMEXZjwTIX1seKQTucL4mF6aFt2ZHsu8faS3MQCmzuKaoSb1lYaMn9uucTA8bnBJo0uuXTyAyFhTBFkxD5kZUMwHySepxz0KFILHm+Rd4i4MIRCySVxHCgA2AJ5h1iEEDXhew9JTDcTYADNq0DCr+Cg1EAfehVX4AyCaDXyVahCjhrJDXwVW4KHJDEGXJnPLj4KS4/tYBytwbddTJpTpRstXBZxWHv2GdR9VAffNQK1UAcy3BwKKD4KSEdEYQcl1j+3L7rrBd+4BhWJ88ZfeMnXrjXcWjp67ySoulBw1N4f+EyuHxY3yqukVVNDKKS/AfTXXQnPECEMAkELzhlc0VaB94OsmTRtIRQ7y4QKGqK1QU0HTxsih5YL7kCtH5lH40ErYrxJK0weiRfcC/YIe9smwryaVUFYbwgt5InxhTZKH+CmuqWkF2XgVGc3wg7LMQy7xfccJYpu85o3csomRunVu4jh6+iuZaceIRNc5rHto+xrOTZsdSB5lkeFPSk/WR+rW6ys5EvMoLvJYJigYyV2C4OLQSbwtH3RKuQp6heTkmtxTFpg5kYlUHugkQE5PyDvvxRs8GGjyGuwHVFigL4LKxns0e7mEFkERzVzUGzR9BSBbaKk3Q/QZonVfj91DNqmbWGiwhaVVAV4RAI6aJZvSBECcltOIbLcB4EM8RgNNiBqa1E0VNFqqtuzVGheD8OVX/LJ3ecX45S9yKa2BHCkn+57YZz9yy5STt/8LdPq+aWp2tjVzaC6cmp6xC6ViIZfLT1uuO+/Ydg5H5LjounGxyKuFTmDLzCnDgnYTFlWIzl0glpS/lDLKUL5n0IFYnF2P9EWcVfndkGvxkXiTWtG+R4QdAUpih0hQuPCUViE+pcK7iYREO6GY8d2GpBPvHVdqXd08dXxsSkE77IMDSVF3jwEvBSjbbzf7FjmIwST2ldUUN4VDKa7THlmqCRjSrxRypvjxnD6l+NeOMr3ZTFL6RmQ0feDHF2DEDMGJJ9q86PiEpg/AY3NXmrcANCpuATQ4jOb6wMDQD8LQryivuRx59arZarTC5koQVVeLUXOtYYaNzxb+8de+LBEO4If9Hf0+yJ3ItgzX97y3ra2u3L+2thpefPkl9CWglQaOofOU4GS4ObeZL5VWiqVyvVgu+/l8wXALObg7OdvC6bq+67otO+cGtu1ECGRatsn+Ho5QQRQkKSSHJ36Rpci4ywCbKHhKQE7KuANEfIylBjdpYRI24mKNf/mG8dArXcQ1kabkQi+bD0ksjXXz69gl8YSHJNGtPGr3HnOgU7pdIpaXGdHY0kuCAHzfNcKMY1LU8UU+dHIb//BXpCzTRI4REG8Ec/BaJFNihLBIOEkW4x90pIynR/vjx08rgMjn4ESAVY3RwPU9E6DkREELgzN+Pgr9pvKb6LVrWsprWGGjlo9atSkjaJVV6JlRGCIcftHvwfDoXHVbfoAh2ejP0uQGcR0EYEk+Clhses3zkW0wOcB4dOQnugded8CDzbwjDAAO80euLAOUkpcr5Cr5YrFaKJVbhWIBK+UXLDefKzluzgTYYfXlfN3N5+EvH1i2azhAOcuyChimz1mWSYALTRsLZKOgUfo8qK2hGwpXJiKFjZRJDx5ZODHI0YcMk8E1PvAewdMnfdUc2BkHKEAQmwwKxiJFzTpWgGLZxJccHmMBI0axIYGD9mqw/pBmBUANYwPsK8WJioWBg6hO4MEZKI/YBPMVv5mP/JYDu7hG5LVWVdCEcQhaiF7dipq1EsBpCloU+3API7nDQp0km6Yt6eIHgzxSV+JqCV0BVIESEJH6GMR1YIDF5aY7CMWyEACI8whOoDxiDm2Z68gJPP9QdWX10No1LnCdARaUHxjYJGi5rjQpMZCXw70bQRNTaF4GALd6vpBv5IpFD8AW2o7jQGPLQbMroylqOrlc03Ud33bcECCHwT5AHEwBQBVNA0AbTqJYcoYoJ4y/C6AxLyQ/kS/JAQUwmyVmbr3LlhnVL8aZAwQWEef1mYByAvFAjccvWhSxsIjA0DNtPSQQRzKBNOxUD4AFwKfQt6ANwT4OH3iYX4S+V8N9EyPRIQDJjpr1vAobhcjDXhdoyUUc6PRxwlKDShXv4WbDlGUGiIiV9VM5JTWxTEY01eO9/G7+kSzF0k/xJ9WsBRJ8s+/+ugwMsKaRD6yr385mkltednjAa+I7VW3SwFCReOTQ7M7VvaqqV9cSXElADUVmmlbesnlgqNByIjZDLahgsJE0gV2eW8jXC6VSA8AWuDk2Q10X/g1ob0ahADArFBsFgJ3r5ACA2LzJdfOIo4R0MeoogJb0p6EoUZzy7RFwI2l4xm9KL13Ej9zAHYCXBTiR4+SdvgyPAyw+Hu3eBXlo/6wrz9grQABfZZOIxEJMAIklTwnB9w3/BnbGgpkDbGIBKiGaYCZsv/JR0CjEQANNKPDq2HMngDaEdkXDCVuNkhE0CwAsNN9ocRHkoNjABM1HUy2wcVIGIZQYdCJV8i8AKGCIQS2RvyQ7zMCuDkRHEZaL/CShEV/2cVdx7tXzwACrrWElXNsr866XUan8hACwssNNilGUA4jkvBa0ZX7EWIT453A19CN2pdFIEg/QqxA4bgGil82yAyfnRGhqhgCzEAMEkZN3OTAQAugigFsdzdQawKyZLxTgN29AU+No5hRanAUIrzQnIUxIjV83oSpOBA4iVkJCTA/pEpxLa8u6DMc5iqNY90I/7JUDwnYUAFmLeznwwEeUWfLMftD4iIuFZYmOHPnq8Fbe4qsToiMphG1XuIYmGswUADoetByv5qhmoxQFdQANjGli7Qid2l6E5hnG6JpQ16WDG9q8GAfz+y7xipzCVgdJEAVJl5PIEDwk9NF6h96TUx4oWMiW3E/Qz8AAq61h9Zl5KLQuhSQCxRcodxS3oERc+lLUlAMaXsoBv/AFacQFchQEdqvVmK6urmL/JIpofLIbAcMnGMS0GnbOMQFkJpuhOTenHIxwomlpANCCfKlQy+eL0N4KLTdfBNA5aI26Bcu2SmiumrZjewC/AI5oimIAAh1uMLYQq3NQmEghZY8ExQBLGoQWoZcgSJq6ZDvOUJsj2/hIfU7oFfwSseCVRwxIAgBtUBKhAItxRdHCpwfQ8WFag45M/qNpFngOpjCh/RY0kqZZCyNp6A9qsKM6DyPQEkAI+3qhQxsd1eg3gnkqgMhrWfAHQAvQzRCV8RErs1UYo2ScrjQJhUwppZgq3MaYA9GU+5h6yQXJTABJQsSvOr/Ju47DZNwNDLBGgV0oaCnb9NqmSSSg/dS+Sb9kEG8UP4JmJIO3STwYoYzyXhMGzY06LAABHgAzyjnFHICWQ9MSwASjDtuO2ATFUAAGA2yAmuNBK6vli4UWBgowRy5nArzw1hYwg3sjl8834MdH05RgZ6Fpm8OYagHiChs2EkHicfIf97GBI926H+KdnrOZoddM3jaG3ObVRq8j9Rx3FYF6QX6yKM4JepPIJnRQUwvi6Bm2Ow0AKq1GDtoO+oQALoHfQN9RHaDDpht6lho55aPZFnjUklw06YBlmDKFNpr0LwVslgU2Ct4BIOVEO5N0mSYwDrbLISYhkP8cd+owKr6Feypu8jLjoXvRxBLZieaA3B0owNprmUJ4IHX4zUhR5pbRxl4goCKo+CDG30QZZ+C0nHyAURsfs3cpsDGwcHAFDUfTZPMRfWwmdCQ0IqllAZU4G8dxbYWmqOJggoW+tJzjKhvzPSxcC4V8tVAuV8pT0/XSVNmPNTwXKps1CyrKiJzN4IRmamAkM06bt/jcZ7PDF+ufxff6nzSOda7Eg3UOWz9Iulu/3vJNuyYnPpKsIN048fRKSvhO6ISxI1BoFcBThYYTYFQMswPXckazVo78RhEghXnfBCbAB4f4Me9a7I4CzJsOffYJWeARZjHELT98e2Q0DrFj/A4UGUYOUyiSzCNd6EScGcXtmTmUx/E7+G3nCWWewCYJ3MyyLA+z9+0I9I1wYGCA1e7DYml0ynEiigHZ6chYl1qNl+KFFY8nkSlpfxJUpIOEnfSEDFjJwIkAgyBVVYZ/duy3D0aE4JFpm5gXbZetRHND0xKNSTQqLTsPLc1HE3StVJ6qFKemYAJSigoFtEJdpwRtb44dcxhugC2bJbZwQEh2kLCPBH156BDJtC+FjiR11jiSxbqIy7pjvT9U9bSCCmdi9iCzcqwPi3fxfzu+TH2m0Q8GY2EII8CBR9rFhKHN5joQp4rm1wqaX82oiTnOHqZoNaol1axhqL7FkbUSmnLsqIbqCQPuwMecTGhHEQGJMx04JWvTkVDMzkzO24yJi+Em1pBIP0uLRbkudMI3iSCTCfoRt3We9cNeODAwwGoTt76I286TfIMsZ+QVT/F/O8t4mfRA4Q5oFHf8J68z4EGXJCK2RBwPdjYezGoIFukpXS5UB0yL4ISRTotmGjD7wKxJtkPZFM05HCBYKxaLNPMIcoWCkcOoKPrWymi7YuZBroWmaAt9cgFMPmAaArNfzNPkIAJADdPXqA22aZE7AaiEOAIeK3inqNlJLdnmJT6YL0APPLWQF2QCPdCBLyNfoUdjxmYOo2BB5PsApWYd2o/PDmq0u93Qq5UND1O5aD8Uj5KhJ5smAGzssVmG5hlslaHtOu1mIRITmkAJ+4tiRhKCNx50igGZWUiNjMDi9TlisA2gtDEm/dx7DgwesGJ56H1OxjhG1KENFQcuUsW3yRSqDwKhynDAMfaXsJYvOCZJDSJHw2YPI+iYYyugJjaHfG+aqMxxUxQRAI+oY0H3QtPUdnMhRj996VfDaCj62jBpyjExXAB3Mf9YK5YxKlosYeYB+t1g0cZ+N0SLCeOkJiFIKn6EthdHzfyGgA6G6tEf5KpGrYSmWR6gxL5tHxbVnMsLby0boARNCKvDQBvCjHKqNVMkHqAECAHQYQYwIEVMK9F8Rl8esowkBZAAzugoFPax5xzuCSfjS+y0DV9T7/BCkEp9tm9SB30dCgcGD1iJ+FAAktuhZHwSEmXlEy4mjGzzEze8j1+yMscnHTJ9a2iK0iOqPpqjHo0O5RG1tFotA9IAQNJ6lR+JA4ggvWuOXcQIJ+3UIowcYBlAAB0bnBjthC3bysKhmUtnp40ZM6jOUVvCqi0FoJIN8JSmGdRDk+vwSSc1ls4AsVz4j8njl3ZGcgOoIeG0taRTmgciUIxCaOiRNv7GQeJwjCgJAYcM6PB1Ern41D/jx4GBAdZGs4asiI0f28aDYvA4Uz/X12u8aBeBgBFBQLQjyRsepNWXPMAz+57xB4UIi5j4ThOrozCGdiTwycTQ3JqZLdjLp14zdcjBSmKiGNG4Vt5nyKFDesSIFBMLjTGOE37x362vCHFuCUiMcotU0tT0dYw5MDDAGmMeTSTpAIXN9TrWcbrmN8GUzLsYULKR0HgIdpGwvA4dRAXTDc6vBbhkPWViyN6mfUWpW6xDJURqLSlly4G/asA68CLQOwZQMwI4cRZvbAdJVIyR57qQdV0PvSNTxzTGHEhHmvueBZo16GPyOZAoaW38YX/S5Oda53BQHBgYYLUzlIivluI2RybxJu6GQs4SDWsS86jzNAQODAyw4tmcyGEiym2JHkKmdZKaA5oD48mBgQFWu0moNazxlJTdUd1WoHWTcHeM076358DAAKtNhtaw2qyY4Ju2Aq2bhBNcykPI2sAAq90kHEImdZKaA5oDk8GBgQFWu0mY8K3dZpgMPupcbMEB3STcgjGT4NzWoweXmYEB1sYsDSGvG0nQzwPggG4SDoDJA0+Ccx6SEWCuLjLAY2CA5fiYuCrL73N6WPtgvtOz7ahvxpsDiS3WeGdCU9/mQKJcxPVUDIG5DpHUYi5HlKnO7SB9uxkYYDVsLA+iosuYk4ZJaIAu4BamruEU/GKmOTsjXhSqbfxAn/oYJw5QjjERGosWytYNMhF5nOjXtIID8ewEApTUSWrJrKdYgg1br8d1Fmu00tsSKqzsLTMovg1iao4A9CtPFOonzzc/b1rG95DRm7F00V3ApVuhXB4CSGNjLcx6JYfgm+vX4pAf3vAgosFhoGguCeufHXOAxcbvkFvMLWC9UwuTlHccVnscKgfWFRQrGUAKSw4RnLheIvbKwIl6WcOr5/AVegKV8TtYFu37WAvo7wZJ+cABYHFRmWcePzvdstxjZhAew4YgN+Nb/DYsevlWMOEEOIc10pVLRsUtZQAVHBOO8sJTeDpIRum0dsIBCDWQ6sThWfWOG7ChoxXv5jBwIdsJqQfZT6Zq8QsjOxagkDhLPS0rX7Z4VlgxUa3C7ftYyfDLWJvob7Ek0PNY73ap4JeWjMUvNQbNxpS+Qae7Lr2H77/DXVUrZb9ZOm+ZwZuwOttbwb5bsG7lAgjETtAGlgqWJqTAFTUwLH4iihjc6Tawpu06wvXDBg7wK2yq40dm1TtTwEKjQspog0/9OHAOpB97Jsxlzdgtg/KKWzSoUh7q2xVMW1+C06sotW8C176MtWW/kw+KS+r2w3XjE48MuIt9M48GDlhghqSZJEwmbjoeuhtLk5y57QSWu70da+beCibehv76C2hinEE4bKetymxPsyJgzxIiF37ZABGnBMPaH4tN8WuHfnEg1rCOQ8N6J0rKxZeH5aMBq1/83iLerAYVt0jo0XKxRiuBCltycNdy7LoRrWBpsRdRa36I2vO0MsPvGL71RDFsPqMWH19B9dpUP9P6m6bczU/6rh9XpDf0Qxb8fnBRGQ8sUnHazKTf/NjZ2VJgnwRjT0B/vQnfhtcBpu5ATTgN6hdQEAUWBPcagCorXw3Gs4Hbo5DXoTO7vwRkACvVsDZKeH8JOJCxU85TeU+EXL4R2GCJq8EKTxrYQBgfj6vweBHtk6fM0Pg2+qC+5UXm844KXyocDl81/svHsOvr+iNCF464PMBhlM11c73v/j+NYiWOdyxA3lkIG1mwCHX2wr0XytimYCZQ1lnTCu8GK98Cf+fh+wjOY+jE55K78mUnalH3kgtuESfzPIr5JsljfnQBLK1h9atMWTfS+oGxLFSMBFHoyI83jiuQ9FdRAV7G0xOoBo+6kfWtltW8XG7NVLbqg4I/qR+jAFDMRPYYh4qb0pgWTpb+9j21sKnQuQsfgTdiy5jbccU3PjoHbDoC/hfxoUErst2EZFyoSm3wStNox6dv9sKBLoAFTmvm7oWXXcOA37+IXQAAMYxJREFUm/wES+e4SQ2KINX0aQ2ksMuIwoSS6Hl8ln+E5x9iwdfHW6HxjZlf/9pTXWNLHCXC5B5lhcfRPcZVllK6uzL3oX94t2O/unY+svxzsCC5BdB0CxTbCwh0A4rjOJqP00Qv7A3FLxElgOAVy0HydZEncdQ/O+dAF8DSGtbO2Zf4pFCLdhNLN39xciFXw8yziQdBrra4QaO6hBcvYZvKZ4zQfAr3T+LtUwXfetZY/MqlbgnDT1p3eIPH8TraxI8X2Zuo3ZiPdQXxmfvvmFfNxrwyozMqtF4Dz7eitC7wBG6dLUAIfISQ/i+o0mlgFijuN8a9KXHtkHIgA1hpp7tmYMqc614pdwlQ4RI38USLsimJStWaQQ3XH2A0D+AUPQX96gkjCL9nmM6lK0V19fSvPCpG2WlCG1kfx5K+Hc/rpFbGLfvBWIi/e8/ZXDRjHQ4N62ZIAgAsuhk9ijdh98/bUIzH8GwBpnAZw0/QUOUwA1hpp7vWsHZcItwviEgVoqeVI99QqGqQwh9iDPwJiCIASj0Ja87vFI3Ws6oxVUUfFGaPdA4BKPzwE4t/3k3cgXxN9pEW4oMPLhoPPPAAt3DpWpD//J3F4wVz5oLjGBecnHM7Ngh9AzZJvgU7wMxjI9JcGKBnDNatNJzgqY9uHMgAVqphacDqxqjYjfq7WOTgYtsBJr7UMd/jInbA/mbgNx5Trdb3jbD19OWXn3n63O+ij2rDgeCGglyL8wOL0pkxqUCVZn1iap4AE3OVwhFytsPCM6799b+ZnZlfmFK54rS69OKpq68u3daoV2+vVtbuWltdvRHX2erqqrW6sqLwjB3Tm7BiNWEaFgNYykx9zQCW1rA2iwMBigJKkKK1gJtXRm5KGYUppXLlllEoL5lO+Rnl5B9XhanvOlOHnoZdwmW1Vq1UvKXVqff82tWdyLTUhUw9ICE7CUd/o34gH6N/rCsAkAsFJy2OXREfPbzoNmfnzmC/vNOGFZ6E0n0an6WTiG0eitc8xlqOoEMe91YeYGRgdkLO9/yC73l2o1431lZWVQWgVbl2TV1dWlKXL15UcKcwxFpXqn3xuivKJsVzF8CSwpuU/O0iHwJO9A8GiCaFXicTPQ35KWVOLShVnANYlfGMM1fCxD0nxDbaHrbW5mhfYEC1R6uwAUFawvMSmolXIVYArOgl2E+9gM2zXwpg9Jm7evlHxicWYQS6+0M0tDQYBBb/e6pXaRSDuI5UvRLZbhc0s8/m1/WZiHE+Uz36m7lrTSM3Gxi5popK2Dz9SGSaN6A3/Ty2Zz+DeVAnIAILaM5Nw/80rvisRVPYZd1ehy5IUA7QEcsZrm03voFxquepeq2uatU1gNeKWk7Ai2Dmt1rKw/sQ27/zSJuP6VUcJ/anC2AdlCZhW25Z5yFDACdlYcNrO6eM0iwmly3AuAbXXFEZThHuLmQjHvET/5ArPMl0GQq9nJSTdry8x8BQEPh4V4FzBclUjChawfDhZYwVvYxQz4Wm8SwmGLxgB86lasOv+tFqc2Y+11BvW20axmIslIx3iwPxIposbu2sDm4RXc+dQdzAD/A4YciDDxrqAaT/IMpncQfMXFw01Y8dn1J2bQ6hZn3Lmgl9dQi9UifQTwlzBXUMX6Ib8O4YeA5QUiXcl23Lyqk8hIeCIHN5UG64ol+KnZvwwoN9W/hPAVIKjvKCmJODwemB4ANAlGZhhDhazYZoWtTArl29gvOqWr26rKpra6pereI9ILSdDsmI4xB6GGXmHR/H9+gCWMLS8c3RespTUaCo4JSKnbhRONyCUk4h1pwITiVoUdCoDLgbDmyZCWA8QkzJk2Zh/CjxMEo8QjZ42SCHTCOWQ9pdYSIg4sKJLgm50ki06RHMOFl5DV6qqAcVdN2/Arl7AR/uVzGa+Apk9kUobldtw1pB4GvKN5fV37wCA9Id1r0HEPuDONEXjF8SuxHdxLmfPwm3+5nE7uOOHn7YUuVXS6rgH/FV7hhg5SRYcxx2ckeCIDyMojsMc4QFcA2To9GEU6qAgnHxeXIATpiPgK8bWQoth4ASxNoOJ27SlZCEUpcnBMUjQUnu4LaDow0+FFoKEPuzAGB0D3xf+TgJVGvXVtVaZVWtXltWy5cvq5Ury6per0FeA8irGPtRQNvnDpIecS9dAGtSNCyWNU+KEMoMXysBIGnWFWfQxANAEZzYxHPRxIMGpUys3kRQkbBghIRPipBx7PBgqnGymY8qohNJljeUXixDxj7VFMjo4geQRUwcNCKo/MpD/ahBRtGsNC4jxJUoiC5hBb6lwAhhz2W8Ail+KfD8izkjf0m9Zw7A94mhT3ZGLtYdO+faumD7ewDTTPXFf+VctJr20SBnqZw556voRjS+boB6ewbwcR5q7Qks9jcN4SijbGZQsacBLfiEKc5CkIUOWdlFeOAIv6ItIW6WL81BCQUsVPmBD1z7c8RJxnFTzU8XYeQ6QpyXHTcha2hG1tQamo2XX72oLr38skJXqoBbkABYSl0KYvLMPGYFPfU0ktcMYJ1JJj+zfo8krdchqs1zihNFCMBD8GETD+BkTmMRkdI8NCdoT+w8h7s0AwWI0jJD2DQecb9Omvt6nYCZ9GSQZpCcHNTK2nUF9FBeuXoMb+ENiBbV4WMFD9DKojXEtBoa0SuoQc+iHfEj1Jzn7NB+Vvkry7Bj9FWQ89W9v+QhTsLmQI+BydJDd9/tHH5D4dzr7n79LSfO33gzTAc4ifm8HwXnDJgOgFkuGMAFBR0wGB8LCIfws1Pm5K+Uf8Jp8UDH2Gucl7iCDyxfG0trPXilJPGKkxeAGLshfN9Dk7Gqrl66BPB6RZqS7MBvom/MQz8Y+8AkLuSVI5IUOJ4iisKEjSmPwnMXwIJIs0hG80gJA1fJU54pseyDYjOOAMVO8TLsjgFSRmEGWgy1J7wXGUXOpFCYw+QmLZ80rmFlns3LNi0gLtbKmGnJeCxTfIj5EJMb3xPQ8MFFU0Chz0x56MfBLB9jGbL4I7g+a0T+k8bVl58KnnviB+6TLz9jfHrzxOl+ZJsA0e+DHIjc01dK9erMf/Xk9773yWurq7ljp05G0/NzM/l8wbGKVJxQ2C0PlTnuV0KzqS0GmwlsN+OE56mciL+0gDYHGogLCcoeJIdaFo/0nWXb6HN1Vb5YUvMLC+rcLbeoBrSv1eVltYK+rxX2ga1cgza2KloZNTQ2Mwlg0vxMAIxxZgGSzyNzbFN6w6MRZSPSCApYJlIfWS7UnlAVbPQxceSOAJWHcs8+qAKubOax/0nKNinfuGAZEc71Zd4GveFlNE450/8KMgWXpFjwA1mE6KR41rWwpNFrYlRKOU6O2TRarfmg2TgbNVdfH6ygFbnyKiaHrPy+e67wPyDBZYk2Zkjfcj4IwBLi615o+PXakdbzz5146fnnm1Mz0/X5hcMrR04crx87fWpqZm7edPP5PCqzG3rQOgNOlUoZS/5meQDur3vOvhut+5jODrFtAIv71SRjFvq/StPTqjQ1pY7fcAPsvFoyAllDp30Fdl9Xl9j/dUVswEQLazSkryztO4u10dHKd5uaTtbbTkO5EcZDYUg/HgQgjNYZLk6CEvugeBKs4EbtqjOKB4pZpyWO+OMjecgC2FAytftEpTjkZ30XCbOG7BDBYi/8KGIAHfNtPVWr18PGahSuXKxElUv5sHrVMRqVHGYM5dFgOFKBwcbuKdlbiIEBVkweusDjpnMOo2guNAr/hWefnSoUS42jp09eOXX2/PTckUNOeWradRwnnzCRJimUF4oMj1GpAjE1u/zdCGDMVbwarYCzxObkXDWTm1cz8/MY9kRvKTQsNhNrSRNy6dVX0ZF/TbQy9ovxXVbTIrqnZ9Z9l6T2xjtLbWAlliZEaWHC7C9IkjfQhMNonclmHkGJ/VC0hyoApNj/ROsWalmMgoHkh/Gk97ziZVyAfJiUQ3KIQSyOHkHtirMVBV7Tr680o+o1P1x+aSVceWVOeY3DKvAITjZVBp8IZxjBVB5rYQ/oGChgCQyjJoE5EATpj3FCDPGuVVZya9+5NvPkt75dK03PLJ27+cbCsVOn6rA+N0tT5TwqsEV7KQIXhm5ZGcmgVDoHxKo+JcM6kMmKlDzy2a4YEAo3l5OzDC3s6MkTWH4Vo9jQsq5B67py8ZJaxhWW+OBjRUYnCXAcrWQ/WLYJKXGnEtmn7GyKtu+llCSQaeKxf0nAByN1JsBJmnkcwWM/VPmQmB1IH5RoW+BKzBiQnt5vzEXfM7ExwUE8izYlayUDzCErfuQ1sQ5pvalq17ywcikIL/+orhqVedMwz1FGRfdiQ5G3YBU/igNTrRKODBSw2qWwTi5ibQCGnbBGsIqtevXMd/72m/6T335i5dDRI9GhI4dXjp06bc8dXnCheZkAryLVVlZKHBQ18G1yBEpysiE/omHCDab3FBY5HPSBHTl5UgHYRQMTwFqtqJXlqziXxaCV04jqtapqojPfwy5rJioy5keKoDGSGLvIwj4eUkK9jD9T1gCcCIZ4PMSMwCkpbNmDbUxoXoBmHpt6mPYi5gbUrMhXATYQlYTrJWUjHxcLPO6IN2zbNgLATeh7tai1GqCZF0Qrr0KjumpHa1egGTRm0FVxOITWmWkEx1lENHGxxr+DzPdwAGubHLJv0HZsaFPBoVdfeCG6+OKL9R899XQ0Mz9bO3zsRHTkxIk6+r1UcXoKPaKGGaKjPrYqF+bFRbJN/GP5imBFwpO6yoaOKAeodDSUIWBPzc2pmUOH0Ad2WrQvamBsQl67gv6vBMA4pUiako06THJi2zFqYH0B/BRX0msvGM/SZUc5DS9BP/uaTICSAJSAE0bweJXRPViSczRPtCaGYyc7ZYRHL4mKYxzVX3YJpOXL0WbLdgwOZ3nN2tWwshSGq5eiqLKEDbxWy0ar4oBPBTRmzAhAteWwF9mXsnLAGR85wErzT36gA568LtbR+Vxbq+RffeHlKJdzK4eOH/eOnji5fOTEMe/QkSMz0DZcaA9sacJComO9nhZUGuekXAW+pM51Kh6NUXkyz7l8XuULBTUNEDsKcGfHYQsARrCiJf7q8jXRwHhfB6jRDox8o3CLzQ4Ee99HKtC8dsjcebQCLgjMfwI2aeJ0FmhPJk0LUg2KRpvsk6KZgTRXSDsD8cyuvkIi9kLIzkkeMZ9gADAbAzoC1ewoxcRYb+XSSlBZsqLViwGAyor85ixAil1Y+IZhgRv0nxOotuUUYx7SMbKAlfKDckdGgoGQSHwZWs25F59+Wj335JOV6ZnZ8PCJ442jJ08u41ouz8xYxWKRHfZOyD4cBE47nScVvFI+ZfMXa5yJ0KGyU2iLGIGcmplRJ8+fVyGa0zRaJXCJKQUs8WlKQTOKdBSSZhQpeGXjTtO77nVbid8itIAMB1hQfWgpToCiYSZAiZpTrE0lTT1qUTwAtKI9pZ98aGByi3xfp9pJ8Mn56aAIRzcx88LAh8gP0CcVNdbCcO1yBaN8eVW5ZKr6KpcEPARtSzR0AXqyMgGqvRTdoPg48oC1mRFGRBsmB62gZr029ez3v++99NyPrPLMrJo7dKhy/ORJ99DxY2p2Yd7J5fJT7P+hbRcPKVJBwLhIRrlgNud75y5ZgEnzHCUaGDq8pB7ThGJqdlYdP3OD9HGxn4ud9imIcSI3NTKCWBNzJckrMZ+IPx5bEJPhaFp/Mk6bArEsWCoEHWpInHOX7X+Se051ScwMZC4e/QOU/MwCBQJOaexIcLs0U28TdwXIs5lMjcpr1YLatVq4umQFKxe9qHbVjRqVsuE3cpaFIVGYVXEqCK1CcbS51b4ZYd6MHWCBxRijoObEloKMoDkwlnCWly6FK5cv519+7rmgND1Vnz98uHXk+Innz1y4UMTzAgOkzZ5U64qvLOgRLqF9kiZZ65JBNgN58uAopDQhYUYBbVWmErEPjGC1tgrgAnjJihSYUkTbMIo5eZ+ejCMLknzuVAN5Ai5J5cADrrxnAQKARHPiSgZY0aBttMkmHsGJZgZsCop/gFogAy1x3F3ylKQ04RfhfpLHRHYJVDiDVu1auPTiCow6y2rtskFbqchvldnkw4CWFaJPj5ZoopFSjd3rwZBpce41jj2GGzvAyuRTbBvIf/APCzY6lGyXfTWobIWrly77P/rBk+4PHv/7aP7okZdOnTtnHjp2dKZQLKJrzME0IEwJZdlJZQD3J8lUIsOkrW6zACP9ftRycNBdzCjQD0YNjPzlVKKGLKeDCd0AL5pTLAG8VjEi2cKgB5fUkQndCC/zpISnfABfpZ2BEoKdE1crMGwYZMK8wKB5AfuiqD1Rs2ITMAtCUiHwg7Tl4Lvs+9j1QPxSRokRcf7jD4WwGMZSUQt75lSvVqLlF5rR6pXZqLEyB55xMQAwG0HYL6XQgU5Jl/m1+wCqlNusLun9gK/jDFhtVgn/WII4kv4u3nKkcerSq6+oSxdfdZ57+ploanZm7eQNNwRHT50oTM8dMsrTUyV01ts0JgF6SYc9hCIu2ANUObLgxS9n25BVJB44Axax/2saGpiCBtYCQLGvS/rBMJVo+fIVjETSFqyiqlUsQ07esYkHzc2gqUEetlBcsI7GmmjmCUChWSIalNQ8gGV7FC8uRxagVIsDVA5xnpNf8kU+otgtR0Cn7R6ETdiq1FeiYPVSI7z6Umg0VqeiVq0MwS06DsCJPEv4FvdLCU97x0lEL+StI3gwDxMBWFuzyoigLbD+FDz0wyy9XHOXly6HT3/vew1YkWOk8UTl6MlT9YWjR2bdfI7TgqSoY3N8FDJKJS3qYX1Rts5bn95Q1jd8P9samPR/xZ34UzBi5Xn42DExUm1g2Rw2Idl8NNB0s+ddZRXLMNyM+6Di5VaSkbwUpLr2Qx0YTm8uwDYKxFoUkEpM79iGwzrvrah2bTm89rKL0T0jqi6bhteYQTOZhnWO5aADHcLKGaeIuM3E9s3m1PbuIpVi78H3E3KiAQt8lf4uoA7WMLM4ciLW8rVKxalX16JLL73sPf3E96zZudn60dOnLp656cJcGZMc4Q/+TQtfLCl5XnnyWKeN7IfzYxS2nef0q43mY3skEm4cBJnCWZ6eEWNWzl6gnZdouxIG1Yb845kabMqnoS/VaYw4S5ZAxpLuCPZDJTP5ILLgMBYAMFr1WrD84pVo+aW8ql8rQrtywUOopxBNBGQDgVoU5vzx60qG9p+pTCGuDgPn9UQDVspN8BYsxi+KlJWPmhTKF03AIFddxbSg1ZXw5RdemP3uY49V548cff7szTcXFo4czqMPBxZeOZcmXojAjNe3Yq2To/+CkWZgxK5tAANdUk+Sznu680QfoWBTzHM295IMkIs89UEOCFcgWUAd0aSIOLL+dtioNNHk84Irz2EO38U5w2/eIIzm9nOCU7IhGMWZf4wHH+YBAFVabml5ps8DvB4IwMrws91RTzdWLlYg/LLDnh3LUzCRKL/64gutQqm8fOrsGR8jjdVDhxes8uxMwUWrEVNbHA7De1jNEUcsLHEcfD5wh/AwybXIMetPzJXElTw+cGzpmuFUm+LHEoN2BCrqUT6mx6Bfaq2pqte8YG3JjK6+WFONNRh0BnOctgdtFVtmdjBJ+CxMRjKDBKquuRqs40EDrC25C9jCpiW0p6PmFeUxN+/4k9/+dvDs93+wNgOL8fkjh6+dPHtWYX7jdKk8BVMW7CZAv1gK5yAZqG7JQLwQXOJHQB9tDghI8YkfNTT58MHDRxNAFXh1TDMIg7WrNTT3PMzhK0b1ZQtzZrgPAfYsgH92tqONiNU/Y6xrxzrkGxZxjJoDJ0QDVsJy8F/6u1AWbDZSS6eybWHxvBlu53Xl0qXic08948Omq3LyzA3Nk2fOBDOH5iMsjVNAfxeMhniw50FKkhLGaGJn/XsQOQBBgCZFLYqiRQ5g15Og0ajCiBNrS72yFiy/FKlaZTbyGpCf0BGBAailByNgHPgdLUmSzKRUDvaqAWsDv1EWgjLSM4B3BJ0EeBzsjuO0LtULV7Ae1be+/vVlrJaweursOe/w0aNqZuFQAeCFads28Muwkvl50mfGaDYkox8nkAOxGiS9DtLkw6gdLGuwFnbQDKLqSgOrICgCVXTtJXScB8cxriOjgOwhFfu1jTwZ1eYepXlIoKUBa6OQbPMswAXh4lcTx9zll1+Zu/jCizUse1M7fOJYc+HY8bWFo0fdmUNzJtxyTj6Xi+LVU+UbqbWubZg73q+k+kIusAyXY2DNNmy41aiGjRVs6XAFU2QuuZgmY2BtKc7QP027qvayLaj8Q6r7e+f4EAnWgLX3YpM+Bsc0i81GrfjDJ5/yX/rRj5rF8nSIPq/KiXM3eEeOnahgNQnHLuRn2FGPLZRksIdfYh6J5rYPCnTQYXBANCkmnDTUpAMd5gVYo60WrF6uRWuX7eDqS/Wwtlw0mtUy+qVc2zLdEFtwyZjEECt8T/ilNayesHEokVD22GFvw8QY5n02pqtEq9euFl9+/vmgVC5dO3zyBEYaj188fuoURhpnZ2Aigf3juHkcei0AYkkzYii060R3x4G4rDCkzM5waeWjxNFp6ddW17BcSx3LtjjR6qVA1Ssl2EpNoUEIlSveJ9OHoMRD1LtLcyR9DxFwB6phcbZap0txJItiT0RRFvnpZDlyWQ98gGB0Glqw8TpyFRuoPvWt71xdOH40RJORm26Eh44ew0rQ0xFXT4VEm7KccdppRgoQAz9i+hgRDrBs2BUQry0Fa4OgBjOEEGYITTT3/HDtkqNWL1mY2jfjYPVJruRJMwTsVhc390RARiQvPSSD8h7PQO1hpNeJaqCAldLCjE7y0c6fYUZYTI9r2M9fvbTECcP15556ysfCeq3Dx481YOPVmj96GE3I+Sn01ucCTH1Jm4uCXwlqafAarrTIulFQpYJG7Vq0dlVF1ct+sPKqoWorBaNVhdV5VIKxrBFgNoVMjRnVzvI+sHHQCshAAQvWb7aMiCTaCPjHuj2x9RGZE82Lo0UmbLxg5YU5jU118aWXfGweUfzhD37Qmp6Z8Q6fOLF66szZBkYdZzCncZpreMnUlw6fdNOxD5VtqyjZt0jMgbaMRUv9pr+ydClYfoEd5w6mx5iwPJ/BEhU0UndQrljRFXP4aIwXy/IkyzMVTWlK4COsHPRsYK0IVzXiLfm24mcv3QcBWKJwLBSxs1lLfRNV8ccgDGeQYZjDSVbi3wkGLhFkgg/+WRmwIKoNTcquV2s5nOrSK682n/7u9/LQvNDfdfSHN9x008zs3FwZxqloMJpYqxDITkmROGJ26Q77/VWDWPYgieCrHHIlj7GeTeCFUbPebF194Up07eUS7KZmVLPq4EOCdXAgqPDLPftYHjKHb8KBKuE0pznSSoz2rwDpqNr0g8ehhDyivGqFfvA+rctJkN5fktLqfcTdYvw/P3TnXN2qvQXfrp9EM/99SPwsCz/+OElzmPQMlKZudA7MjZUEQs8MU6tq+V6IuT+1Mvq35g4trGFDCQeW9fbswgIGGguwgAa3JEi8GCEeUGeIgQeHZfstG4IMuSU8A99Yw+TbGbYasJWqB7XlSHaPqVwuwQwB6lPLQd+VCxNQmWQci6coGQdFUNlNhW4N4BRGDdBaqIKHfw8u/l4YOn/0WOA88xOLX8ounr/fIto2/FAkXYDLqf04BOXD4MX7xDYFwgO1msSmKD0U2rblVp9eIqPIM365cCTuuIUZ5KOFVRAibGe/duT4MewWdCw6fPwEl4GewVIibFrjO8fF9SBPqIRtpmnwWl9KwhiyNxanGKg4yocFuGB5HjVra2jqNaLVJTT5XvGN1lop8j3uHoNFOrF7DMqFHE7+D4ZMJs0+MBKW+hhsQK69MGzi2/gNMOI/KC/6s5IqfccYIFClhTrQAkjEBpf4eOhnbl5wav7rYOX7cxConwQxU5Qr1L9EQsTfQGlMaRvita0yxat4RiGwKUIzslEsl8PZIwtr5y/cxI03jriFPNbopokEPJBpOOKt2Kl5EfOGmIvhJw1MilnJ5jQP0aQwxIdWH7a1urYULj3TCitX5o1G1YyCVg7Df1gNgVYL8XQaclP4KKEPzA8FySBIEeQB6VAjjCfBit/G7R9OBeXnAFQNcoO84XcW/+06Tfd+HnFJ9jOFLnEjd4JL6avfuvdCrlSI3o5v3n9uROaPgwOnYRxgyaRijJySJwyT+j8IVwqB8AmcYq1JT7gHmKQd5Ar5a2gy1s9cQH/XoUN2oYRpQfjjdA+EwI4p1OTbgnQgeMdaQ77hH31/6DDnHVQlzI/B8hpN7mKMOXwvr4aXn8fW2dVDMEPAHD5ZsiWpeFQtEMOoTTYejMCTfZjFEX/n0ItXAe++hdUBfx/M/PeFf/LVH6VkwKPIU8zr1HUwV0l4MEltSkXs6LKZfvj+8zMVz3g72PZxiM67wZizaPukIzCsgdAmYmZtiu2AOLDAUAM5yRpWiQYW8nQq3C3o6KnT+YUjR4NDx4+WcDgYiod9KkAfy+BgBVXUQ3K6rbxNGrcEmoA6sqCddIRjEp/CAF9UW64Ga1fMaOViE9uv5wzfw6wDjGqxS4YGoFJNY3bwdpgVYhiFQsYhzyEVBOrqHnYrhNu3cf4HaAr/fvrXvv5kShfchD2UpNRt0NeRKB8yIsuEh+67ecGygnegS+c+vHs31IYzZBWYSf6kzBoJ2gddYGl68h1EbRNreXE0mvlCvoapQNbC8WNr2MI+P7dwyMVSOLbhYOcH7pLDqUFkYFJLx7XNSPKpRsZ1DUM4AB6uvAlg9iPsQhLWK6h2F6ucw4dpMg60KQzpYYQPHzzp+mNghsbfARYiioJiZ6hrm6rmYV3rSH0NfPkCOu3+pPRi8ITx6cdkmyK4DbzpR9q6HSNVXrEcUhDj4yFoXK4fvTkM7V+EeN0DKT3GBg++oPRwIJuKCWvkgsKDzgRhEnaw2UiHMETl9bAnYzAzN3v53K032wvHj09PTU0bbqFQgFrBYFJjuXY9QIuhR0oOsnnccC85BbEgm/1MhBxp/zajZtUL61eDcOm5a1Hl8kzkN4rYr4wtHJsqRDaL45ThDfnvxaPwEH1U4KG0XuqI9Afgz7+DOv5/5V5Qz7eBKmEaBaYXCfcijlEVVNLVZhJujN/52I0fgGjej9t3onqdx5fBTEYV06ZiL/gxMXGIFgUEQ1+Wj1Wel06cPROduOFMHqtJcPegUi6XM2H06LKN7aP1BOQDm0e2yUg0RnMv3sQCgxGxrVSr1ggqV1pR5ZJS117EZOPVw1gxIS96k9SyURXvoYgZ61MEoIJCCqAKojVs/fUYhnT+0AnMRwqLnT4qUsc6JywcCqlbJzrqJZrSR2arh95zfiZXtN6BHoiP4/EetATO8SuBkQyuV0y/rH/62MABMoZbz6NBtHJoYcHDuvUGmo0hzCXy07NzRg67qGL82gq4vyCQjjyFxEozYENUg3mU0pYqI0CFieW0/4HVuVeNmmsRdoxpBqtLoVq7YoWVJaBya9aGEQK2bBgMfeOVCrnJj7qVR9Ov4QdVFO1j+Dz9CTpB/2Dq1772RJod4Xj8wDAjeYxLCad0CiN/+yPnjuJb8VZ0Kn8QjP9Q3jFPttCvDOAik/mT+h9Jpg+LKOIQB8zQFER/VzHEBkFYwwtzGk+edLHVmY/+r2nF/q5mS+y72OAaZH8X0yKNLD6CpuVgp2J00qG5dzVcvWxgHz4ffVOmqq8WVauOog8LHFmIi31YXB3ZdKUygI1GwbFglBxSq/oyFOk/AMV/UXou/G676Ue2xzVGwoxsjkDYuFXslF5h7Gc/csuUMv13wI7rk+iUeReycxp9FqnlvHxv4TENM8rlMFDaKJ2016LdJLq0QmyE3ShPT1ew6YZ75MQJDztlY/HUUhF9YVBildh4sb+LRyrZPSM47o9kxNJ5LuMq3CcM6l5YW6kQoGB5HmIhPBvz9+IlW2AmBG0ReegZFZMUkXAF7JHeSuBUDd+dx1EL/sg2rN93f+3RH6BCiB/WjfR+XBgwrpU5pVsY/7lPnc2rZfu9sLD8MBzejUp2I9vp+DZnZToNMy5lMwA6yRKyECfUlFbT83LF/DWsnmodOna0eeL0GXd2br5QnCpjIU0nT+Nw2nelXN0feCFN/NO0gKN8AERfeY1m2ECTb/XVVWhU3DA0iuorOce2ptOpMaRWH105IKwhUNE6HSPqdZTUNzDX7//FQm1/mP/1v0XHenyQ7Sj5sWTlWFdiMl4tgvmL0kZXnPLTsOrvxADSR/Hu3ZZhnmGppLiVVM+xznMqdL2+Qs65rDhnJ6pm04tglLOGfRkVVk9tYZRRYTkcE7s8R4VScZYf7wD2XWwy8oh/WRg7PwhSsPyhIlXDjjG1cO0y+6Naam0Z0+Sxe7TfymF9fDeUOXz87sj/bpLYOTFj6pN8B0Pa7HfRo94KwhYcHoXrH+PlH5f/+288zuzBbV1dGdMs70rGRjaPUhigLi28f/3Bs8dcx30Dvtv3oaHxs5h5N+1zyZa4aOPf3dWvkc17rwkTHkJ1IjKwox7tag8G9NgdqFibP3rUh+blnz53Fv1dR49g4VSXhqnUuFKti/QQXlhFshpYeh+bIyD2ZvUydo2hMWdeVS4BJWvFyG/BXiqQOXzxTjNxTIyKMeoj5gDZK+WECwvKoVqFm6YXfhOXzzUD9R+vhcUfnEun0CyiAZ181MedhxMlCChIll8KSIp9XJEZvRmNw59BQb0Pte8UP+wauHYktoI4FBCuJMEBDZo+QTNqFEvlaG5hoYatzmrHTp+eL02VXaye6kCjNTmdKkEswZm4QKC3cVlVWJ6H1avL0ZXngxC2UtgsFDFiDh/sF6XuoeLRsOyATo3ZUaGwOHBK/xR5C5vEKlywzIv5e75p/vFUto+KQE92ZurEThMZVX/Iy+QdCXAxYwJeNEC1OeUnND+GZo9e1mYvRS7IE6s6nJSNnWFabj7fwu5A3qGjh6unz52bmls4osqz0y7mNMKqnNUEs4xb2IevtsJ9+FrhtYuR0VwtYoUEGFRFRcyJRFs+03mOW/xNpEzuheXZMPwMkDEYVAJYYUR8wzIv07/+N50+qgkEqpQXEy0ci1CFmVFcZYhLL2uTFvver4Qh6rH8p+bl+T42g7F8N1/wp2ZmaoeOHzNO3nCqcnKugPkeV4uYHqOgVdkGdzRGvzrqm0MD0GSWlQao7YoiBnD6aC/z0kQfFVj/dQDYpmVeIsr7ogCbfKi3i3pc3000YKWFgtIT/SB91svapJzY3zUBL7mEnHZAaTKM5qGZ4g/ffcfsYSfyprCPKFdEgFbAjpZksjF79rUmdT3mE3S6L/PiYJmX+nCXebke8f16fyAAK2XeRuDSy9qknOnBFZ8EqrMe9hCddq3nPnjX9GkY9DoedVt+LtgtL7pZD9Ka7ChEOxr1ZV7+//aurUeKIgpXTc+wjLssqKgvinhJfBATEmNMJIHlEjFBiWjQB2JM9ME/4IMoJuNf8MEXNPKkMctNblk0KsYLAoJADAKJBnz1Sbksy053+50zXT3dO9ed6bl01+lkpqdvdfnOqa+raqq+GpQJrCKsAGT0AKAMUdMm2FrJ2uBeKE9K34rBq9GeeImmSS1emL+6cQUICzoRkcUZGj0m54EA/Iv6qFIj8zIoowEjezciIQAQEldTWRtSyg0aPfYi1jznBCamf7hLis4VENYyzF0rkCQQV7CaP2rzVfa/GpkXDZmX8vDKvAzKYFYTlgG9hrhY1saBrI16A3w2gRInsjYGrCb7eoQlNayGgDFRNZR5uRcyL28FelRB7T76cm0YasYvCGHFDUx4hDUuIrJPtjyyEasKbkU7cjUahSJrE8crdiSEFYOj0QH5V+plXhplrtfnhbDqI2xwYfLiAah5b7V2IWuj1Rr83/UwjSym/ho8Tvfy8In6QdlzNkJYQR+WNAkj1idfyozMSyRfff2JEcay1UGAiQrnKx30By7RQpGHd25e8WvOv/U0dIQ2Ybj8pqLI2tSBLn4KJEZYmhdA/KIdR+xLwIFkXhySebk160HmRUHmxf/mjr9rZV4AlvE/OxCaRy5tdqR5wBQWOHYkI2uDP/JfxYl1CCgma4NjK3GN1LCk0z0gHR59Bm9AX95NuAVNRK6VeaH/JSrEPh+ftPJeKwtWF5Y2eDFxkazN7L+FDY6vMMlarUe4VsvaCGGxZ7FvEFHFZV48yLzozMi8dFGGunpUmoTzg4+dEV96cqvKvbLrCi0oeejTF1f+6OWmV0MOYjM0uNZjvtdyujGQteE5YPTM/KJK9d025dW0edk3YDVtZF6wZOtxWH0K/QpTYztO18i8ACTzTKqN3c/EW+VYSQNLJPRBSWkzVxF9XPcpffPJnHKoxgVZGw1ZGwj5VtzSOGdmMbethkUGDUiHmnRVmRcXMi9+tmVeki5L7YaX2cLTLgBJ3EfEFTguB1eVtVGQtfEha6OskLWxjLCYr9D0Y+PjH+MbeDGdw6o9k2WVfZmXJMpNJ2EIYXWCWoNnAuKiq+TMFT0uVV4FmagtOMy8rI0NhAXDxmVePIVVaPxz+OzGQOMj41EpYpoZQYQmTT8qDols0oeVCIyVQIxjoonI47LeLPFwiKmPNj1xYuGC20cw0+559GtthHIB/lXE8hmVtiKTG0LI0ssjS3mJ9lFpmkKD0eksRQxbVmRelP56dHbsd106hrXUwE5G5kX++asUjAS/M+VYCeKSSFAlDCjFp7LcDEKsyNqolejVeg3tiC0AfxH/n81qK2EHbGptktEaFr1QamVetL/Tc+yVeQEmA9lSWzgGglaHkcLjY31cVVmb3OvonF2DutUDDl7cJC+Me4ngUjlyvh5hpXguIdd8qzIv3jWcOO8ovQdN/H3F7dWVksm+5Br44mc6dBN5rA0EhLDaACmhWyqj5iNOzZ3zjloF0fStYKh18PblaHLQIENyfA/GSZWsTYSwUjs1B8CLzEtCDt+LYISweoFqizBRKGI1LpK1wRCIVVip4QU8uqGQyz1Ir2uSZsE+NbI29QgrRTUsekmoGpkX3zuIk0dH73QvhOoJ1JmODfnlZ+i3bP1BQAirPzjXjaWGuFIuaxMhrHBqTgoIi0mnIvNCU2jUNIyFBR30XqdQ/mxksci81HXeAZ0UwhoQ8HOiJTuEb2sisjTK2qSMsAjvWpkX5R8u5PKT0T4qshXZBEYKbUTnZOs/AjKsof+Y14vRFAR+gXDB2PfnFPq4fvIha5Pz1EuoqUyge4tkbXIpkLXhfNTL6BCcI6yNzIu+VXZvYC3Y02Cjo+gy3D/+7okLJo0BSdEh9WsZG5nLsh8AAkJYAwC9SZSmUFQ66KOyNipVsjYmH02y2vdLnCYQU1XmpQyZFxXIvNwNmRej8Ik+KqpOCUn13UYtIxzmN2HLxFtwg7EPF7Zhl7WhQj5X030I+rAYO9ROaaExhVV8ptFXfgaUdCSvnL0Lth+/hHTzPfiiLPBvC3wrlVk0BSKVibco0cZOXJiGVdamHmENcBEKxoqIKpB5uYlRbqfQuDvg+d7h2BQaIarUFCVpEqbDVFz48JUWWRtDsFRlobSHx72EmyOi+BitUOZlxvf8435OTyExU2PvnDxHaSAsVQlnSjzerfJELxMnYSeCQF8cKZGUSiAhAlTYhlHWpl4Nq49NQiKdmMwLOtTP5JTe5Sn9/T+zxcsPlY6RfhnP9SOiCgGVH6lBQAgrNaaqTSgRFwwY1g4GLWszIMJioqL+KYqfZF6A1Fn8nMx5/tTI+79eNhjRytNU1zPHtYjKmWFHALaTLe0IBMRF2WDyYuIagKxNhLB6PjUHGY3JvJR9dUP5/tmy8vdokXlJu0s3TL/0YTWEJj0XTI2hVBo+WRuQGNeAEkEz0j8Vyrx43ozrqZPgr4OzkHk5C5mXtSLzkgjcwxiI1LCG0SpdpqmEEZD4hH00/ZC1YdJEg6sXwxqI9Hg6OFpzpEVFbT80/UhN7CKOPs7nvSMj02NXoUdV6aOSph9gyeYmhJVNu3KuUKCplUY1HN5aydrgXhqw2rFPUGQ9ICxOf1TmBdGc97W/29H5/XOm0NQoYpi8yz4bCHTsnNnIvhW5qCnE3MfVA1mbCGF13YcFlorJvMy4/jWt/fMYs3DA4yk0Jy8b6xmShTMzuZnzss8eAkJY2bNpwxxRwY4W6qayNtXC37aP1COsDoY1MOlEZV5w4hdohh1UTu4rkXlpaF4rLrTtjFagYUkma4grIVmbCGF1Ii/DROVg4BSNPQDRTaOBehEdcXsLee9zkXmxxDlbZFMIqwVAGb9M9meioHwSkXUja9MhYVH8oczLrOtex0DP02jHHnJUebK447erlDazURqR6DDN5rzs7UBAhjXYYedGuTQFn19cTAQRWRvtqpdR01mDQZm9kLWhuEOZl5myd73semfAR5hCk/ty7D2ReWlkNJvPC2HZbP1q3kPioh86KmvjdyRrwwRYDT72i+Oidl+x4DggKjXtej+AFPej3vTt6FKSeTk1S0/QyHSqTjGRxoKQA1sRaOZYtmIi+WaOYBiYXNqVtanXJIyoNXBYpJ6Apf0g8+JD5kWfwcnDni7vW7T9tMi8iOe1REAIqyVEVt9g/IPJppWsDdWa5o7DAjEFU2hE5sVqT0oo89IkTAjIjAbDRIWvtmRtKroumgelUzMueFgvyGtaKVlkXjLqJP3MlnmD9jNOiSulCBBxNZO1GSnkxm/cdtWSovPXc4+PL1tUdPKocSlM9hOZl5TafNiSLYQ1bBZJQXqIuKgGZZIaytpof5vrqrUgrPKzKxYtHcnrP1xPf5H3XJF5MWDJvisEhLC6gs/uhwPiIhCYvD7c9uj4gmv+M/eM5Z+aeGz8v7tG80f128dpgjJv9K8f/eUXJTtzTfaCgCAgCPQFAZK1oY+J7Oet9xe/K02E/aM+rhG5meuyFwQEAUFg4AiUIGsTTQTVqISooojI724R+B8fczyJ4HfVWwAAAABJRU5ErkJggg==',
-    'params': [
-        {
-            'name': 'aws_access_key_id',
-            'required': True,
-            'title': 'AWS Access Key ID',
-            'type': 'password',
-            'help': 'Your AWS access token.',
-            'link': 'http://docs.aws.amazon.com/general/latest/gr/aws-sec-cred-types.html#access-keys-and-secret-access-keys'
-        },
-        {
-            'name': 'aws_secret_access_key',
-            'required': True,
-            'title': 'AWS Secret Access Key',
-            'type': 'password',
-            'help': 'Your AWS secret access key.',
-            'link': 'http://docs.aws.amazon.com/general/latest/gr/aws-sec-cred-types.html#access-keys-and-secret-access-keys'
-        },
-        {
-            'name': 'region_name',
-            'required': True,
-            'title': 'Region name',
-            'type': 'select',
-            'values': KINESIS_REGIONS,
-            'help': 'Select AWS Region for the stream'
-        },
-        {
-            'name': 'stream_name',
-            'required': True,
-            'title': 'Stream name',
-            'type': 'select',
-            'values': lambda source: Stream.get_streams_from_source(source),
-            'dependencies': ['aws_access_key_id', 'aws_secret_access_key', 'region_name'],
-            'help': 'Select only one stream for data import'
-        }
-    ],
-    'categories': [ 'APIS' ],
-    'keywords': [ 'aws', 'kinesis', 'stream' ],
-    'createdAt': '2017-08-31'
+# names that are resolved from the kinesis module on the first access,
+# importing it loads the AWS client libraries and the panoply sdk
+LAZY_ATTRIBUTES = {
+    'Stream': 'KinesisStream',
+    'Logger': 'Logger',
+    'RecordDeduplicator': 'RecordDeduplicator',
+    'StreamDiscovery': 'StreamDiscovery'
 }
+
+
+def _load_icon():
+    import base64
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icon.png')
+    with open(path, 'rb') as icon:
+        return 'data:image/png;base64,' + base64.b64encode(icon.read()).decode('ascii')
+
+
+def _get_streams_from_source(source):
+    from .kinesis import KinesisStream
+    return KinesisStream.get_streams_from_source(source)
+
+
+def scan_regions(aws_access_key_id, aws_secret_access_key):
+    """
+    describes streams in every supported region concurrently
+    :return: dictionary of region name to list of stream metadata
+    """
+    from .kinesis import KinesisStream
+    regions = [region['value'] for region in KINESIS_REGIONS]
+    return KinesisStream.scan_regions(aws_access_key_id, aws_secret_access_key, regions)
+
+
+def _build_config():
+    return {
+        'title': 'AWS Kinesis',
+        'icon': _load_icon(),
+        'params': [
+            {
+                'name': 'aws_access_key_id',
+                'required': True,
+                'title': 'AWS Access Key ID',
+                'type': 'password',
+                'help': 'Your AWS access token.',
+                'link': 'http://docs.aws.amazon.com/general/latest/gr/aws-sec-cred-types.html#access-keys-and-secret-access-keys'
+            },
+            {
+                'name': 'aws_secret_access_key',
+                'required': True,
+                'title': 'AWS Secret Access Key',
+                'type': 'password',
+                'help': 'Your AWS secret access key.',
+                'link': 'http://docs.aws.amazon.com/general/latest/gr/aws-sec-cred-types.html#access-keys-and-secret-access-keys'
+            },
+            {
+                'name': 'region_name',
+                'required': True,
+                'title': 'Region name',
+                'type': 'select',
+                'values': KINESIS_REGIONS,
+                'help': 'Select AWS Region for the stream'
+            },
+            {
+                'name': 'stream_name',
+                'required': True,
+                'title': 'Stream name',
+                'type': 'select',
+                'values': _get_streams_from_source,
+                'dependencies': ['aws_access_key_id', 'aws_secret_access_key', 'region_name'],
+                'help': 'Select only one stream for data import'
+            }
+        ],
+        'categories': [ 'APIS' ],
+        'keywords': [ 'aws', 'kinesis', 'stream' ],
+        'createdAt': '2017-08-31'
+    }
+
+
+def __getattr__(name):
+    """
+    module attributes that are expensive to create are loaded on the first access
+    """
+    if name == 'CONFIG':
+        value = _build_config()
+    elif name in LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module('.kinesis', __name__), LAZY_ATTRIBUTES[name])
+    elif name == 'kinesis':
+        value = importlib.import_module('.kinesis', __name__)
+    else:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported, everything is loaded eagerly
+    for _name in ['CONFIG'] + list(LAZY_ATTRIBUTES):
+        globals()[_name] = __getattr__(_name)
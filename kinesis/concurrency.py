@@ -0,0 +1,138 @@
+from __future__ import division
+
+import collections
+import threading
+import time
+
+# in flight GetRecords calls when the controller starts
+CONCURRENCY_INITIAL = 4
+
+# limits of the in flight GetRecords calls
+CONCURRENCY_MIN = 1
+CONCURRENCY_MAX = 64
+
+# number of finished calls after which the limit is adjusted
+CONCURRENCY_WINDOW = 20
+
+# limit is increased by this amount after a window without congestion
+CONCURRENCY_INCREASE = 1
+
+# limit is multiplied by this factor after a window with throttling
+CONCURRENCY_DECREASE = 0.5
+
+# window average latency above this multiple of the baseline latency
+# is treated as congestion and the limit is decreased by one step
+LATENCY_TOLERANCE = 1.5
+
+# the baseline is the lowest window average latency of this many recent windows,
+# averages aren't skewed by single fast calls of empty shards and the baseline
+# recovers once the conditions change
+BASELINE_WINDOWS = 10
+
+# number of recent limit adjustments kept in the history
+HISTORY_WINDOWS = 1000
+
+
+"""
+ConcurrencyController limits the number of GetRecords calls in flight across all
+the shard workers. It measures latency, throttling and throughput of every window
+of calls and adjusts the limit with additive increase and multiplicative decrease:
+windows with throttled calls halve it, windows with average latency rising above
+the lowest average of the recent windows lower it by one and windows that were
+using the whole limit without congestion increase it by one.
+"""
+class ConcurrencyController(object):
+    def __init__(self, initial=CONCURRENCY_INITIAL,
+                 minimum=CONCURRENCY_MIN,
+                 maximum=CONCURRENCY_MAX,
+                 window=CONCURRENCY_WINDOW,
+                 increase=CONCURRENCY_INCREASE,
+                 decrease=CONCURRENCY_DECREASE,
+                 latency_tolerance=LATENCY_TOLERANCE):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.window = window
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.limit = float(min(max(initial, minimum), maximum))
+
+        self.condition = threading.Condition()
+        self.in_flight = 0
+        self.latencies = collections.deque(maxlen=BASELINE_WINDOWS)
+        self.history = collections.deque(maxlen=HISTORY_WINDOWS)
+        self.last_window = {}
+        self._reset_window()
+
+    def _reset_window(self):
+        self.window_started = time.time()
+        self.window_calls = 0
+        self.window_throttled = 0
+        self.window_latency = 0.0
+        self.window_records = 0
+        self.window_saturated = False
+
+    def acquire(self):
+        """
+        waits until there is a free slot for the next call
+        """
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+            if self.in_flight >= int(self.limit):
+                self.window_saturated = True
+
+    def release(self, latency, throttled=False, record_count=0):
+        """
+        reports the finished call and frees its slot
+        :param latency: duration of the call in seconds
+        :param throttled: whether the call was throttled
+        :param record_count: number of records returned by the call
+        """
+        with self.condition:
+            self.in_flight -= 1
+            self.window_calls += 1
+            self.window_records += record_count
+            if throttled:
+                self.window_throttled += 1
+            else:
+                self.window_latency += latency
+
+            if self.window_calls >= self.window:
+                self._adjust()
+            self.condition.notify_all()
+
+    def _adjust(self):
+        elapsed = max(time.time() - self.window_started, 1e-6)
+        succeeded = self.window_calls - self.window_throttled
+        latency = self.window_latency / succeeded if succeeded else None
+        baseline = min(self.latencies) if self.latencies else None
+
+        if self.window_throttled:
+            self.limit = max(self.minimum, self.limit * self.decrease)
+        elif latency is not None and baseline is not None and latency > baseline * self.latency_tolerance:
+            self.limit = max(self.minimum, self.limit - self.increase)
+        elif self.window_saturated:
+            self.limit = min(self.maximum, self.limit + self.increase)
+
+        if latency is not None:
+            self.latencies.append(latency)
+
+        self.last_window = {
+            'throttle_rate': self.window_throttled / self.window_calls,
+            'latency': latency,
+            'throughput': self.window_records / elapsed
+        }
+        self.history.append((time.time(), int(self.limit)))
+        self._reset_window()
+
+    def metrics(self):
+        """
+        :return: current limit and the measurements of the last window
+        """
+        with self.condition:
+            metrics = dict(self.last_window)
+            metrics['limit'] = int(self.limit)
+            metrics['in_flight'] = self.in_flight
+            return metrics
@@ -0,0 +1,39 @@
+import base64
+import json
+import threading
+
+from .tail import to_epoch
+
+
+"""
+DeadLetterSink receives records that can't be decoded, together with their raw
+bytes and metadata, so the shard can continue without them. Records are appended
+as json lines to a file, passed to a callback or both.
+"""
+class DeadLetterSink(object):
+    def __init__(self, path=None, callback=None):
+        self.path = path
+        self.callback = callback
+        self.lock = threading.Lock()
+        self.count = 0
+
+    def send(self, stream_name, shard_id, record, error):
+        arrival = record.get('ApproximateArrivalTimestamp')
+        entry = {
+            'stream_name': stream_name,
+            'shard_id': shard_id,
+            'sequence_number': record.get('SequenceNumber'),
+            'partition_key': record.get('PartitionKey'),
+            'arrival': to_epoch(arrival) if arrival is not None else None,
+            'error': '{}: {}'.format(type(error).__name__, error),
+            'data': base64.b64encode(record.get('Data', b'')).decode('ascii')
+        }
+
+        with self.lock:
+            self.count += 1
+            if self.path:
+                with open(self.path, 'a') as dead_letters:
+                    dead_letters.write(json.dumps(entry, sort_keys=True) + '\n')
+
+        if self.callback:
+            self.callback(entry)
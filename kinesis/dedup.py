@@ -0,0 +1,174 @@
+from __future__ import division
+
+import base64
+import hashlib
+import math
+import struct
+import threading
+import time
+import zlib
+
+# expected number of distinct records inside one dedup window, redelivery
+# happens within a few batches so this covers many of them while one
+# generation stays below 180 KB
+DEDUP_CAPACITY = 100000
+
+# target false positive rate of a single filter generation
+DEDUP_ERROR_RATE = 0.001
+
+# seconds after which the current filter generation is rotated out,
+# redelivery after a retry or restart happens well inside this window
+DEDUP_WINDOW = 3600
+
+
+"""
+RecordDeduplicator suppresses records that were already delivered, which can
+happen on retries, resharding or restarting from a stale sequence number.
+It is a time windowed bloom filter made of two generations, new keys are added
+to the current generation and lookups check both of them. When the current
+generation is full or older than the window it becomes the previous one and
+the oldest is dropped, so memory stays fixed no matter how long the stream runs.
+"""
+class RecordDeduplicator(object):
+    def __init__(self, capacity=DEDUP_CAPACITY,
+                 error_rate=DEDUP_ERROR_RATE,
+                 window=DEDUP_WINDOW,
+                 key=None,
+                 state=None):
+        """
+        :param capacity: number of keys kept per generation
+        :param error_rate: false positive rate of one generation
+        :param window: generation lifetime in seconds
+        :param key: None to use (shard, sequence number), name of the field
+        in the decoded record or callable receiving (shard_id, record, data),
+        records without the field fall back to (shard, sequence number)
+        :param state: previously persisted state from to_state()
+        """
+        self.capacity = int(capacity)
+        self.error_rate = error_rate
+        self.window = window
+        self.key = key
+
+        # optimal bloom filter dimensions for the given capacity and error rate
+        self.bit_count = int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.bit_count / self.capacity * math.log(2))))
+        self.byte_count = (self.bit_count + 7) // 8
+
+        self.lock = threading.Lock()
+        self.duplicates = 0
+        self._reset()
+
+        if state:
+            self.load_state(state)
+
+    def _reset(self):
+        self.current = bytearray(self.byte_count)
+        self.previous = bytearray(self.byte_count)
+        self.current_count = 0
+        self.current_started = time.time()
+        self.previous_state = None
+
+    def record_key(self, shard_id, record, data):
+        """
+        builds the identity of the record that is used for the lookup
+        :return: key encoded as bytes
+        """
+        if callable(self.key):
+            key = u'{}'.format(self.key(shard_id, record, data))
+        elif self.key is not None and isinstance(data, dict) and data.get(self.key) is not None:
+            key = u'{}'.format(data[self.key])
+        else:
+            # records without the key field are identified by their position
+            key = u'{}\x00{}'.format(shard_id, record['SequenceNumber'])
+
+        return key.encode('utf-8')
+
+    def _positions(self, key):
+        # double hashing, two 64 bit halves of md5 are enough to derive
+        # all of the positions without hashing the key multiple times
+        first, second = struct.unpack('<QQ', hashlib.md5(key).digest())
+        return [(first + i * second) % self.bit_count for i in range(self.hash_count)]
+
+    @staticmethod
+    def _contains(bits, positions):
+        for position in positions:
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def _rotate_if_needed(self):
+        if self.current_count >= self.capacity or time.time() - self.current_started >= self.window:
+            self.previous = self.current
+            self.previous_state = None
+            self.current = bytearray(self.byte_count)
+            self.current_count = 0
+            self.current_started = time.time()
+
+    def seen(self, key):
+        """
+        checks whether the key was already added and adds it if it wasn't
+        :param key: bytes identity of the record
+        :return: True if the key was most likely seen before
+        """
+        positions = self._positions(key)
+
+        with self.lock:
+            if self._contains(self.current, positions) or self._contains(self.previous, positions):
+                self.duplicates += 1
+                return True
+
+            self._rotate_if_needed()
+            for position in positions:
+                self.current[position >> 3] |= 1 << (position & 7)
+            self.current_count += 1
+
+        return False
+
+    def is_duplicate(self, shard_id, record, data):
+        return self.seen(self.record_key(shard_id, record, data))
+
+    @staticmethod
+    def _encode(bits):
+        # generations that are not full yet are mostly zeros and compress well
+        return base64.b64encode(zlib.compress(bytes(bits))).decode('ascii')
+
+    @staticmethod
+    def _decode(value, compressed):
+        value = base64.b64decode(value)
+        return bytearray(zlib.decompress(value) if compressed else value)
+
+    def to_state(self):
+        """
+        serializable state of the filter that is persisted with the shards,
+        the previous generation doesn't change until rotation so it is encoded once
+        :return: dictionary with the compressed filter generations
+        """
+        with self.lock:
+            if self.previous_state is None:
+                self.previous_state = self._encode(self.previous)
+
+            return {
+                'bit_count': self.bit_count,
+                'hash_count': self.hash_count,
+                'compressed': True,
+                'current': self._encode(self.current),
+                'previous': self.previous_state,
+                'current_count': self.current_count,
+                'current_started': self.current_started
+            }
+
+    def load_state(self, state):
+        """
+        restores the filter from persisted state, state created with
+        different dimensions can't be reused and it is ignored
+        """
+        if state.get('bit_count') != self.bit_count or state.get('hash_count') != self.hash_count:
+            return
+
+        with self.lock:
+            compressed = state.get('compressed', False)
+            self.current = self._decode(state['current'], compressed)
+            self.previous = self._decode(state['previous'], compressed)
+            self.previous_state = None
+            self.current_count = state.get('current_count', 0)
+            self.current_started = state.get('current_started', time.time())
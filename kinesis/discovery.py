@@ -0,0 +1,237 @@
+import hashlib
+import threading
+import time
+
+# seconds for which discovered streams are served from the cache
+DISCOVERY_TTL = 300
+
+# maximum number of streams returned by a single list call
+LIST_STREAMS_LIMIT = 100
+
+# number of parallel describe calls while collecting metadata
+DISCOVERY_MAX_WORKERS = 8
+
+# attempts of a throttled describe call and the first backoff in seconds,
+# the backoff doubles on every attempt
+DISCOVERY_RETRIES = 3
+DISCOVERY_RETRY_DELAY = 0.2
+
+# describe summary is limited to 20 calls per second per account
+THROTTLING_ERRORS = ('LimitExceededException', 'ThrottlingException')
+
+
+def error_code(err):
+    """
+    :return: error code of a client error or None for other errors
+    """
+    response = getattr(err, 'response', None) or {}
+    return response.get('Error', {}).get('Code')
+
+
+def run_parallel(func, items, max_workers=DISCOVERY_MAX_WORKERS):
+    """
+    calls func for every item using a bounded number of threads
+    :return: list of (item, result, error) in the order of items
+    """
+    items = list(items)
+    results = [None] * len(items)
+    lock = threading.Lock()
+    pending = list(range(len(items)))
+
+    def work():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                index = pending.pop(0)
+            try:
+                results[index] = (items[index], func(items[index]), None)
+            except Exception as err:
+                results[index] = (items[index], None, err)
+
+    threads = [threading.Thread(target=work) for _ in range(min(max_workers, len(items)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    [thread.join() for thread in threads]
+
+    return results
+
+
+"""
+StreamDiscovery lists the streams that are available for an account during the
+setup phase. Clients, results and region errors are cached per credentials and
+region for a limited time, so repeated calls from the setup screens don't hit the
+API again, and expired entries are dropped so clients holding the credentials
+aren't kept around after the setup.
+"""
+class StreamDiscovery(object):
+    def __init__(self, client_factory, ttl=DISCOVERY_TTL):
+        self.client_factory = client_factory
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.clients = {}
+        self.cache = {}
+        self.errors = {}
+
+    @staticmethod
+    def _credentials_key(aws_access_key_id, aws_secret_access_key, region_name):
+        # the secret itself is never kept in memory as part of the key
+        secret = hashlib.sha256((aws_secret_access_key or '').encode('utf-8')).hexdigest()
+        return aws_access_key_id, secret, region_name
+
+    def _evict(self, now):
+        # called with the lock held, every cache keeps (expires, value) entries
+        for entries in (self.clients, self.cache, self.errors):
+            for key in [key for key, (expires, _) in entries.items() if expires <= now]:
+                del entries[key]
+
+    def client(self, aws_access_key_id, aws_secret_access_key, region_name):
+        """
+        returns cached client for the credentials and region, clients are thread safe
+        so the same one is shared across the discovery calls until it expires
+        """
+        key = self._credentials_key(aws_access_key_id, aws_secret_access_key, region_name)
+        now = time.time()
+
+        with self.lock:
+            self._evict(now)
+            cached = self.clients.get(key)
+        if cached:
+            return cached[1]
+
+        client = self.client_factory(aws_access_key_id, aws_secret_access_key, region_name)
+        with self.lock:
+            return self.clients.setdefault(key, (now + self.ttl, client))[1]
+
+    def _cached(self, kind, credentials, loader, refresh=False):
+        key = (kind,) + self._credentials_key(*credentials)
+        now = time.time()
+
+        with self.lock:
+            self._evict(now)
+            cached = self.cache.get(key)
+        if cached and cached[0] > now and not refresh:
+            return cached[1]
+
+        value = loader()
+        with self.lock:
+            self.cache[key] = (now + self.ttl, value)
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.clients.clear()
+            self.cache.clear()
+            self.errors.clear()
+
+    def errors_for(self, aws_access_key_id, aws_secret_access_key):
+        """
+        :return: dictionary of region name to the error of its last failed scan
+        with the credentials
+        """
+        key_id, secret, _ = self._credentials_key(aws_access_key_id, aws_secret_access_key, None)
+        now = time.time()
+
+        with self.lock:
+            return {key[2]: err for key, (expires, err) in self.errors.items()
+                    if key[:2] == (key_id, secret) and expires > now}
+
+    @staticmethod
+    def list_streams(client):
+        """
+        pulls all the pages of the stream list
+        :return: list of stream names
+        """
+        all_streams = []
+        options = {'Limit': LIST_STREAMS_LIMIT}
+
+        while True:
+            response = client.list_streams(**options)
+            all_streams += response.get('StreamNames', [])
+
+            if not response.get('HasMoreStreams') or not all_streams:
+                break
+            options['ExclusiveStartStreamName'] = all_streams[-1]
+
+        return all_streams
+
+    @staticmethod
+    def describe(client, stream_name):
+        """
+        collects stream metadata that is shown next to the stream name
+        :return: dictionary with stream metadata
+        """
+        delay = DISCOVERY_RETRY_DELAY
+        for attempt in range(DISCOVERY_RETRIES):
+            try:
+                summary = client.describe_stream_summary(StreamName=stream_name)
+                break
+            except Exception as err:
+                if error_code(err) not in THROTTLING_ERRORS or attempt == DISCOVERY_RETRIES - 1:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+        summary = summary.get('StreamDescriptionSummary', {})
+
+        return {
+            'name': stream_name,
+            'status': summary.get('StreamStatus'),
+            'shard_count': summary.get('OpenShardCount'),
+            'retention_hours': summary.get('RetentionPeriodHours')
+        }
+
+    def get_streams(self, aws_access_key_id, aws_secret_access_key, region_name, refresh=False):
+        """
+        :return: cached list of stream names for the credentials and region
+        """
+        credentials = (aws_access_key_id, aws_secret_access_key, region_name)
+        client = self.client(*credentials)
+
+        return self._cached('streams', credentials, lambda: self.list_streams(client), refresh)
+
+    def describe_streams(self, aws_access_key_id, aws_secret_access_key, region_name, refresh=False):
+        """
+        :return: cached list of stream metadata for the credentials and region
+        """
+        credentials = (aws_access_key_id, aws_secret_access_key, region_name)
+        client = self.client(*credentials)
+
+        def load():
+            stream_names = self.get_streams(*credentials, refresh=refresh)
+            streams = []
+            for _, metadata, err in run_parallel(lambda name: self.describe(client, name), stream_names):
+                if err is None:
+                    streams.append(metadata)
+                elif error_code(err) != 'ResourceNotFoundException':
+                    # partial list is not cached, the whole describe fails instead
+                    raise err
+                # streams removed between listing and describing are skipped
+            return streams
+
+        return self._cached('metadata', credentials, load, refresh)
+
+    def scan_regions(self, aws_access_key_id, aws_secret_access_key, regions, refresh=False):
+        """
+        describes the streams of all the regions concurrently, regions that fail
+        (for example regions which are not enabled for the account or streams
+        that stay throttled) are left out of the result and their errors are
+        returned by errors_for
+        :param regions: list of region names
+        :return: dictionary of region name to list of stream metadata
+        """
+        def scan(region_name):
+            return self.describe_streams(aws_access_key_id, aws_secret_access_key, region_name, refresh)
+
+        found = {}
+        for region_name, streams, err in run_parallel(scan, regions, max_workers=len(regions) or 1):
+            key = self._credentials_key(aws_access_key_id, aws_secret_access_key, region_name)
+            if err is None:
+                found[region_name] = streams
+                with self.lock:
+                    self.errors.pop(key, None)
+            else:
+                with self.lock:
+                    self.errors[key] = (time.time() + self.ttl, err)
+
+        return found
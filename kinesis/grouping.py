@@ -0,0 +1,48 @@
+import collections
+import hashlib
+import struct
+
+
+def bucket_for(partition_key, bucket_count):
+    """
+    stable bucket of the partition key, python hash() is randomized between
+    processes so it can't be used for it
+    """
+    digest = hashlib.md5(u'{}'.format(partition_key).encode('utf-8')).digest()
+    return struct.unpack('<Q', digest[:8])[0] % bucket_count
+
+
+"""
+PartitionBuckets groups decoded records by their partition key, or by a hash of
+the key into a fixed number of buckets. Records are added as the pages are
+decoded and their order within every key is preserved.
+"""
+class PartitionBuckets(object):
+    def __init__(self, bucket_count=None):
+        self.bucket_count = bucket_count
+        self.buckets = collections.OrderedDict()
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def bucket(self, partition_key):
+        if self.bucket_count is None:
+            return partition_key
+        return bucket_for(partition_key, self.bucket_count)
+
+    def add(self, partition_key, data):
+        self.buckets.setdefault(self.bucket(partition_key), []).append(data)
+        self.count += 1
+
+    def update(self, other):
+        """
+        appends records of other buckets, a partition key is written to a single
+        shard so appending the shards one after another keeps the key order
+        """
+        for bucket, records in other.buckets.items():
+            self.buckets.setdefault(bucket, []).extend(records)
+        self.count += other.count
+
+    def to_dict(self):
+        return dict(self.buckets)
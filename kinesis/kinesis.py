@@ -1,14 +1,28 @@
 from __future__ import print_function
 
-import boto3
 import datetime
 import time
 import json
 import panoply
-from botocore.exceptions import ClientError
-import botocore
+import sys
 import threading
+import traceback
 from functools import wraps
+from .concurrency import ConcurrencyController
+from .deadletter import DeadLetterSink
+from .dedup import RecordDeduplicator
+from .discovery import StreamDiscovery
+from .grouping import PartitionBuckets
+from .ordering import ArrivalOrderBuffer, RecordMeta, merge_by_arrival
+from .profiling import BatchProfiler
+from .replay import RecordingClient, ReplayClient
+from .sampling import (infer_schema, SAMPLE_LOOKBACK, SAMPLE_MAX_RECORDS,
+                       SAMPLE_MAX_SHARDS, SAMPLE_TIMEOUT)
+from .spill import DiskPageBuffer
+from .state import STATE_FORMAT_COMPACT, ShardState, ShardStateEncoder, load_shards
+from .tail import (LatencyTracker, MemoryPageBuffer, Page, to_epoch,
+                   TAIL_MAX_LATENCY, TAIL_MAX_PAGES, TAIL_POLL_INTERVAL)
+from .tiers import ShardTiers, TAIL_MAX_WAIT
 
 # default destination name
 DESTINATION = "kinesis_stream"
@@ -18,10 +32,14 @@ ITERATOR_TYPE_AT = 'AT_SEQUENCE_NUMBER'
 ITERATOR_TYPE_AFTER = 'AFTER_SEQUENCE_NUMBER'
 ITERATOR_TYPE_TRIM = 'TRIM_HORIZON'
 ITERATOR_TYPE_LATEST = 'LATEST'
+ITERATOR_TYPE_TIMESTAMP = 'AT_TIMESTAMP'
 
 # total number of elements to import
 BATCH_MAX_SIZE = 5000
 
+# total size of record payloads to import in bytes, None for no limit
+BATCH_MAX_BYTES = None
+
 # each shard iterator result list
 ITERATOR_MAX_RESULTS = 25
 
@@ -43,6 +61,24 @@ CREDENTIALS_EXCEPTIONS = ('UnrecognizedClientException',
     'InvalidSignatureException')
 
 
+def is_client_error(err):
+    """
+    checks whether the error is coming from the AWS client library, botocore is
+    imported only together with the client so if it is not loaded yet the error
+    can't be one of its exceptions
+    """
+    exceptions = sys.modules.get('botocore.exceptions')
+    return exceptions is not None and isinstance(err, exceptions.ClientError)
+
+
+def is_open_shard(shard):
+    """
+    :param shard: shard description from DescribeStream
+    :return: True if the shard still receives records
+    """
+    return 'EndingSequenceNumber' not in shard.get('SequenceNumberRange', {})
+
+
 def exception_decorator(f):
     """
     Exception decorator to catch all the exceptions coming
@@ -54,7 +90,14 @@ def exception_decorator(f):
     def wrapped(*args, **kwargs):
         try:
             res = f(*args, **kwargs)
-        except botocore.exceptions.ClientError as err:
+        except AttributeError as err:
+            # missing attributes
+            Logger.error(err)
+
+        except Exception as err:
+            if not is_client_error(err):
+                raise
+
             if err.response['Error']['Code'] in RESOURCE_EXCEPTIONS:
                 # exceptions related to kinesis resources
                 Logger.log('Resource exception')
@@ -64,10 +107,6 @@ def exception_decorator(f):
                 Logger.log('Credentials exception')
                 Logger.error(err, False)
 
-        except AttributeError as err:
-            # missing attributes
-            Logger.error(err)
-
         return res
 
     return wrapped
@@ -109,7 +148,7 @@ class Logger():
     @staticmethod
     def error(content, retryable=False):
         Logger.log('Error: {}'.format(content))
-        raise panoply.PanoplyException(content, retryable=False)
+        raise panoply.PanoplyException(content, retryable=retryable)
 
     """
     instance method to call log internally if it is a sublass of
@@ -147,33 +186,56 @@ class KinesisWorker(threading.Thread, Logger):
         self.shard_id = str(shard_id)
         self.sleep_interval = sleep_interval
         self.total_records = 0
+        self.total_bytes = 0
         self.max_record_count = options.get('max_record_count', 500)
+        self.max_byte_count = options.get('max_byte_count', None)
         self.client = options.get('client', None)
         self.instance = options.get('instance', None)
+        self.deduplicator = options.get('deduplicator', None)
+        self.duplicate_count = 0
+        self.tiers = options.get('tiers', None)
+        self.profiler = options.get('profiler', None)
+        self.dead_letters = options.get('dead_letters', None)
+        self.concurrency = options.get('concurrency', None)
+        self.poison_count = 0
+        self.error = None
+        self.keep_metadata = options.get('keep_metadata', False)
+        self.buckets = None
+        if options.get('group_by_partition'):
+            self.buckets = PartitionBuckets(options.get('bucket_count'))
+        self.metadata = []
+        self.page_metadata = []
+        self.iterator_created_at = None
         self.shard_data = shard_data
         self.original_shard_data = shard_data.copy()
         self.records = []
         self.deprecated_shard = False
+        self.closed_shard = False
+        self.caught_up = False
         self.shard_iterator = None
+        self.page_bytes = 0
 
 
     def run(self):
         try:
-            self.records = self._get_shard_records()
+            self._get_shard_records()
         except ClosedShardError as err:
             self.local_log('Kinesis shard "{}" has been closed'.format(self.shard_id))
             self.deprecated_shard = True
+            self.closed_shard = True
+        except Exception as err:
+            # records of the pages fetched so far and their sequence number
+            # are kept, the import continues from there on the next batch
+            self.error = err
+            self.local_log('Shard {} Worker import has failed: {}'.format(self.shard_id, traceback.format_exc()))
 
         self.local_log('Shard {} Worker import is finished'.format(self.shard_id))
 
-    def _get_shard_records(self):
+    def _get_shard_iterator(self):
         """
-        it will import all the records available for this specific shard, on the setup phase
-        the first import per shard will start by importing the latest records and the following
-        ones will start importing from the last sequence number
+        on the setup phase the first import per shard will start by importing the latest
+        records and the following ones will start importing from the last sequence number
         """
-        retry_count = MAX_RETRIES
-        all_records = []
         options = {
             'StreamName': self.stream_name,
             'ShardId': self.shard_id,
@@ -184,29 +246,52 @@ class KinesisWorker(threading.Thread, Logger):
             # that is available in descriptor for last record
             options['StartingSequenceNumber'] = self.shard_data['last_sequence_number']
             options['ShardIteratorType'] = ITERATOR_TYPE_AFTER
+        elif self.shard_data.get('last_polled'):
+            # shard without any records that was polled before, continue from
+            # that time so records that arrived while it was not polled are kept
+            options['Timestamp'] = self.shard_data['last_polled']
+            options['ShardIteratorType'] = ITERATOR_TYPE_TIMESTAMP
         else:
             # this one is used on the setup process and it will be used only for the first time
             options['ShardIteratorType'] = ITERATOR_TYPE_LATEST
 
         # get the initial iterator pointer, all the
         # subsequent will be received in the get all records
+        self.iterator_created_at = time.time()
         iterator_response = self.client.get_shard_iterator(**options)
         self.shard_iterator = iterator_response['ShardIterator']
 
+    def _get_shard_records(self):
+        """
+        it will import all the records available for this specific shard
+        """
+        retry_count = MAX_RETRIES
+        all_records = self.records
+
+        self._get_shard_iterator()
+
         while True:
             # loop until it reaches up to date iterator
             try:
                 iteration_records, is_latest_iteration = self._get_iteration_records()
-                all_records += iteration_records
+                if self.buckets is None:
+                    all_records += iteration_records
+                self.metadata += self.page_metadata
+
+                if self.closed_shard:
+                    raise ClosedShardError(self.shard_id, 'Shard has been closed for {}'.format(self.shard_id))
 
                 # important to break this after adding new records
                 # otherwise it could be skipped
                 if is_latest_iteration:
                     break
 
-            except ClientError as err:
+            except Exception as err:
+                if not is_client_error(err):
+                    raise
+
                 # this error occurs when there is a api throttling
-                self.local_log(err.message)
+                self.local_log(str(err))
 
                 if err.response['Error']['Code'] in RETRY_EXCEPTIONS:
                     # GetRecords has max size of 10mb of requests
@@ -223,38 +308,57 @@ class KinesisWorker(threading.Thread, Logger):
 
         return all_records
 
+    def _is_budget_exhausted(self):
+        # budgets are checked between pages so the last page can go over the limit
+        if self.max_record_count is not None and self.max_record_count <= 0:
+            return True
+        return self.max_byte_count is not None and self.max_byte_count <= 0
+
     def _get_iteration_records(self):
         record_data = []
         is_latest_iteration = False
+        self.page_metadata = []
 
-        if self.max_record_count <= 0:
-            return record_data, False
+        if self._is_budget_exhausted():
+            # stop the import for this batch, it continues from the
+            # last sequence number on the next one
+            return record_data, True
 
-        record_limit = min(self.max_record_count, ITERATOR_MAX_RESULTS)
+        record_limit = ITERATOR_MAX_RESULTS
+        if self.max_record_count is not None:
+            record_limit = int(min(self.max_record_count, ITERATOR_MAX_RESULTS))
 
-        response = self.client.get_records(ShardIterator=self.shard_iterator, Limit=record_limit)
+        response = self._fetch_records(record_limit)
 
-        if 'NextShardIterator' not in response:
-            # shard has been closed due to merging/splitting of the shard
-            raise ClosedShardError(self.shard_id, 'Shard has been closed for {}'.format(self.shard_id))
+        self.shard_iterator = response.get('NextShardIterator')
+        if self.shard_iterator is None:
+            # shard has been closed due to merging/splitting of the shard, its
+            # last page is still processed before the worker stops
+            self.closed_shard = True
 
-        self.shard_iterator = response['NextShardIterator']
         # check if this is latest iteration
-        is_latest_iteration = response['MillisBehindLatest'] == 0
+        self.caught_up = self.caught_up or response.get('MillisBehindLatest') == 0
+        is_latest_iteration = self.closed_shard or response['MillisBehindLatest'] == 0
 
         records = response['Records']
+        self.page_bytes = sum(len(record['Data']) for record in records)
+        self.total_bytes += self.page_bytes
+        if self.max_byte_count is not None:
+            self.max_byte_count -= self.page_bytes
+
         if len(records) > 0:
-            # process all the records to extract actual data
-            for record in records:
-                # add processed records to the list of data
-                data = json.loads(record['Data'].decode("utf-8"))
-                record_data.append(data)
+            started = time.time()
+            record_data = self._process_records(records)
+            if self.profiler:
+                self.profiler.add('decode', time.time() - started)
 
             # update sequence number for next iterator and last process import
             self.shard_data['last_processed'] = datetime.datetime.now()
             self.shard_data['last_sequence_number'] = records[-1]['SequenceNumber']
 
-            self.max_record_count -= len(record_data)
+            self.total_records += len(records)
+            if self.max_record_count is not None:
+                self.max_record_count -= len(records)
         else:
             self.local_log('No available records in shard "{}"'.format(self.shard_id))
 
@@ -269,6 +373,169 @@ class KinesisWorker(threading.Thread, Logger):
 
         return record_data, is_latest_iteration
 
+    def _fetch_records(self, record_limit):
+        """
+        calls GetRecords for the current iterator within the concurrency limit
+        :return: api response
+        """
+        if self.concurrency:
+            self.concurrency.acquire()
+
+        started = time.time()
+        try:
+            response = self.client.get_records(ShardIterator=self.shard_iterator, Limit=record_limit)
+        except Exception as err:
+            if self.concurrency:
+                throttled = is_client_error(err) and err.response['Error']['Code'] in RETRY_EXCEPTIONS
+                self.concurrency.release(time.time() - started, throttled=throttled)
+            raise
+
+        latency = time.time() - started
+        if self.concurrency:
+            self.concurrency.release(latency, record_count=len(response.get('Records', [])))
+        if self.profiler:
+            self.profiler.add('get_records', latency)
+
+        return response
+
+    def _process_records(self, records):
+        """
+        process all the records of a single page to extract actual data
+        :return: list of decoded records
+        """
+        record_data = []
+
+        for record in records:
+            # add processed records to the list of data
+            try:
+                data = json.loads(record['Data'].decode("utf-8"))
+            except ValueError as err:
+                # malformed record is quarantined, the sequence number still
+                # moves past it so it is not fetched again
+                self.poison_count += 1
+                self.local_log('Shard {} record {} can\'t be decoded: {}'.format(
+                    self.shard_id, record['SequenceNumber'], err))
+                if self.dead_letters:
+                    self.dead_letters.send(self.stream_name, self.shard_id, record, err)
+                continue
+
+            # redelivered records are skipped but still move the sequence number
+            if self.deduplicator and self.deduplicator.is_duplicate(self.shard_id, record, data):
+                self.duplicate_count += 1
+                continue
+
+            record_data.append(data)
+
+            if self.buckets is not None:
+                self.buckets.add(record.get('PartitionKey'), data)
+            if self.keep_metadata:
+                self.page_metadata.append(RecordMeta(to_epoch(record['ApproximateArrivalTimestamp']),
+                                                     record['SequenceNumber'],
+                                                     record.get('PartitionKey')))
+
+        return record_data
+
+
+"""
+KinesisTailWorker keeps polling its shard until the tail is stopped, every page
+with records is handed over to the page buffer instead of being collected in
+the worker. It works on its own copy of the shard data, the checkpoint in the
+stream is moved only after the page has been emitted.
+"""
+class KinesisTailWorker(KinesisWorker):
+    def __init__(self, stream_name, shard_id, shard_data={}, options={}, **kwargs):
+        super(KinesisTailWorker, self).__init__(stream_name, shard_id,
+                                                shard_data=dict(shard_data),
+                                                options=options,
+                                                **kwargs)
+        self.pages = options.get('pages')
+        self.stopped = options.get('stopped')
+        self.poll_interval = options.get('poll_interval', TAIL_POLL_INTERVAL)
+        self.generation = options.get('generation')
+        self.page_arrivals = []
+
+        # arrival time up to which the records of the shard have been handed over
+        self.watermark = None
+        self.error = None
+
+        # tail is not limited by the batch budgets, the page buffer is
+        self.max_record_count = None
+        self.max_byte_count = None
+
+    def run(self):
+        try:
+            self._tail()
+        except ClosedShardError as err:
+            self.local_log('Kinesis shard "{}" has been closed'.format(self.shard_id))
+            self.deprecated_shard = True
+        except Exception as err:
+            self.error = err
+            self.local_log('Shard {} tail has failed: {}'.format(self.shard_id, err))
+
+        self.local_log('Shard {} tail is finished'.format(self.shard_id))
+
+    def _tail(self):
+        self._get_shard_iterator()
+
+        while not self.stopped.is_set():
+            started = time.time()
+
+            try:
+                record_data, is_latest_iteration = self._get_iteration_records()
+            except Exception as err:
+                if not is_client_error(err):
+                    raise
+
+                code = err.response['Error']['Code']
+                if code in RETRY_EXCEPTIONS:
+                    self.stopped.wait(self.sleep_interval)
+                    continue
+                if code == 'ExpiredIteratorException':
+                    # iterator is valid only for 5 minutes, continue from the checkpoint
+                    self._get_shard_iterator()
+                    continue
+                raise
+
+            had_records = bool(self.page_arrivals)
+            if self.tiers and (had_records or is_latest_iteration):
+                # empty pages behind the tip are not empty polls
+                self.tiers.update(self.shard_data, had_records, polled_at=started)
+
+            if had_records:
+                last_arrival = self.page_arrivals[-1]
+                page = Page(self.shard_id, record_data,
+                            self.shard_data['last_sequence_number'],
+                            byte_count=self.page_bytes,
+                            arrivals=self.page_arrivals,
+                            metadata=self.page_metadata,
+                            generation=self.generation)
+                self.page_arrivals = []
+                if not self.pages.put(page, self.stopped):
+                    break
+                # moved only after the page is in the buffer
+                self.watermark = max(self.watermark or 0, last_arrival)
+
+            if is_latest_iteration:
+                # shard is caught up, its next records arrive after this poll
+                self.watermark = max(self.watermark or 0, started)
+
+            if self.closed_shard:
+                # the last page has been handed over
+                raise ClosedShardError(self.shard_id, 'Shard has been closed for {}'.format(self.shard_id))
+
+            # keep the polling rate within the per shard limits, cold shards
+            # wait longer but never long enough for the iterator to expire
+            poll_interval = self.poll_interval
+            if self.tiers:
+                poll_interval = max(poll_interval, min(self.tiers.interval(self.shard_data), TAIL_MAX_WAIT))
+            wait = poll_interval - (time.time() - started)
+            if wait > 0:
+                self.stopped.wait(wait)
+
+    def _process_records(self, records):
+        self.page_arrivals = [to_epoch(record['ApproximateArrivalTimestamp']) for record in records]
+        return super(KinesisTailWorker, self)._process_records(records)
+
 
 """
 KinesisStream will be importing data from the stream and also 
@@ -280,29 +547,41 @@ class KinesisStream(panoply.DataSource, Logger):
     @exception_decorator
     def get_streams(aws_access_key_id, aws_secret_access_key, region_name):
         """
-        It gets a list of streams for the presented account
+        It gets a list of streams for the presented account, results are
+        cached for every credentials and region
         :param aws_access_key_id:
         :param aws_secret_access_key:
         :param region_name:
         :return: list of kinesis streams
         """
-        client = KinesisStream.kinesis_client(aws_access_key_id,
-                                              aws_secret_access_key,
-                                              region_name)
-        all_streams = []
-
-        response = client.list_streams(Limit=200)
-        all_streams = response.get('StreamNames', [])
+        return discovery.get_streams(aws_access_key_id,
+                                     aws_secret_access_key,
+                                     region_name)
 
-        while True:
-            # if there are more strems pull until you get all of them
-            if response['HasMoreStreams']:
-                response = client.list_streams(Limit=200, ExclusiveStartStreamName=all_streams[-1])
-                all_streams = response.get('StreamNames', [])
-            else:
-                break
+    @staticmethod
+    def get_streams_from_source(source):
+        """
+        It gets a list of streams using the credentials from the source
+        :param source:
+        :return: list of kinesis streams
+        """
+        return KinesisStream.get_streams(source.get('aws_access_key_id'),
+                                         source.get('aws_secret_access_key'),
+                                         source.get('region_name'))
 
-        return all_streams
+    @staticmethod
+    @exception_decorator
+    def scan_regions(aws_access_key_id, aws_secret_access_key, regions):
+        """
+        It describes the streams in all the regions concurrently
+        :param aws_access_key_id:
+        :param aws_secret_access_key:
+        :param regions: list of region names
+        :return: dictionary of region name to list of stream metadata
+        """
+        return discovery.scan_regions(aws_access_key_id,
+                                      aws_secret_access_key,
+                                      regions)
 
     @staticmethod
     def kinesis_client(aws_access_key_id, aws_secret_access_key, region_name):
@@ -313,6 +592,9 @@ class KinesisStream(panoply.DataSource, Logger):
         :param region_name:
         :return: kinesis client
         """
+        # boto3 takes most of the import time so it is loaded only when needed
+        import boto3
+
         return boto3.client(
             'kinesis',
             aws_access_key_id=aws_access_key_id,
@@ -328,37 +610,168 @@ class KinesisStream(panoply.DataSource, Logger):
 
         # define cached list of shards for every import session
         # to have latest sequence number pointer
-        self.shards = source.setdefault('shards', {})
+        # shards are persisted in the compact format unless the dict format
+        # of the previous versions is requested, both formats can be loaded
+        self.shard_state = ShardStateEncoder(source.get('shards'),
+                                             options.get('shard_state', STATE_FORMAT_COMPACT))
+        self.shards = load_shards(source.get('shards'))
         self.shard_count = len(self.shards)
+        self.changed_shards = []
+        source['shards'] = self.shard_state.encoded
 
         self.source = source
         self.stream_name = self.source.get('stream_name')
-        self.client = KinesisStream.kinesis_client(source.get('aws_access_key_id'),
-                                                   source.get('aws_secret_access_key'),
-                                                   source.get('region_name'))
+
+        # replay serves captured API responses offline instead of the client
+        replay = options.get('replay')
+        if replay:
+            replay = replay if isinstance(replay, dict) else {'path': replay}
+            self.client = ReplayClient(replay['path'], replay.get('speed', 1.0))
+        else:
+            self.client = KinesisStream.kinesis_client(source.get('aws_access_key_id'),
+                                                       source.get('aws_secret_access_key'),
+                                                       source.get('region_name'))
+
+        # capture writes raw API responses of this import to segment files
+        capture = options.get('capture')
+        if capture:
+            capture = capture if isinstance(capture, dict) else {'path': capture}
+            self.client = RecordingClient(self.client, **capture)
 
         self.instance = self
 
+        # batch limits, every one of them can be disabled with None
+        self.batch_max_size = options.get('batch_max_size', BATCH_MAX_SIZE)
+        self.batch_max_bytes = options.get('batch_max_bytes', BATCH_MAX_BYTES)
+        self.batch_bytes = 0
+
+        # long running tail mode keeps the workers alive between reads
+        tail = options.get('tail')
+        self.tail = tail if isinstance(tail, dict) else ({} if tail else None)
+
+        # fetched pages of the tail can be spilled to disk when the destination
+        # is slower than the stream, spilling implies the tail mode
+        spill = options.get('spill')
+        self.spill = spill if isinstance(spill, dict) else ({'path': spill} if spill else None)
+        if self.spill is not None and self.tail is None:
+            self.tail = {}
+        self.tail_workers = {}
+        self.tail_generations = {}
+        self.tail_stopped = threading.Event()
+        self.tail_pages = None
+        self.tail_refreshed = 0
+        self.latency = LatencyTracker()
+
+        # optional output ordered by arrival time across the shards
+        self.arrival_order = None
+        arrival_order = options.get('arrival_order')
+        if arrival_order:
+            self.arrival_order = ArrivalOrderBuffer(**(arrival_order if isinstance(arrival_order, dict) else {}))
+
+        # optional output grouped by partition key, ordering across the
+        # shards doesn't apply to it since every key is kept in order
+        group = options.get('group_by_partition')
+        self.group_by_partition = bool(group)
+        self.bucket_count = group.get('buckets') if isinstance(group, dict) else None
+
+        # records that can't be decoded are sent to the dead letter sink
+        self.dead_letters = None
+        self.poison_records = 0
+        dead_letter = options.get('dead_letter')
+        if callable(dead_letter):
+            self.dead_letters = DeadLetterSink(callback=dead_letter)
+        elif dead_letter:
+            self.dead_letters = DeadLetterSink(**(dead_letter if isinstance(dead_letter, dict)
+                                                  else {'path': dead_letter}))
+
+        # optional adaptive limit of GetRecords calls in flight
+        self.concurrency = None
+        concurrency = options.get('adaptive_concurrency')
+        if concurrency:
+            self.concurrency = ConcurrencyController(**(concurrency if isinstance(concurrency, dict) else {}))
+
+        # optional profiling of one batch in every N
+        self.profiler = None
+        profile = options.get('profile')
+        if profile:
+            profile = profile if isinstance(profile, dict) else {'path': profile}
+            self.profiler = BatchProfiler(**profile)
+
+        # optional polling of idle shards with longer intervals
+        self.tiers = None
+        shard_tiers = options.get('shard_tiers')
+        if shard_tiers:
+            self.tiers = ShardTiers(**(shard_tiers if isinstance(shard_tiers, dict) else {}))
+
+        # optional duplicate suppression, the filter state is persisted
+        # together with the shards so it survives restarts
+        self.deduplicator = None
+        dedup = options.get('dedup')
+        if dedup:
+            dedup_options = dedup if isinstance(dedup, dict) else {}
+            self.deduplicator = RecordDeduplicator(state=source.get('dedup_state'), **dedup_options)
 
     @exception_decorator
     def read(self):
+        if self.tail is not None:
+            # tail batches span the long running workers, they are not profiled
+            return self.read_tail()
+
+        if self.profiler is None or not self.profiler.start_batch():
+            return self.read_batch()
+
+        total_records = None
+        try:
+            total_records = self.read_batch(self.profiler)
+            return total_records
+        finally:
+            self.profiler.stop_batch(len(total_records) if total_records else 0)
+
+    def read_batch(self, profiler=None):
+        """
+        imports records of every shard until they are up to date or
+        until the batch limits are reached
+        :param profiler: profiler of this batch, if it is profiled
+        :return: list of records or None if there are no new records
+        """
         # import/update available shards for this stream
         self.shards = self.process_stream_shards(self.shards, self.stream_name)
         self.shard_count = len(self.shards)
 
-        # divide evenly number of records for every shard import
-        max_record_count = BATCH_MAX_SIZE / self.shard_count
+        # closed shards that have been fully read are kept until they are retired,
+        # cold shards continue from their checkpoint once they are due
+        due_shards = [(shard_id, shard_data) for shard_id, shard_data in self.shards.items()
+                      if not shard_data.get('closed') and
+                      not (self.tiers and not self.tiers.is_due(shard_data))]
+
+        # divide evenly number of records and bytes for every shard import
+        worker_count = max(1, len(due_shards))
+        max_record_count = None
+        if self.batch_max_size is not None:
+            max_record_count = max(1, self.batch_max_size // worker_count)
+        max_byte_count = None
+        if self.batch_max_bytes is not None:
+            max_byte_count = max(1, self.batch_max_bytes // worker_count)
+
         total_records = []
         threads = []
         options = {
             'max_record_count': max_record_count,
+            'max_byte_count': max_byte_count,
             'client': self.client,
-            'instance': self
+            'instance': self,
+            'deduplicator': self.deduplicator,
+            'tiers': self.tiers,
+            'keep_metadata': self.arrival_order is not None and not self.group_by_partition,
+            'profiler': profiler,
+            'dead_letters': self.dead_letters,
+            'concurrency': self.concurrency,
+            'group_by_partition': self.group_by_partition,
+            'bucket_count': self.bucket_count
         }
 
         # setup thread worker for every shard
-        for shard_id, shard_data in self.shards.items():
-
+        for shard_id, shard_data in due_shards:
             worker = KinesisWorker(self.stream_name, shard_id,
                                    options=options,
                                    shard_data=shard_data)
@@ -369,23 +782,58 @@ class KinesisStream(panoply.DataSource, Logger):
             worker.start()
 
         # wait to complete all the workers before continuing
+        started = time.time()
         [thread.join() for thread in threads]
+        if profiler:
+            profiler.add('join_wait', time.time() - started)
 
         # import records from every worker
+        self.batch_bytes = 0
+        buckets = PartitionBuckets(self.bucket_count)
         for thread in threads:
-            total_records += thread.records
+            if self.group_by_partition:
+                buckets.update(thread.buckets)
+            elif self.arrival_order is None:
+                total_records += thread.records
+            self.batch_bytes += thread.total_bytes
+            self.poison_records += thread.poison_count
+
+            # only a poll that has reached the tip without an error is empty, the
+            # poll time is where a shard without checkpoint continues from
+            if self.tiers and thread.error is None:
+                if thread.caught_up:
+                    self.tiers.update(thread.shard_data, thread.total_records > 0,
+                                      polled_at=thread.iterator_created_at)
+                elif thread.total_records > 0:
+                    self.tiers.update(thread.shard_data, True)
+
+            # the shard cannot receive any content anymore, it is kept as closed
+            # so its children don't re-read it and it is removed once retired
+            if thread.closed_shard:
+                thread.shard_data['closed'] = True
+
+        if self.group_by_partition:
+            total_records = buckets.to_dict()
+        elif self.arrival_order is not None:
+            # the whole batch is available, merge it without holding back records
+            total_records = merge_by_arrival([(thread.records, thread.metadata) for thread in threads])
+
+        # partial records of failed workers are returned, without any records the
+        # failure is raised so it isn't mistaken for a stream without new records
+        failed = [thread for thread in threads if thread.error is not None]
+        if failed and not total_records:
+            Logger.error('Shard {} Worker import has failed: {}'.format(failed[0].shard_id, failed[0].error), True)
 
-            # update shard information from response
-            # if the shard cannot receive any content anymore mark
-            # for removal
-            if thread.deprecated_shard:
-                self.shards.pop(thread.shard_id, None)
+        # update the shards iterator information for the next session
+        self.save_shards()
 
-            # shard iterator options should be updated
-            self.shards[thread.shard_id] = thread.shard_data
+        if self.tiers:
+            self.local_log('Shard tiers {}'.format(self.tiers.counts(self.shards)))
+        if self.concurrency:
+            self.local_log('Concurrency {}'.format(self.concurrency.metrics()))
 
-        # update the shards iterator information for the next session
-        self.source['shards'] = self.shards
+        if self.deduplicator:
+            self.source['dedup_state'] = self.deduplicator.to_state()
 
         # define when to stop specific batch import
         if len(total_records) > 0:
@@ -394,39 +842,361 @@ class KinesisStream(panoply.DataSource, Logger):
             return None
 
     @exception_decorator
-    def get_stream_shards(self, stream_name):
+    def sample(self, max_records=SAMPLE_MAX_RECORDS,
+               max_shards=SAMPLE_MAX_SHARDS,
+               lookback=SAMPLE_LOOKBACK,
+               timeout=SAMPLE_TIMEOUT):
+        """
+        reads a preview of recent records from a few shards in parallel, it
+        works on its own shard data so the import checkpoints are not changed
+        :param max_records: maximum number of returned records
+        :param max_shards: number of shards that are read
+        :param lookback: seconds in the past from which the records are read
+        :param timeout: seconds after which the sample returns what it has
+        :return: dictionary with records, inferred schema and sampled shards
+        """
+        deadline = time.time() + timeout
+
+        # closed shards don't receive new records, prefer the open ones, the
+        # listing of large streams stops at the deadline or once enough are found
+        shard_list = self.get_stream_shards(self.stream_name, deadline=deadline, max_open_shards=max_shards)
+        open_shards = [shard for shard in shard_list if is_open_shard(shard)]
+        shard_ids = [shard['ShardId'] for shard in (open_shards or shard_list)][:max_shards]
+
+        threads = []
+        options = {
+            'max_record_count': max(1, -(-max_records // max(1, len(shard_ids)))),
+            'client': self.client,
+            'instance': self
+        }
+        for shard_id in shard_ids:
+            # read from the lookback time, same as a shard that was last polled then
+            shard_data = {
+                'last_sequence_number': None,
+                'last_processed': None,
+                'last_polled': time.time() - lookback
+            }
+            worker = KinesisWorker(self.stream_name, shard_id,
+                                   options=options,
+                                   shard_data=shard_data)
+            worker.daemon = True
+            threads.append(worker)
+            worker.start()
+
+        for thread in threads:
+            thread.join(max(0, deadline - time.time()))
+
+        records = []
+        for thread in threads:
+            # unfinished workers stop after their current page
+            thread.max_record_count = 0
+            records += list(thread.records)
+        records = records[:max_records]
+
+        return {
+            'records': records,
+            'schema': infer_schema(records),
+            'shards': shard_ids
+        }
+
+    @staticmethod
+    def sample_from_source(source, **kwargs):
+        """
+        samples the stream selected in the source during the setup phase
+        :return: dictionary with records, inferred schema and sampled shards
+        """
+        return KinesisStream(dict(source), {}).sample(**kwargs)
+
+    def read_tail(self):
+        """
+        returns the next micro batch of the long running tail, the batch is emitted
+        when it reaches the batch size limits or when its oldest page has waited
+        for max_latency seconds
+        :return: list of records or None when the tail is stopped or idle
+        """
+        self._start_tail_workers()
+
+        while True:
+            # taken before the pages are collected, so every page with records
+            # below the watermark is already in the buffer
+            watermark = self._event_watermark()
+            pages, idle = self._collect_pages()
+            finished = idle or self.tail_stopped.is_set()
+            if finished and not pages and not (self.arrival_order is not None and len(self.arrival_order)):
+                return None
+
+            # records held back for ordering are released once the tail is finished
+            total_records = self._emit_pages(pages, flush=finished, watermark=watermark)
+            if total_records or finished:
+                return total_records or None
+
+    def _collect_pages(self):
+        """
+        waits for the pages of the next micro batch
+        :return: list of pages and whether the tail has been idle for idle_timeout
+        """
+        max_latency = self.tail.get('max_latency', TAIL_MAX_LATENCY)
+        idle_timeout = self.tail.get('idle_timeout')
+
+        pages = []
+        record_count = 0
+        byte_count = 0
+        deadline = None
+        idle_since = time.time()
+
+        if self.arrival_order is not None and len(self.arrival_order):
+            # held back records need the watermark to move even without new pages
+            deadline = idle_since + max_latency
+
+        while not self.tail_stopped.is_set():
+            now = time.time()
+            if deadline is not None and now >= deadline:
+                break
+            if not pages and idle_timeout is not None and now - idle_since >= idle_timeout:
+                return pages, True
+
+            timeout = TAIL_POLL_INTERVAL
+            if deadline is not None:
+                timeout = min(timeout, deadline - now)
+
+            page = self.tail_pages.get(timeout=timeout)
+            if page is None:
+                # pick up new shards and restart failed workers while waiting
+                self._start_tail_workers()
+                continue
+
+            if not pages:
+                deadline = min(deadline or float('inf'), page.fetched_at + max_latency)
+            pages.append(page)
+            record_count += len(page.records)
+            byte_count += page.byte_count
+
+            if self.batch_max_size is not None and record_count >= self.batch_max_size:
+                break
+            if self.batch_max_bytes is not None and byte_count >= self.batch_max_bytes:
+                break
+
+        return pages, False
+
+    def _event_watermark(self):
+        """
+        arrival time up to which every running tail worker has handed over its
+        records, minus the lateness, shards that are still catching up hold it back
+        :return: watermark in seconds since epoch, None when no worker is running
+        """
+        if self.arrival_order is None:
+            return None
+
+        watermarks = [worker.watermark for worker in self.tail_workers.values() if worker.is_alive()]
+        if not watermarks:
+            return None
+        if None in watermarks:
+            # a worker that hasn't polled yet can still hand over any record
+            return float('-inf')
+
+        return min(watermarks) - self.arrival_order.lateness
+
+    def _emit_pages(self, pages, flush=False, watermark=None):
+        """
+        commits checkpoints of the emitted pages and returns their records
+        :param flush: emit all the records that are held back for ordering
+        :param watermark: event time watermark for ordering, records that
+        arrived up to it are emitted, None emits all of them
+        :return: list of records or dictionary of partition buckets
+        """
+        emitted_at = time.time()
+
+        # a replaced worker continues from the committed checkpoint, so the
+        # pages it has left in the buffer are fetched again by the new one
+        pages = [page for page in pages if page.generation == self.tail_generations.get(page.shard_id)]
+
+        if self.group_by_partition:
+            buckets = PartitionBuckets(self.bucket_count)
+            for page in pages:
+                for data, meta in zip(page.records, page.metadata):
+                    if not self._is_duplicate(page.shard_id, meta, data):
+                        buckets.add(meta.partition_key, data)
+            total_records = buckets.to_dict()
+        elif self.arrival_order is not None:
+            for page in pages:
+                self.arrival_order.add_page(page)
+            total_records = self.arrival_order.pop_ready(None if flush else watermark, skip=self._is_duplicate)
+            pages = self.arrival_order.completed_pages()
+        elif self.deduplicator is None:
+            total_records = []
+            for page in pages:
+                total_records += page.records
+        else:
+            total_records = []
+            for page in pages:
+                total_records += [data for data, meta in zip(page.records, page.metadata)
+                                  if not self._is_duplicate(page.shard_id, meta, data)]
+
+        for page in pages:
+            self.latency.add(page.arrivals, emitted_at)
+
+            shard_data = self.shards.setdefault(page.shard_id, ShardState())
+            committed = shard_data['last_sequence_number']
+            if committed is not None and int(committed) >= int(page.last_sequence_number):
+                # checkpoints never move backwards
+                continue
+            shard_data['last_sequence_number'] = page.last_sequence_number
+            shard_data['last_processed'] = datetime.datetime.now()
+
+        self.batch_bytes = sum(page.byte_count for page in pages)
+        self.poison_records = sum(worker.poison_count for worker in self.tail_workers.values())
+        self.save_shards()
+        if self.deduplicator:
+            self.source['dedup_state'] = self.deduplicator.to_state()
+
+        self.local_log('Tail latency {}'.format(self.latency.percentiles()))
+
+        return total_records
+
+    def _is_duplicate(self, shard_id, meta, data):
+        """
+        tail records are checked for duplicates when they are emitted, not when
+        they are fetched, so the persisted filter never holds records that are
+        fetched again after a restart because their pages were not committed
+        """
+        if self.deduplicator is None:
+            return False
+
+        record = {'SequenceNumber': meta.sequence_number, 'PartitionKey': meta.partition_key}
+        return self.deduplicator.is_duplicate(shard_id, record, data)
+
+    def _start_tail_workers(self):
+        """
+        starts a tail worker for every shard that doesn't have a running one,
+        the list of shards is refreshed every shard_refresh seconds
+        """
+        if self.tail_pages is None:
+            if self.spill is not None:
+                self.tail_pages = DiskPageBuffer(**self.spill)
+            else:
+                self.tail_pages = MemoryPageBuffer(self.tail.get('max_pages', TAIL_MAX_PAGES))
+
+        if time.time() - self.tail_refreshed < self.tail.get('shard_refresh', 60):
+            return
+        self.tail_refreshed = time.time()
+
+        self.shards = self.process_stream_shards(self.shards, self.stream_name)
+        self.shard_count = len(self.shards)
+        options = {
+            'client': self.client,
+            'instance': self,
+            'tiers': self.tiers,
+            'keep_metadata': (self.arrival_order is not None or self.group_by_partition or
+                              self.deduplicator is not None),
+            'dead_letters': self.dead_letters,
+            'concurrency': self.concurrency,
+            'pages': self.tail_pages,
+            'stopped': self.tail_stopped,
+            'poll_interval': self.tail.get('poll_interval', TAIL_POLL_INTERVAL)
+        }
+
+        for shard_id, shard_data in self.shards.items():
+            worker = self.tail_workers.get(shard_id)
+            if shard_data.get('closed'):
+                continue
+            if worker is not None and (worker.is_alive() or worker.deprecated_shard):
+                continue
+
+            generation = self.tail_generations.get(shard_id, 0) + 1
+            self.tail_generations[shard_id] = generation
+            worker = KinesisTailWorker(self.stream_name, shard_id,
+                                       options=dict(options, generation=generation),
+                                       shard_data=shard_data)
+            worker.daemon = True
+            self.tail_workers[shard_id] = worker
+
+            self.local_log('Shard "{}" tail has started'.format(shard_id))
+            worker.start()
+
+    def stop_tail(self):
+        """
+        stops all the tail workers, pages that were not emitted yet are
+        fetched again on the next run from the committed checkpoints
+        """
+        self.tail_stopped.set()
+        [worker.join() for worker in self.tail_workers.values()]
+        self.tail_workers = {}
+
+        if self.spill is not None and self.tail_pages is not None:
+            self.tail_pages.close()
+
+    @exception_decorator
+    def get_stream_shards(self, stream_name, deadline=None, max_open_shards=None):
         """
         gets the information about the stream
         :param stream_name:
+        :param deadline: time after which no more pages are requested
+        :param max_open_shards: stop once this many open shards are listed
         :return: list of shards for the selected stream
         """
-        stream = self.client.describe_stream(StreamName=stream_name)
-
-        # it needs to check whether the response is actually having this dictionary
-        # from experience sometimes AWS api return missing content in some edge cases
-        # that are actually not invoking errors
-        # for example removing this stream will for some time return results and then
-        # it will return error that this stream doesn't exist
-        description = stream.get('StreamDescription', {})
-
-        return description.get('Shards', [])
+        shards = []
+        open_count = 0
+        params = {'StreamName': stream_name}
+        while True:
+            stream = self.client.describe_stream(**params)
+
+            # it needs to check whether the response is actually having this dictionary
+            # from experience sometimes AWS api return missing content in some edge cases
+            # that are actually not invoking errors
+            # for example removing this stream will for some time return results and then
+            # it will return error that this stream doesn't exist
+            description = stream.get('StreamDescription', {})
+            page = description.get('Shards', [])
+            shards += page
+
+            # large streams are described in pages of up to 100 shards
+            if not page or not description.get('HasMoreShards'):
+                return shards
+
+            if max_open_shards is not None:
+                open_count += len([shard for shard in page if is_open_shard(shard)])
+                if open_count >= max_open_shards:
+                    return shards
+            if deadline is not None and time.time() >= deadline:
+                return shards
+            params['ExclusiveStartShardId'] = page[-1]['ShardId']
 
     @exception_decorator
-    def process_stream_shards(self, shards, stream_name):
+    def process_stream_shards(self, shards=None, stream_name=None):
         """
-        It imports/updates information about the shards for the selected stream
+        It imports/updates information about the shards for the selected stream,
+        shards that are no longer listed have passed the retention and are removed
         :return: updated object that contains a list of shard information
         """
-        shard_list = self.get_stream_shards(stream_name)
+        if shards is None:
+            shards = self.shards
+        shard_list = self.get_stream_shards(stream_name or self.stream_name)
 
+        listed = set()
         for shard in shard_list:
             shard_id = shard['ShardId']
+            listed.add(shard_id)
 
             if shard_id not in shards:
                 sequence_number = shard['SequenceNumberRange']['StartingSequenceNumber']
-                shards[shard_id] = {
-                    'last_sequence_number': sequence_number,
-                    'last_processed': None
-                }
+                shards[shard_id] = ShardState(last_sequence_number=sequence_number)
+
+        # an empty list is not trusted, see get_stream_shards
+        if listed:
+            for shard_id in [shard_id for shard_id in shards if shard_id not in listed]:
+                self.local_log('Shard "{}" has been retired'.format(shard_id))
+                del shards[shard_id]
 
         return shards
+
+    def save_shards(self):
+        """
+        persists the shards into the source, only the shards that have
+        changed since the last save are encoded again
+        """
+        self.changed_shards = self.shard_state.update(self.shards)
+        self.source['shards'] = self.shard_state.encoded
+
+
+# shared discovery service used by the setup phase
+discovery = StreamDiscovery(KinesisStream.kinesis_client)
@@ -0,0 +1,96 @@
+import collections
+import heapq
+import itertools
+
+# seconds a record can arrive late and still be emitted in arrival order
+ORDER_LATENESS = 1.0
+
+# records held back for ordering, past it the oldest are emitted ahead of the watermark
+ORDER_MAX_HELD = 50000
+
+
+"""
+RecordMeta is the part of the Kinesis record that is kept next to the
+decoded data when the output mode needs it
+"""
+RecordMeta = collections.namedtuple('RecordMeta', ['arrival', 'sequence_number', 'partition_key'])
+
+
+def _entries(shard_index, records, metadata):
+    for position, (data, meta) in enumerate(zip(records, metadata)):
+        yield (meta.arrival, shard_index, int(meta.sequence_number), position, data)
+
+
+def merge_by_arrival(shards):
+    """
+    k-way merge of the records of every shard on their arrival timestamp,
+    records of a shard are already in arrival order so the merge is streamed
+    :param shards: list of (records, metadata) for every shard
+    :return: list of records
+    """
+    streams = [_entries(index, records, metadata) for index, (records, metadata) in enumerate(shards)]
+    return [entry[-1] for entry in heapq.merge(*streams)]
+
+
+"""
+ArrivalOrderBuffer orders records of the pages coming from the tail workers.
+Records are held in a heap until the watermark passes their arrival time, so
+late pages of slower shards can still be merged in order. The watermark is
+event time, the arrival time up to which every shard has handed over its pages. A page is complete
+once all of its records have been emitted, and only complete pages are
+committed, in the order in which they were fetched for every shard.
+A shard that stops handing over pages holds the watermark back, so at most
+max_held records are kept and the oldest are emitted past it.
+"""
+class ArrivalOrderBuffer(object):
+    def __init__(self, lateness=ORDER_LATENESS, max_held=ORDER_MAX_HELD):
+        self.lateness = lateness
+        self.max_held = max_held
+        self.heap = []
+        self.pending = {}
+        self.shard_pages = collections.OrderedDict()
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def add_page(self, page):
+        self.pending[id(page)] = len(page.records)
+        self.shard_pages.setdefault(page.shard_id, collections.deque()).append(page)
+
+        for data, meta in zip(page.records, page.metadata):
+            heapq.heappush(self.heap, (meta.arrival, page.shard_id, int(meta.sequence_number),
+                                       next(self.counter), page, meta, data))
+
+    def pop_ready(self, watermark=None, skip=None):
+        """
+        :param watermark: records that arrived up to this time are emitted, None emits all,
+        records above max_held are emitted regardless of it
+        :param skip: optional callable receiving (shard_id, meta, data), records for
+        which it returns True are dropped but still count as emitted
+        :return: list of records in arrival order
+        """
+        records = []
+        while self.heap and (watermark is None or self.heap[0][0] <= watermark or
+                             (self.max_held is not None and len(self.heap) > self.max_held)):
+            entry = heapq.heappop(self.heap)
+            self.pending[id(entry[4])] -= 1
+            if skip is None or not skip(entry[1], entry[5], entry[6]):
+                records.append(entry[-1])
+
+        return records
+
+    def completed_pages(self):
+        """
+        :return: pages whose records were all emitted
+        """
+        completed = []
+        for shard_id, pages in list(self.shard_pages.items()):
+            while pages and self.pending[id(pages[0])] == 0:
+                page = pages.popleft()
+                del self.pending[id(page)]
+                completed.append(page)
+            if not pages:
+                del self.shard_pages[shard_id]
+
+        return completed
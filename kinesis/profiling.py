@@ -0,0 +1,169 @@
+from __future__ import division
+
+import collections
+import json
+import os
+import sys
+import threading
+import time
+
+# seconds between two stack samples of all the threads
+PROFILE_INTERVAL = 0.005
+
+# profile one batch in every N batches
+PROFILE_EVERY = 1
+
+# number of top allocation sites in the summary
+ALLOCATION_TOP = 20
+
+
+def _cpu_time():
+    # process_time is not available on python 2
+    clock = getattr(time, 'process_time', None)
+    return clock() if clock else time.clock()
+
+
+def _thread_cpu_time():
+    # cpu time of the calling thread, thread_time is available from python 3.7
+    clock = getattr(time, 'thread_time', None)
+    return clock() if clock else 0.0
+
+
+def _folded_stack(thread_name, frame):
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append('{} ({}:{})'.format(code.co_name, os.path.basename(code.co_filename), frame.f_lineno))
+        frame = frame.f_back
+    stack.append(thread_name)
+    return ';'.join(reversed(stack))
+
+
+"""
+StackSampler periodically samples stacks of all the threads of the process,
+the samples are aggregated in the folded format used by flame graph tools.
+Its own cpu time is measured so it can be left out of the batch cpu time.
+"""
+class StackSampler(threading.Thread):
+    def __init__(self, interval=PROFILE_INTERVAL):
+        super(StackSampler, self).__init__(name='kinesis-profiler')
+        self.daemon = True
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.stacks = collections.Counter()
+        self.samples = 0
+        self.cpu_time = 0.0
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            started = _thread_cpu_time()
+            names = dict((thread.ident, thread.name) for thread in threading.enumerate())
+            for ident, frame in sys._current_frames().items():
+                if ident == self.ident:
+                    continue
+                self.stacks[_folded_stack(names.get(ident, str(ident)), frame)] += 1
+            self.samples += 1
+            self.cpu_time += _thread_cpu_time() - started
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+"""
+BatchProfiler profiles one read() batch in every N. While a batch is profiled the
+stacks of all the threads are sampled, the workers report time spent in their
+phases and allocations can be traced with tracemalloc. Every profiled batch writes
+a folded stack file for flame graphs and a json summary of where the time went.
+"""
+class BatchProfiler(object):
+    def __init__(self, path, every=PROFILE_EVERY, interval=PROFILE_INTERVAL, allocations=False):
+        """
+        :param path: directory for the reports
+        :param every: profile one batch in every N
+        :param interval: seconds between stack samples
+        :param allocations: trace allocations of the profiled batches
+        """
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        self.path = path
+        self.every = every
+        self.interval = interval
+        self.allocations = allocations
+        self.batch = 0
+        self.lock = threading.Lock()
+        self.summary = None
+        self._reset()
+
+    def _reset(self):
+        self.phases = collections.defaultdict(float)
+        self.calls = collections.defaultdict(int)
+        self.sampler = None
+        self.started = None
+        self.cpu_started = None
+
+    def start_batch(self):
+        """
+        :return: True if the batch is profiled
+        """
+        self.batch += 1
+        if (self.batch - 1) % self.every:
+            return False
+
+        self._reset()
+        if self.allocations:
+            import tracemalloc
+            tracemalloc.start()
+
+        self.started = time.time()
+        self.cpu_started = _cpu_time()
+        self.sampler = StackSampler(self.interval)
+        self.sampler.start()
+        return True
+
+    def add(self, phase, duration):
+        with self.lock:
+            self.phases[phase] += duration
+            self.calls[phase] += 1
+
+    def stop_batch(self, record_count=0):
+        """
+        writes the reports of the profiled batch
+        :return: summary of the batch
+        """
+        self.sampler.stop()
+        wall_time = time.time() - self.started
+        cpu_time = max(0.0, _cpu_time() - self.cpu_started - self.sampler.cpu_time)
+
+        summary = {
+            'batch': self.batch,
+            'records': record_count,
+            'wall_time': wall_time,
+            'cpu_time': cpu_time,
+            'sampler_cpu_time': self.sampler.cpu_time,
+            # share of one core used by the import without the sampler, values close
+            # to 1 mean the batch is cpu bound, python code runs on one core at a time
+            # under the GIL, lower values mean the time goes to waiting for the API
+            'cpu_utilization': cpu_time / wall_time if wall_time else 0,
+            'samples': self.sampler.samples,
+            'phases': dict((phase, {'seconds': seconds, 'calls': self.calls[phase]})
+                           for phase, seconds in self.phases.items())
+        }
+
+        if self.allocations:
+            import tracemalloc
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            summary['allocations'] = [{'site': str(stat.traceback), 'size': stat.size, 'count': stat.count}
+                                      for stat in snapshot.statistics('lineno')[:ALLOCATION_TOP]]
+
+        name = os.path.join(self.path, 'batch-{:06d}'.format(self.batch))
+        with open(name + '.folded', 'w') as folded:
+            for stack, count in self.sampler.stacks.most_common():
+                folded.write('{} {}\n'.format(stack, count))
+        with open(name + '.json', 'w') as report:
+            json.dump(summary, report, indent=2, sort_keys=True)
+
+        self.summary = summary
+        return summary
@@ -0,0 +1,268 @@
+from __future__ import division
+
+import base64
+import calendar
+import collections
+import datetime
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+
+# segment file signature and format version, version 1 captures held
+# pickled payloads and are not loaded anymore
+SEGMENT_MAGIC = b'KSEG\x02'
+
+# segment is closed and a new one is started once it reaches this size
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+# operations of the client that are captured
+RECORDED_OPERATIONS = ('describe_stream', 'describe_stream_summary', 'list_streams',
+                       'get_shard_iterator', 'get_records')
+
+# entry header: payload length, seconds since capture start,
+# duration of the call and length of the operation name
+ENTRY_HEADER = struct.Struct('<Iddh')
+
+
+def segment_paths(path):
+    return sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith('.kseg'))
+
+
+class _UTC(datetime.tzinfo):
+    def utcoffset(self, value):
+        return datetime.timedelta(0)
+
+    def tzname(self, value):
+        return 'UTC'
+
+    def dst(self, value):
+        return datetime.timedelta(0)
+
+UTC = _UTC()
+
+
+def _encode_value(value):
+    # record data and timestamps are the only values that are not plain json
+    if isinstance(value, bytes):
+        return {'$base64': base64.b64encode(value).decode('ascii')}
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            epoch = time.mktime(value.timetuple()) + value.microsecond / 1e6
+        else:
+            epoch = calendar.timegm(value.utctimetuple()) + value.microsecond / 1e6
+        return {'$epoch': epoch}
+    raise TypeError('{!r} can\'t be captured'.format(value))
+
+
+def _decode_value(value):
+    if len(value) == 1:
+        if '$base64' in value:
+            return base64.b64decode(value['$base64'])
+        if '$epoch' in value:
+            return datetime.datetime.fromtimestamp(value['$epoch'], UTC)
+    return value
+
+
+def encode_payload(payload):
+    """
+    :return: captured call as compressed json, bytes are base64 and datetimes epoch seconds
+    """
+    return zlib.compress(json.dumps(payload, default=_encode_value, separators=(',', ':')).encode('utf-8'), 1)
+
+
+"""
+SegmentWriter appends captured calls to segment files, every entry is written
+and flushed as a whole so the files can be read while the capture is running
+"""
+class SegmentWriter(object):
+    def __init__(self, path, max_bytes=SEGMENT_MAX_BYTES):
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.index = len(segment_paths(path))
+        self.file = None
+        self.size = 0
+
+    def _open_segment(self):
+        if self.file is not None:
+            self.file.close()
+        self.index += 1
+        self.file = open(os.path.join(self.path, 'segment-{:06d}.kseg'.format(self.index)), 'ab')
+        self.file.write(SEGMENT_MAGIC)
+        self.size = len(SEGMENT_MAGIC)
+
+    def write(self, operation, started, duration, payload):
+        data = encode_payload(payload)
+        name = operation.encode('ascii')
+        entry = ENTRY_HEADER.pack(len(data), started - self.started, duration, len(name)) + name + data
+
+        with self.lock:
+            if self.file is None or self.size + len(entry) > self.max_bytes:
+                self._open_segment()
+            self.file.write(entry)
+            self.file.flush()
+            self.size += len(entry)
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+def read_segment(path):
+    """
+    memory maps the segment and yields its entries, the payload is
+    not decoded until it is needed
+    :return: generator of (operation, elapsed, duration, buffer, offset, length)
+    """
+    with open(path, 'rb') as segment:
+        if os.fstat(segment.fileno()).st_size <= len(SEGMENT_MAGIC):
+            return
+        buffer = mmap.mmap(segment.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if buffer[:len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+        raise ValueError('{} is not a capture segment of this version'.format(path))
+
+    offset = len(SEGMENT_MAGIC)
+    while offset + ENTRY_HEADER.size <= len(buffer):
+        length, elapsed, duration, name_length = ENTRY_HEADER.unpack_from(buffer, offset)
+        offset += ENTRY_HEADER.size
+        operation = buffer[offset:offset + name_length].decode('ascii')
+        offset += name_length
+        if offset + length > len(buffer):
+            # entry that was being written when the capture stopped
+            break
+        yield operation, elapsed, duration, buffer, offset, length
+        offset += length
+
+
+def decode_payload(buffer, offset, length):
+    return json.loads(zlib.decompress(buffer[offset:offset + length]).decode('utf-8'),
+                      object_hook=_decode_value)
+
+
+"""
+RecordingClient wraps kinesis client and captures the raw responses and timings
+of the API calls that the import is making, all the other attributes are passed
+to the wrapped client
+"""
+class RecordingClient(object):
+    def __init__(self, client, path, max_bytes=SEGMENT_MAX_BYTES):
+        self.client = client
+        self.writer = SegmentWriter(path, max_bytes)
+
+    def __getattr__(self, name):
+        attribute = getattr(self.client, name)
+        if name not in RECORDED_OPERATIONS:
+            return attribute
+
+        def recorded(**kwargs):
+            started = time.time()
+            try:
+                response = attribute(**kwargs)
+            except Exception as err:
+                error = getattr(err, 'response', None)
+                if error is not None:
+                    self.writer.write(name, started, time.time() - started,
+                                      {'operation': name, 'request': kwargs, 'error': error})
+                raise
+
+            stored = dict(response)
+            stored.pop('ResponseMetadata', None)
+            self.writer.write(name, started, time.time() - started,
+                              {'operation': name, 'request': kwargs, 'response': stored})
+            return response
+
+        return recorded
+
+
+"""
+ReplayClient serves captured responses in place of the kinesis client so the import
+can run offline against recorded traffic. Every call starts no earlier than it was
+captured relative to the first call and then waits for its recorded duration, both
+divided by speed, so the arrival rate of the traffic is kept. Speed 0 replays as fast
+as possible. Records are requested with the same shard iterators that were captured,
+iterators past the end of the capture behave like a shard without new records.
+"""
+class ReplayClient(object):
+    def __init__(self, path, speed=1.0):
+        self.speed = speed
+        self.started = None
+        self.lock = threading.Lock()
+        self.records = {}
+        self.calls = collections.defaultdict(collections.deque)
+        self.last = {}
+        self.replayed = 0
+
+        for segment in segment_paths(path):
+            for operation, elapsed, duration, buffer, offset, length in read_segment(segment):
+                entry = (elapsed, duration, buffer, offset, length)
+                if operation == 'get_shard_iterator':
+                    # iterators are requested by the shard workers concurrently
+                    payload = decode_payload(buffer, offset, length)
+                    self.calls[(operation, payload['request']['ShardId'])].append(entry)
+                else:
+                    # records are decoded lazily when their iterator is requested
+                    self.calls[operation].append(entry)
+
+    def _index_records(self, shard_iterator):
+        # decode captured get_records calls until the one for the iterator is found
+        pending = self.calls['get_records']
+        while pending and shard_iterator not in self.records:
+            elapsed, duration, buffer, offset, length = pending.popleft()
+            payload = decode_payload(buffer, offset, length)
+            self.records[payload['request']['ShardIterator']] = (elapsed, duration, payload)
+
+        return self.records.pop(shard_iterator, None)
+
+    def _replay(self, elapsed, duration, payload):
+        if self.speed:
+            with self.lock:
+                if self.started is None:
+                    self.started = time.time() - elapsed / self.speed
+            # gaps between the captured calls, then the call itself
+            wait = self.started + elapsed / self.speed - time.time()
+            time.sleep(max(0, wait) + duration / self.speed)
+        self.replayed += 1
+
+        if 'error' in payload:
+            from botocore.exceptions import ClientError
+            raise ClientError(payload['error'], payload['operation'])
+        return payload['response']
+
+    def get_records(self, ShardIterator, **kwargs):
+        with self.lock:
+            captured = self._index_records(ShardIterator)
+
+        if captured is None:
+            # end of the capture for this shard
+            return {'Records': [], 'NextShardIterator': ShardIterator, 'MillisBehindLatest': 0}
+        return self._replay(*captured)
+
+    def __getattr__(self, name):
+        if name not in RECORDED_OPERATIONS:
+            raise AttributeError(name)
+
+        def replayed(**kwargs):
+            key = (name, kwargs['ShardId']) if name == 'get_shard_iterator' else name
+            with self.lock:
+                pending = self.calls[key]
+                if pending:
+                    elapsed, duration, buffer, offset, length = pending.popleft()
+                    self.last[key] = (elapsed, duration, decode_payload(buffer, offset, length))
+                captured = self.last.get(key)
+
+            if captured is None:
+                raise ValueError('Capture has no {} calls for {}'.format(name, key))
+            return self._replay(*captured)
+
+        return replayed
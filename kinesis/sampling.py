@@ -0,0 +1,55 @@
+import collections
+
+# number of records returned by a sample
+SAMPLE_MAX_RECORDS = 100
+
+# number of shards that are read in parallel for a sample
+SAMPLE_MAX_SHARDS = 4
+
+# seconds in the past from which the sample starts
+SAMPLE_LOOKBACK = 300
+
+# seconds after which the sample returns whatever it has
+SAMPLE_TIMEOUT = 5
+
+
+def json_type(value):
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'number'
+    if isinstance(value, dict):
+        return 'object'
+    if isinstance(value, list):
+        return 'array'
+    return 'string'
+
+
+def infer_schema(records):
+    """
+    summarizes fields of the sampled records, nested objects are
+    flattened with dotted field names
+    :return: dictionary of field name to number of records with the
+    field and the counts of its types
+    """
+    fields = collections.OrderedDict()
+
+    def visit(prefix, value):
+        for name, field_value in value.items():
+            field = '{}.{}'.format(prefix, name) if prefix else name
+            summary = fields.setdefault(field, {'count': 0, 'types': {}})
+            summary['count'] += 1
+            field_type = json_type(field_value)
+            summary['types'][field_type] = summary['types'].get(field_type, 0) + 1
+            if field_type == 'object':
+                visit(field, field_value)
+
+    for record in records:
+        if isinstance(record, dict):
+            visit('', record)
+
+    return dict(fields)
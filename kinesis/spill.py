@@ -0,0 +1,143 @@
+import collections
+import mmap
+import os
+import pickle
+import struct
+import threading
+
+from .tail import Page, TAIL_POLL_INTERVAL
+
+# maximum size of the fetched pages waiting on disk, workers
+# stop fetching while it is reached
+SPILL_MAX_BYTES = 1024 * 1024 * 1024
+
+# spill file is closed and a new one is started once it reaches this size
+SPILL_SEGMENT_BYTES = 16 * 1024 * 1024
+
+ENTRY_LENGTH = struct.Struct('<I')
+
+
+"""
+SpillSegment is a single append only spill file, size is the number of
+bytes that have been written and flushed to it
+"""
+class SpillSegment(object):
+    __slots__ = ('path', 'file', 'size', 'map')
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'w+b')
+        self.size = 0
+        self.map = None
+
+    def remove(self):
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+        os.remove(self.path)
+
+
+"""
+DiskPageBuffer is a page buffer for the tail workers that keeps the fetched pages
+in local spill files instead of memory, so fetching can continue at full shard
+throughput while the destination is slower. Pages are read back in order through
+a memory map and spill files are removed once they have been drained. Checkpoints
+are moved only when pages are emitted, pages left on disk are fetched again on the
+next run, so the spill files of a previous run are removed on start.
+"""
+class DiskPageBuffer(object):
+    def __init__(self, path, max_bytes=SPILL_MAX_BYTES, segment_bytes=SPILL_SEGMENT_BYTES):
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        for name in os.listdir(path):
+            if name.endswith('.spill'):
+                os.remove(os.path.join(path, name))
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.condition = threading.Condition()
+        self.segments = collections.deque()
+        self.segment_index = 0
+        self.read_offset = 0
+        self.pending_pages = 0
+        self.pending_bytes = 0
+
+    def __len__(self):
+        return self.pending_pages
+
+    def _writable_segment(self, size):
+        if not self.segments or self.segments[-1].size + size > self.segment_bytes:
+            self.segment_index += 1
+            path = os.path.join(self.path, 'pages-{:06d}.spill'.format(self.segment_index))
+            self.segments.append(SpillSegment(path))
+        return self.segments[-1]
+
+    def put(self, page, stopped):
+        """
+        appends the page to the spill file, waits while the buffer is full
+        unless the tail has been stopped
+        :return: True if the page has been added
+        """
+        data = pickle.dumps(tuple(getattr(page, name) for name in Page.__slots__), 2)
+        entry = ENTRY_LENGTH.pack(len(data)) + data
+
+        with self.condition:
+            # a single page larger than the limit is still accepted into an empty buffer
+            while self.pending_pages and self.pending_bytes + len(entry) > self.max_bytes:
+                if stopped.is_set():
+                    return False
+                self.condition.wait(TAIL_POLL_INTERVAL)
+
+            segment = self._writable_segment(len(entry))
+            segment.file.write(entry)
+            segment.file.flush()
+            segment.size += len(entry)
+
+            self.pending_pages += 1
+            self.pending_bytes += len(entry)
+            self.condition.notify_all()
+
+        return True
+
+    def get(self, timeout=None):
+        """
+        :return: next page or None if there was no page for timeout seconds
+        """
+        with self.condition:
+            if not self.pending_pages:
+                self.condition.wait(timeout)
+            if not self.pending_pages:
+                return None
+
+            segment = self.segments[0]
+            if self.read_offset >= segment.size:
+                # drained segment, the writer has already moved to the next one
+                self.segments.popleft().remove()
+                self.read_offset = 0
+                segment = self.segments[0]
+
+            if segment.map is None or len(segment.map) < segment.size:
+                # map again to see the pages appended since the last read
+                if segment.map is not None:
+                    segment.map.close()
+                segment.map = mmap.mmap(segment.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            length, = ENTRY_LENGTH.unpack_from(segment.map, self.read_offset)
+            start = self.read_offset + ENTRY_LENGTH.size
+            data = segment.map[start:start + length]
+            self.read_offset = start + length
+
+            self.pending_pages -= 1
+            self.pending_bytes -= ENTRY_LENGTH.size + length
+            self.condition.notify_all()
+
+        return Page(*pickle.loads(data))
+
+    def close(self):
+        with self.condition:
+            while self.segments:
+                self.segments.popleft().remove()
+            self.read_offset = 0
+            self.pending_pages = 0
+            self.pending_bytes = 0
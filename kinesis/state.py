@@ -0,0 +1,192 @@
+import datetime
+import time
+
+# compact format stores every shard as a short string, dict format keeps the
+# dictionaries of the previous versions for sources that are read by them
+STATE_FORMAT_COMPACT = 'compact'
+STATE_FORMAT_DICT = 'dict'
+
+# separator of the fields in the compact format
+FIELD_SEPARATOR = ':'
+
+
+def _to_epoch(value):
+    # last processed time is a naive local datetime
+    return time.mktime(value.timetuple()) + value.microsecond / 1e6
+
+
+def _format_number(value):
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        return '{:.6f}'.format(value).rstrip('0').rstrip('.')
+    return str(value)
+
+
+"""
+ShardState is the checkpoint of a single shard. Sequence number is packed into an
+integer and times are kept as seconds since epoch, while the mapping interface still
+works with the keys of the original shard dictionaries so the workers can use either.
+Every change marks the state as dirty so only the changed shards are serialized.
+"""
+class ShardState(object):
+    __slots__ = ('sequence', 'processed', 'empty_polls', 'next_poll', 'last_polled', 'closed', 'dirty')
+
+    KEYS = ('last_sequence_number', 'last_processed', 'empty_polls', 'next_poll', 'last_polled', 'closed')
+
+    def __init__(self, last_sequence_number=None, last_processed=None, empty_polls=0, next_poll=0,
+                 last_polled=None, closed=False):
+        self.sequence = None
+        self.processed = None
+        self.empty_polls = empty_polls
+        self.next_poll = next_poll
+        self.last_polled = last_polled
+        self.closed = closed
+        self['last_sequence_number'] = last_sequence_number
+        self['last_processed'] = last_processed
+        self.dirty = True
+
+    def __getitem__(self, key):
+        if key == 'last_sequence_number':
+            return str(self.sequence) if self.sequence is not None else None
+        if key == 'last_processed':
+            return datetime.datetime.fromtimestamp(self.processed) if self.processed is not None else None
+        if key in self.KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key == 'last_sequence_number':
+            self.sequence = int(value) if value is not None else None
+        elif key == 'last_processed':
+            self.processed = _to_epoch(value) if isinstance(value, datetime.datetime) else value
+        elif key in self.KEYS:
+            setattr(self, key, value)
+        else:
+            raise KeyError(key)
+        self.dirty = True
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, ShardState):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'ShardState({!r})'.format(self.to_dict())
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        # optional fields are present only when they differ from their defaults
+        keys = ['last_sequence_number', 'last_processed']
+        if self.empty_polls:
+            keys.append('empty_polls')
+        if self.next_poll:
+            keys.append('next_poll')
+        if self.last_polled is not None:
+            keys.append('last_polled')
+        if self.closed:
+            keys.append('closed')
+        return keys
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def copy(self):
+        return ShardState(**self.to_dict())
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def encode(self):
+        """
+        :return: compact string of the state, sequence number is hexadecimal
+        """
+        fields = [
+            '{:x}'.format(self.sequence) if self.sequence is not None else '',
+            _format_number(self.processed),
+            _format_number(self.empty_polls or None),
+            _format_number(self.next_poll or None),
+            _format_number(self.last_polled),
+            '1' if self.closed else ''
+        ]
+        return FIELD_SEPARATOR.join(fields).rstrip(FIELD_SEPARATOR)
+
+    @staticmethod
+    def decode(value):
+        """
+        creates state from the compact string or from the shard dictionary of previous versions
+        """
+        if isinstance(value, ShardState):
+            state = value.copy()
+        elif isinstance(value, dict):
+            state = ShardState(**value)
+        else:
+            fields = value.split(FIELD_SEPARATOR) + [''] * len(ShardState.KEYS)
+            state = ShardState(
+                last_sequence_number=int(fields[0], 16) if fields[0] else None,
+                last_processed=float(fields[1]) if fields[1] else None,
+                empty_polls=int(fields[2]) if fields[2] else 0,
+                next_poll=float(fields[3]) if fields[3] else 0,
+                last_polled=float(fields[4]) if fields[4] else None,
+                closed=fields[5] == '1'
+            )
+        state.dirty = False
+        return state
+
+
+def load_shards(value):
+    """
+    :param value: persisted shards in compact or dict format
+    :return: dictionary of shard id to ShardState
+    """
+    return dict((shard_id, ShardState.decode(state)) for shard_id, state in (value or {}).items())
+
+
+"""
+ShardStateEncoder keeps the persisted form of the shards, on every update only
+the shards that have changed are encoded again and removed shards are dropped
+"""
+class ShardStateEncoder(object):
+    def __init__(self, persisted=None, state_format=STATE_FORMAT_COMPACT):
+        self.state_format = state_format
+        self.encoded = {}
+
+        persisted = persisted or {}
+        for shard_id, value in persisted.items():
+            # compact states can be kept as they are, others are migrated
+            if state_format == STATE_FORMAT_COMPACT and not isinstance(value, (dict, ShardState)):
+                self.encoded[shard_id] = value
+            else:
+                self.encoded[shard_id] = self._encode(ShardState.decode(value))
+
+    def _encode(self, state):
+        return state.encode() if self.state_format == STATE_FORMAT_COMPACT else state.to_dict()
+
+    def update(self, shards):
+        """
+        :param shards: dictionary of shard id to ShardState
+        :return: list of shard ids that have changed
+        """
+        changed = []
+        for shard_id, state in shards.items():
+            if state.dirty or shard_id not in self.encoded:
+                self.encoded[shard_id] = self._encode(state)
+                state.dirty = False
+                changed.append(shard_id)
+
+        for shard_id in [shard_id for shard_id in self.encoded if shard_id not in shards]:
+            del self.encoded[shard_id]
+            changed.append(shard_id)
+
+        return changed
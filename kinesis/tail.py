@@ -0,0 +1,125 @@
+from __future__ import division
+
+import calendar
+import collections
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+# GetRecords allows up to 5 calls per second for every shard
+TAIL_POLL_INTERVAL = 0.2
+
+# seconds between the first fetched record and emitting the micro batch
+TAIL_MAX_LATENCY = 1.0
+
+# maximum number of fetched pages waiting to be emitted, workers
+# block when it is reached so memory stays bounded
+TAIL_MAX_PAGES = 1000
+
+# number of most recent latency samples used for percentiles
+LATENCY_SAMPLES = 10000
+
+
+def to_epoch(value):
+    """
+    converts arrival timestamp from the API response to seconds since epoch
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    return calendar.timegm(value.utctimetuple()) + value.microsecond / 1e6
+
+
+"""
+Page is a single decoded GetRecords response of one shard that is waiting to be
+emitted, sequence number is committed to the shard checkpoint only after the
+page has been returned from read(). Generation identifies the worker that has
+fetched the page, pages of a worker that has been replaced are not emitted.
+"""
+class Page(object):
+    __slots__ = ('shard_id', 'records', 'last_sequence_number', 'byte_count', 'arrivals', 'fetched_at',
+                 'metadata', 'generation')
+
+    def __init__(self, shard_id, records, last_sequence_number, byte_count=0, arrivals=None, fetched_at=None,
+                 metadata=None, generation=None):
+        self.shard_id = shard_id
+        self.records = records
+        self.metadata = metadata or []
+        self.last_sequence_number = last_sequence_number
+        self.byte_count = byte_count
+        self.arrivals = arrivals or []
+        self.fetched_at = fetched_at or time.time()
+        self.generation = generation
+
+
+"""
+MemoryPageBuffer is a bounded FIFO between the tail workers and read(),
+pages of every shard keep their order
+"""
+class MemoryPageBuffer(object):
+    def __init__(self, max_pages=TAIL_MAX_PAGES):
+        self.queue = queue.Queue(max_pages)
+
+    def put(self, page, stopped):
+        """
+        waits for free space in the buffer unless the tail has been stopped
+        :return: True if the page has been added
+        """
+        while not stopped.is_set():
+            try:
+                self.queue.put(page, timeout=TAIL_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def get(self, timeout=None):
+        """
+        :return: next page or None if there was no page for timeout seconds
+        """
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def __len__(self):
+        return self.queue.qsize()
+
+
+"""
+LatencyTracker keeps recent arrival to emit latencies in seconds
+and reports their percentiles
+"""
+class LatencyTracker(object):
+    def __init__(self, size=LATENCY_SAMPLES):
+        self.samples = collections.deque(maxlen=size)
+        self.lock = threading.Lock()
+        self.count = 0
+
+    def add(self, arrivals, emitted_at=None):
+        emitted_at = emitted_at or time.time()
+        with self.lock:
+            for arrival in arrivals:
+                self.samples.append(max(0.0, emitted_at - arrival))
+            self.count += len(arrivals)
+
+    def percentiles(self, points=(50, 90, 99)):
+        """
+        :return: dictionary with requested percentiles, max and number of samples
+        """
+        with self.lock:
+            samples = sorted(self.samples)
+
+        result = {'count': self.count}
+        if not samples:
+            return result
+
+        for point in points:
+            index = min(len(samples) - 1, int(round(point / 100 * (len(samples) - 1))))
+            result['p{}'.format(point)] = samples[index]
+        result['max'] = samples[-1]
+
+        return result
@@ -0,0 +1,83 @@
+import time
+
+# number of consecutive empty polls after which a shard becomes cold
+COLD_AFTER = 3
+
+# poll interval of a shard that has just become cold, in seconds
+COLD_BASE_INTERVAL = 30
+
+# longest poll interval of a cold shard, it is far below the minimal 24 hours
+# retention so the records are still available once the shard is polled
+COLD_MAX_INTERVAL = 900
+
+# shard iterators expire after 5 minutes, tail workers never wait longer
+TAIL_MAX_WAIT = 240
+
+TIER_HOT = 'hot'
+TIER_WARM = 'warm'
+TIER_COLD = 'cold'
+
+
+"""
+ShardTiers classifies shards by their recent yield. Shards that returned records
+on the last poll are hot, shards with a few empty polls are warm and are still
+polled on every read, shards that keep being empty are cold and are polled with
+exponentially longer intervals. A cold shard is promoted back to hot on the
+first poll that returns records. The state is kept in the shard data so it is
+persisted together with the checkpoints.
+"""
+class ShardTiers(object):
+    def __init__(self, cold_after=COLD_AFTER,
+                 base_interval=COLD_BASE_INTERVAL,
+                 max_interval=COLD_MAX_INTERVAL):
+        self.cold_after = cold_after
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+
+    def tier(self, shard_data):
+        empty_polls = shard_data.get('empty_polls', 0)
+        if empty_polls == 0:
+            return TIER_HOT
+        if empty_polls < self.cold_after:
+            return TIER_WARM
+        return TIER_COLD
+
+    def interval(self, shard_data):
+        """
+        :return: seconds to wait before the shard is polled again
+        """
+        empty_polls = shard_data.get('empty_polls', 0)
+        if empty_polls < self.cold_after:
+            return 0
+        return min(self.base_interval * 2 ** (empty_polls - self.cold_after), self.max_interval)
+
+    def is_due(self, shard_data, now=None):
+        now = now or time.time()
+        return shard_data.get('next_poll', 0) <= now
+
+    def update(self, shard_data, had_records, polled_at=None):
+        """
+        updates the tier of the shard after it has been polled
+        :param had_records: whether the poll returned any record
+        :param polled_at: time when the shard iterator was created, shards that have
+        never returned records continue from this time so nothing is skipped
+        """
+        now = time.time()
+        if had_records:
+            shard_data['empty_polls'] = 0
+            shard_data['next_poll'] = 0
+        else:
+            shard_data['empty_polls'] = shard_data.get('empty_polls', 0) + 1
+            shard_data['next_poll'] = now + self.interval(shard_data)
+
+        if polled_at is not None:
+            shard_data['last_polled'] = polled_at
+
+    def counts(self, shards):
+        """
+        :return: number of shards in every tier
+        """
+        counts = {TIER_HOT: 0, TIER_WARM: 0, TIER_COLD: 0}
+        for shard_data in shards.values():
+            counts[self.tier(shard_data)] += 1
+        return counts
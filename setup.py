@@ -17,5 +17,8 @@ setup(
     package_dir={"panoply": ""},
     packages=[
         "panoply.kinesis"
-    ]
+    ],
+    package_data={
+        "panoply.kinesis": ["icon.png"]
+    }
 )
@@ -1,6 +1,17 @@
+import base64
 import copy
+import datetime
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
-import botocore
+import zlib
+import botocore.client
 import panoply
 from botocore.exceptions import ClientError
 from mock import patch
@@ -38,6 +49,14 @@ def create_response(acting_operation_name, response_data=None, raise_exception=F
     return mock_make_api_call
 
 
+SOURCE = {
+    'aws_access_key_id': 'accesskey34535345',
+    'aws_secret_access_key': 'secretaccess34645365465',
+    'region_name': 'us-east-1',
+    'stream_name': 'KinesisStream-1J0FOY3HR4F5Q'
+}
+
+
 def prepare_processing_data():
     single_shard_stream = copy.deepcopy(test_fixtures.stream_details)
     single_shard_stream['StreamDescription']['Shards'] = [
@@ -80,6 +99,10 @@ def prepare_processing_data():
 
 
 class TestKinesis(unittest.TestCase):
+    def setUp(self):
+        # stream lists are cached per credentials between the calls
+        kinesis.kinesis.discovery.clear()
+
     def test_wrong_access_key(self):
         credentials = {
             'aws_access_key_id': 'accesskey34535345',
@@ -187,6 +210,851 @@ class TestKinesis(unittest.TestCase):
         self.assertEqual(data[0]['resource'], '/index.html')
 
 
+class TestBatchBudget(unittest.TestCase):
+    def _read(self, options):
+        stream = KinesisStream(source=copy.deepcopy(SOURCE), options=options)
+
+        # the shard is still behind but there is no response after the first page
+        operation_content = prepare_processing_data()[:3]
+        response_method = create_response(operation_content)
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            data = stream.read()
+
+        return stream, data
+
+    def test_byte_budget_stops_at_page_boundary(self):
+        stream, data = self._read({'batch_max_bytes': 10})
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(stream.batch_bytes, 126)
+
+    def test_record_budget_stops_at_page_boundary(self):
+        stream, data = self._read({'batch_max_size': 2})
+
+        self.assertEqual(len(data), 2)
+
+    def test_budget_is_divided_over_read_shards(self):
+        operation_content = prepare_processing_data()
+        shards = operation_content[0]['response']['StreamDescription']['Shards']
+        shards.append(dict(copy.deepcopy(shards[0]), ShardId='shardId-000000000007'))
+        source = dict(copy.deepcopy(SOURCE), shards={
+            'shardId-000000000007': {'last_sequence_number': '1', 'last_processed': None, 'closed': True}
+        })
+        stream = KinesisStream(source=source, options={'batch_max_size': 2})
+        requests = []
+
+        def response_method(self, operation_name, kwarg):
+            requests.append((operation_name, kwarg))
+            return operation_content.pop(0)['response']
+
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            data = stream.read()
+
+        # the closed shard doesn't take a share of the budget
+        self.assertEqual(len(data), 2)
+        self.assertEqual(requests[2], ('GetRecords', {'ShardIterator': test_fixtures.iterator_response['ShardIterator'],
+                                                      'Limit': 2}))
+
+
+class TestShardTiers(unittest.TestCase):
+    def test_cold_shard_backs_off_and_is_promoted(self):
+        tiers = kinesis.kinesis.ShardTiers(cold_after=2, base_interval=10, max_interval=40)
+        shard_data = {'last_sequence_number': '1', 'last_processed': None}
+
+        for _ in range(2):
+            tiers.update(shard_data, False, polled_at=100)
+        self.assertEqual(tiers.tier(shard_data), 'cold')
+        self.assertEqual(tiers.interval(shard_data), 10)
+        self.assertFalse(tiers.is_due(shard_data))
+
+        for _ in range(5):
+            tiers.update(shard_data, False)
+        self.assertEqual(tiers.interval(shard_data), 40)
+
+        tiers.update(shard_data, True)
+        self.assertEqual(tiers.tier(shard_data), 'hot')
+        self.assertTrue(tiers.is_due(shard_data))
+
+    def test_skipped_shard_continues_from_last_poll(self):
+        source = dict(copy.deepcopy(SOURCE), shards={
+            'shardId-000000000002': {
+                'last_sequence_number': '49576779325192435059829537036290334312001617382801932322',
+                'last_processed': None,
+                'empty_polls': 5,
+                'next_poll': 0,
+                'last_polled': 1505203370.0
+            }
+        })
+        stream = KinesisStream(source=source, options={'shard_tiers': True})
+        requests = []
+
+        def response_method(self, operation_name, kwarg):
+            requests.append((operation_name, kwarg))
+            return prepare_processing_data()[len(requests) - 1]['response']
+
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            data = stream.read()
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(requests[1][1]['ShardIteratorType'], 'AT_TIMESTAMP')
+        self.assertEqual(stream.shards['shardId-000000000002']['empty_polls'], 0)
+
+    def test_failed_poll_keeps_last_poll_time(self):
+        source = dict(copy.deepcopy(SOURCE), shards={
+            'shardId-000000000002': {
+                'last_sequence_number': '49576779325192435059829537036290334312001617382801932322',
+                'last_processed': None,
+                'empty_polls': 5,
+                'next_poll': 0,
+                'last_polled': 1000.0
+            }
+        })
+        stream = KinesisStream(source=source, options={'shard_tiers': True})
+        operation_content = prepare_processing_data()[:2] + [{
+            'name': 'GetRecords',
+            'response': {'Error': {'Code': 'InternalFailure', 'Message': 'InternalFailure'}},
+            'raise_exception': True
+        }]
+
+        response_method = create_response(operation_content)
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            self.assertIsNone(stream.read())
+
+        # the records since the last poll are read on the next one
+        self.assertEqual(stream.shards['shardId-000000000002']['last_polled'], 1000.0)
+        self.assertEqual(stream.shards['shardId-000000000002']['empty_polls'], 5)
+
+
+class TestShardState(unittest.TestCase):
+    SHARDS = {
+        'shardId-000000000000': {
+            'last_sequence_number': '49576779325192435059829537036290334312001617382801932322',
+            'last_processed': datetime.datetime(2017, 9, 12, 8, 2, 50, 125000)
+        },
+        'shardId-000000000002': {
+            'last_sequence_number': '49576779325192435059829537036290334312001617382801932322',
+            'last_processed': None
+        }
+    }
+
+    def _source(self):
+        return dict(copy.deepcopy(SOURCE), shards=copy.deepcopy(self.SHARDS))
+
+    def test_dict_state_is_persisted_compact(self):
+        source = self._source()
+        stream = KinesisStream(source=source, options={})
+
+        self.assertEqual(stream.shards, self.SHARDS)
+        self.assertEqual(source['shards']['shardId-000000000002'], '2059b10f3d2000000000000000000059b10f3d000000022')
+
+        response_method = create_response(prepare_processing_data())
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            data = stream.read()
+
+        # only the read shard is encoded again, the parent has been retired
+        self.assertEqual(len(data), 2)
+        self.assertEqual(sorted(stream.changed_shards), ['shardId-000000000000', 'shardId-000000000002'])
+        self.assertEqual(list(source['shards']), ['shardId-000000000002'])
+        self.assertEqual(kinesis.kinesis.load_shards(source['shards']), stream.shards)
+
+    def test_dict_state_format_is_kept(self):
+        source = self._source()
+        stream = KinesisStream(source=source, options={'shard_state': 'dict'})
+        stream.save_shards()
+
+        self.assertEqual(stream.changed_shards, [])
+        self.assertEqual(source['shards'], self.SHARDS)
+
+    def test_closed_shard_is_not_read_again(self):
+        source = self._source()
+        stream = KinesisStream(source=source, options={})
+        shard_stream, iterator = [item['response'] for item in prepare_processing_data()[:2]]
+        requests = []
+
+        def response_method(self, operation_name, kwarg):
+            requests.append(operation_name)
+            return {'DescribeStream': shard_stream, 'GetShardIterator': iterator,
+                    'GetRecords': test_fixtures.shard_that_is_closed}[operation_name]
+
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            self.assertIsNone(stream.read())
+            self.assertIsNone(stream.read())
+
+        self.assertTrue(stream.shards['shardId-000000000002']['closed'])
+        self.assertEqual(requests, ['DescribeStream', 'GetShardIterator', 'GetRecords', 'DescribeStream'])
+
+    def test_last_page_of_closed_shard_is_read(self):
+        source = self._source()
+        stream = KinesisStream(source=source, options={})
+        last_page = dict(test_fixtures.shard_with_records, NextShardIterator=None)
+        operation_content = prepare_processing_data()[:2] + [{'name': 'GetRecords', 'response': last_page}]
+
+        response_method = create_response(operation_content)
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            data = stream.read()
+
+        self.assertEqual(len(data), 2)
+        self.assertTrue(stream.shards['shardId-000000000002']['closed'])
+        self.assertEqual(stream.shards['shardId-000000000002']['last_sequence_number'],
+                         last_page['Records'][-1]['SequenceNumber'])
+
+    def test_last_page_of_closed_shard_is_tailed(self):
+        stream = KinesisStream(source=self._source(), options={
+            'tail': {'max_latency': 0.05, 'poll_interval': 0.01, 'idle_timeout': 0.2}
+        })
+        shard_stream, iterator = [item['response'] for item in prepare_processing_data()[:2]]
+        last_page = dict(test_fixtures.shard_with_records, NextShardIterator=None)
+        responses = {'DescribeStream': shard_stream, 'GetShardIterator': iterator, 'GetRecords': last_page}
+
+        with patch('botocore.client.BaseClient._make_api_call',
+                   new=lambda self, operation_name, kwarg: responses[operation_name]):
+            data = stream.read()
+            stream.stop_tail()
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(stream.shards['shardId-000000000002']['last_sequence_number'],
+                         last_page['Records'][-1]['SequenceNumber'])
+
+    def test_shards_are_listed_in_pages(self):
+        stream = KinesisStream(source=self._source(), options={})
+        first_page = prepare_processing_data()[0]['response']
+        first_page['StreamDescription']['HasMoreShards'] = True
+        requests = []
+
+        def response_method(self, operation_name, kwarg):
+            requests.append(kwarg)
+            return first_page if len(requests) == 1 else test_fixtures.stream_details
+
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            shards = stream.get_stream_shards(stream.stream_name)
+
+        self.assertEqual(len(shards), 1 + len(test_fixtures.stream_details['StreamDescription']['Shards']))
+        self.assertEqual(requests[1]['ExclusiveStartShardId'], 'shardId-000000000002')
+
+
+class TestSpill(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_pages_are_drained_in_order_from_disk(self):
+        from kinesis.spill import DiskPageBuffer
+        from kinesis.tail import Page
+
+        stopped = threading.Event()
+        buffer = DiskPageBuffer(self.path, max_bytes=10 ** 6, segment_bytes=200)
+        for i in range(5):
+            buffer.put(Page('shard-1', [{'id': i}], str(i), byte_count=10, arrivals=[float(i)]), stopped)
+
+        # small segments rotate, drained ones are removed while reading
+        self.assertGreater(len(os.listdir(self.path)), 1)
+        pages = [buffer.get(timeout=0) for _ in range(5)]
+        self.assertEqual([page.records[0]['id'] for page in pages], list(range(5)))
+        self.assertEqual(pages[-1].last_sequence_number, '4')
+        self.assertIsNone(buffer.get(timeout=0))
+        self.assertEqual(len(os.listdir(self.path)), 1)
+
+    def test_full_buffer_stops_fetching(self):
+        from kinesis.spill import DiskPageBuffer
+        from kinesis.tail import Page
+
+        stopped = threading.Event()
+        buffer = DiskPageBuffer(self.path, max_bytes=100)
+        self.assertTrue(buffer.put(Page('shard-1', [{'id': 'x' * 100}], '1'), stopped))
+
+        stopped.set()
+        self.assertFalse(buffer.put(Page('shard-1', [{'id': 'y'}], '2'), stopped))
+        self.assertEqual(len(buffer), 1)
+
+
+class TestArrivalOrder(unittest.TestCase):
+    def _page(self, shard_id, arrivals, first_sequence):
+        from kinesis.ordering import RecordMeta
+        from kinesis.tail import Page
+
+        metadata = [RecordMeta(arrival, str(first_sequence + i), 'key') for i, arrival in enumerate(arrivals)]
+        records = [{'shard': shard_id, 'arrival': arrival} for arrival in arrivals]
+        return Page(shard_id, records, metadata[-1].sequence_number, metadata=metadata)
+
+    def test_shards_are_merged_by_arrival(self):
+        from kinesis.ordering import merge_by_arrival
+
+        first = self._page('shard-1', [1.0, 3.0, 5.0], 10)
+        second = self._page('shard-2', [2.0, 4.0], 20)
+        records = merge_by_arrival([(first.records, first.metadata), (second.records, second.metadata)])
+
+        self.assertEqual([record['arrival'] for record in records], [1.0, 2.0, 3.0, 4.0, 5.0])
+
+    def test_pages_are_completed_after_watermark(self):
+        from kinesis.ordering import ArrivalOrderBuffer
+
+        buffer = ArrivalOrderBuffer(lateness=1.0)
+        buffer.add_page(self._page('shard-1', [1.0, 3.0], 10))
+        buffer.add_page(self._page('shard-2', [2.0], 20))
+
+        records = buffer.pop_ready(watermark=2.5)
+        self.assertEqual([record['arrival'] for record in records], [1.0, 2.0])
+        self.assertEqual([page.shard_id for page in buffer.completed_pages()], ['shard-2'])
+
+        records = buffer.pop_ready()
+        self.assertEqual([record['arrival'] for record in records], [3.0])
+        self.assertEqual([page.last_sequence_number for page in buffer.completed_pages()], ['11'])
+
+    def test_records_above_max_held_are_emitted(self):
+        from kinesis.ordering import ArrivalOrderBuffer
+
+        buffer = ArrivalOrderBuffer(lateness=1.0, max_held=2)
+        buffer.add_page(self._page('shard-1', [1.0, 3.0, 5.0, 7.0], 10))
+
+        records = buffer.pop_ready(watermark=0.0)
+        self.assertEqual([record['arrival'] for record in records], [1.0, 3.0])
+        self.assertEqual(len(buffer), 2)
+        self.assertEqual(buffer.completed_pages(), [])
+
+    def test_stalled_shard_does_not_hold_records_unbounded(self):
+        options = {'tail': True, 'arrival_order': {'lateness': 1.0, 'max_held': 3}}
+        stream = KinesisStream(source=copy.deepcopy(SOURCE), options=options)
+
+        class Worker(object):
+            def __init__(self, watermark):
+                self.watermark = watermark
+                self.poison_count = 0
+
+            def is_alive(self):
+                return True
+
+        # shard-2 never hands over a page, its watermark stays behind
+        stream.tail_workers = {'shard-1': Worker(100.0), 'shard-2': Worker(10.0)}
+        for first_sequence in range(10, 50, 5):
+            arrivals = [float(first_sequence + i) for i in range(5)]
+            stream._emit_pages([self._page('shard-1', arrivals, first_sequence)], watermark=stream._event_watermark())
+            self.assertLessEqual(len(stream.arrival_order), 3)
+
+    def test_tail_watermark_follows_slowest_shard(self):
+        stream = KinesisStream(source=copy.deepcopy(SOURCE), options={'tail': True, 'arrival_order': {'lateness': 1.0}})
+
+        class Worker(object):
+            def __init__(self, watermark):
+                self.watermark = watermark
+                self.poison_count = 0
+
+            def is_alive(self):
+                return True
+
+        # both shards are catching up, far behind the wall clock
+        stream.tail_workers = {'shard-1': Worker(100.0), 'shard-2': Worker(50.0)}
+        records = stream._emit_pages([self._page('shard-1', [60.0, 100.0], 10)], watermark=stream._event_watermark())
+        self.assertEqual(records, [])
+
+        stream.tail_workers['shard-2'].watermark = 200.0
+        records = stream._emit_pages([self._page('shard-2', [55.0, 200.0], 20)], watermark=stream._event_watermark())
+        self.assertEqual([record['arrival'] for record in records], [55.0, 60.0])
+        self.assertEqual(stream._event_watermark(), 99.0)
+
+
+class TestPartitionGrouping(unittest.TestCase):
+    def _read(self, group):
+        stream = KinesisStream(source=copy.deepcopy(SOURCE), options={'group_by_partition': group})
+
+        response_method = create_response(prepare_processing_data())
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            return stream.read()
+
+    def test_records_are_grouped_by_partition_key(self):
+        data = self._read(True)
+
+        self.assertEqual(list(data.keys()), ['/index.html'])
+        self.assertEqual([record['referrer'] for record in data['/index.html']],
+                         ['http://www.facebook.com', 'http://www.google.com'])
+
+    def test_records_are_hashed_into_buckets(self):
+        data = self._read({'buckets': 4})
+        bucket = kinesis.kinesis.PartitionBuckets(4).bucket('/index.html')
+
+        self.assertEqual(list(data.keys()), [bucket])
+        self.assertEqual(len(data[bucket]), 2)
+
+
+class TestTail(unittest.TestCase):
+    def test_micro_batch_is_emitted_and_committed(self):
+        source = copy.deepcopy(SOURCE)
+        stream = KinesisStream(source=source, options={
+            'tail': {'max_latency': 0.05, 'poll_interval': 0.01, 'idle_timeout': 0.2}
+        })
+        shard_stream, iterator, first_page = [item['response'] for item in prepare_processing_data()[:3]]
+        responses = {'DescribeStream': [shard_stream], 'GetShardIterator': [iterator], 'GetRecords': [first_page]}
+
+        def response_method(self, operation_name, kwarg):
+            # the shard stays up to date and empty after the first page
+            pending = responses[operation_name]
+            return pending.pop(0) if pending else test_fixtures.shard_no_records
+
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            data = stream.read()
+            idle = stream.read()
+            stream.stop_tail()
+
+        self.assertEqual(len(data), 2)
+        self.assertIsNone(idle)
+        self.assertEqual(stream.shards['shardId-000000000002']['last_sequence_number'],
+                         test_fixtures.shard_with_records['Records'][-1]['SequenceNumber'])
+        self.assertEqual(stream.latency.percentiles()['count'], 2)
+
+    def test_pages_of_replaced_worker_are_dropped(self):
+        source = copy.deepcopy(SOURCE)
+        stream = KinesisStream(source=source, options={
+            'tail': {'max_latency': 0.05, 'poll_interval': 0.01, 'idle_timeout': 0.2, 'shard_refresh': 0}
+        })
+        shard_stream, iterator, first_page = [item['response'] for item in prepare_processing_data()[:3]]
+        failure = ClientError({'Error': {'Code': 'InternalFailure', 'Message': 'InternalFailure'}}, 'GetRecords')
+        responses = {'DescribeStream': [shard_stream] * 2, 'GetShardIterator': [iterator] * 2,
+                     'GetRecords': [first_page, failure, first_page]}
+
+        def response_method(self, operation_name, kwarg):
+            pending = responses[operation_name]
+            response = pending.pop(0) if pending else test_fixtures.shard_no_records
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            # the first worker fails after its page, the replacement fetches it again
+            stream._start_tail_workers()
+            time.sleep(0.1)
+            data = stream.read()
+            idle = stream.read()
+            stream.stop_tail()
+
+        self.assertEqual(len(data), 2)
+        self.assertIsNone(idle)
+        self.assertEqual(stream.tail_generations['shardId-000000000002'], 2)
+
+        # an older page never moves the checkpoint back
+        last_sequence_number = first_page['Records'][-1]['SequenceNumber']
+        stream._emit_pages([kinesis.kinesis.Page('shardId-000000000002', [], first_page['Records'][0]['SequenceNumber'],
+                                                 generation=2)])
+        self.assertEqual(stream.shards['shardId-000000000002']['last_sequence_number'], last_sequence_number)
+
+    def test_buffered_pages_are_not_deduplicated_after_restart(self):
+        source = copy.deepcopy(SOURCE)
+        options = {'batch_max_size': 2, 'dedup': {'capacity': 1000},
+                   'tail': {'max_latency': 0.05, 'poll_interval': 0.01, 'idle_timeout': 0.2}}
+        shard_stream, iterator, first_page = [item['response'] for item in prepare_processing_data()[:3]]
+        second_page = copy.deepcopy(first_page)
+        for record in second_page['Records']:
+            record['SequenceNumber'] = str(int(record['SequenceNumber']) + 10)
+        pages = []
+
+        def response_method(self, operation_name, kwarg):
+            if operation_name == 'DescribeStream':
+                return shard_stream
+            if operation_name == 'GetShardIterator':
+                # the restarted worker continues after the first page
+                pages[:] = [second_page] if 'StartingSequenceNumber' in kwarg else [first_page, second_page]
+                return iterator
+            return pages.pop(0) if pages else test_fixtures.shard_no_records
+
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            stream = KinesisStream(source=source, options=options)
+            stream._start_tail_workers()
+            time.sleep(0.1)
+            self.assertEqual(len(stream.read()), 2)
+            stream.stop_tail()
+
+            # the second page was fetched but not emitted, it is fetched again
+            restarted = KinesisStream(source=source, options=options)
+            data = restarted.read()
+            restarted.stop_tail()
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(restarted.deduplicator.duplicates, 0)
+        self.assertEqual(restarted.shards['shardId-000000000002']['last_sequence_number'],
+                         second_page['Records'][-1]['SequenceNumber'])
+
+
+class TestPoisonRecords(unittest.TestCase):
+    def test_malformed_record_is_quarantined(self):
+        dead_letters = []
+        source = copy.deepcopy(SOURCE)
+        stream = KinesisStream(source=source, options={'dead_letter': dead_letters.append})
+
+        operation_content = prepare_processing_data()
+        page = copy.deepcopy(test_fixtures.shard_with_records)
+        page['Records'].insert(1, {
+            'SequenceNumber': '49576779335963694990727001090817406802334139341271465106',
+            'ApproximateArrivalTimestamp': page['Records'][0]['ApproximateArrivalTimestamp'],
+            'Data': b'{"resource":"/index.html", "referrer":',
+            'PartitionKey': '/index.html'
+        })
+        operation_content[2]['response'] = page
+
+        response_method = create_response(operation_content)
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            data = stream.read()
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(stream.poison_records, 1)
+        self.assertEqual(dead_letters[0]['sequence_number'], page['Records'][1]['SequenceNumber'])
+        self.assertEqual(dead_letters[0]['data'], 'eyJyZXNvdXJjZSI6Ii9pbmRleC5odG1sIiwgInJlZmVycmVyIjo=')
+        self.assertEqual(stream.shards['shardId-000000000002']['last_sequence_number'],
+                         page['Records'][-1]['SequenceNumber'])
+
+
+class TestWorkerFailure(unittest.TestCase):
+    def _read(self, pages):
+        stream = KinesisStream(source=copy.deepcopy(SOURCE), options={})
+        operation_content = prepare_processing_data()[:2] + [{'name': 'GetRecords', 'response': page} for page in pages]
+        response_method = create_response(operation_content)
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            return stream.read()
+
+    def test_partial_records_are_returned(self):
+        # malformed response after the first page fails the worker
+        data = self._read([test_fixtures.shard_with_records, {'Records': [], 'NextShardIterator': 'iterator'}])
+
+        self.assertEqual(len(data), 2)
+
+    def test_failure_without_records_is_raised(self):
+        with self.assertRaises(panoply.PanoplyException) as context:
+            self._read([{'Records': [], 'NextShardIterator': 'iterator'}])
+
+        self.assertIn('shardId-000000000002', str(context.exception))
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_captured_traffic_is_replayed(self):
+        stream = KinesisStream(source=copy.deepcopy(SOURCE), options={'capture': self.path})
+        response_method = create_response(prepare_processing_data())
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            captured = stream.read()
+        stream.client.writer.close()
+
+        # nothing is patched, every call is served from the capture
+        replayed_stream = KinesisStream(source=copy.deepcopy(SOURCE),
+                                        options={'replay': {'path': self.path, 'speed': 0}})
+        replayed = replayed_stream.read()
+
+        self.assertEqual(replayed, captured)
+        self.assertEqual(replayed_stream.client.replayed, 4)
+
+    def test_capture_is_json(self):
+        from kinesis.replay import SegmentWriter, read_segment, segment_paths
+
+        writer = SegmentWriter(self.path)
+        writer.write('get_records', writer.started, 0.01,
+                     {'request': {'ShardIterator': 'iterator'}, 'response': test_fixtures.shard_with_records})
+        writer.close()
+
+        _, _, _, buffer, offset, length = next(read_segment(segment_paths(self.path)[0]))
+        payload = json.loads(zlib.decompress(buffer[offset:offset + length]).decode('utf-8'))
+        self.assertEqual(payload['response']['Records'][0]['Data'],
+                         {'$base64': 'eyJyZXNvdXJjZSI6Ii9pbmRleC5odG1sIiwgInJlZmVycmVyIjoiaHR0cDovL3d3dy5mYWNlYm9vay5jb20ifQ=='})
+
+        replayed = kinesis.kinesis.ReplayClient(self.path, speed=0).get_records(ShardIterator='iterator')
+        records = test_fixtures.shard_with_records['Records']
+        self.assertEqual([record['Data'] for record in replayed['Records']], [record['Data'] for record in records])
+        self.assertEqual(replayed['Records'][0]['ApproximateArrivalTimestamp'], records[0]['ApproximateArrivalTimestamp'])
+
+        # pickled captures of the previous format are rejected
+        with open(os.path.join(self.path, 'segment-000000.kseg'), 'wb') as segment:
+            segment.write(b'KSEG\x01')
+            segment.write(b'\x00' * 64)
+        with self.assertRaises(ValueError):
+            kinesis.kinesis.ReplayClient(self.path)
+
+    def test_gaps_between_calls_are_replayed(self):
+        from kinesis.replay import SegmentWriter
+
+        writer = SegmentWriter(self.path)
+        for elapsed in (0, 0.2):
+            writer.write('list_streams', writer.started + elapsed, 0,
+                         {'request': {}, 'response': test_fixtures.stream_list})
+        writer.close()
+
+        client = kinesis.kinesis.ReplayClient(self.path, speed=2)
+        client.list_streams()
+        started = time.time()
+        client.list_streams()
+
+        self.assertGreaterEqual(time.time() - started, 0.08)
+
+
+class TestConcurrency(unittest.TestCase):
+    def _window(self, controller, calls, latency, throttled=False):
+        for _ in range(calls):
+            controller.acquire()
+        for _ in range(calls):
+            controller.release(latency, throttled=throttled, record_count=25)
+
+    def test_limit_is_increased_and_halved_on_throttling(self):
+        controller = kinesis.kinesis.ConcurrencyController(initial=4, maximum=8, window=4)
+
+        self._window(controller, 4, 0.01)
+        self.assertEqual(controller.metrics()['limit'], 5)
+
+        self._window(controller, 4, 0.01, throttled=True)
+        self.assertEqual(controller.metrics()['limit'], 2)
+        self.assertEqual(controller.metrics()['throttle_rate'], 1.0)
+
+    def test_limit_is_lowered_on_rising_latency(self):
+        controller = kinesis.kinesis.ConcurrencyController(initial=4, window=4)
+
+        self._window(controller, 4, 0.01)
+        self._window(controller, 4, 0.05)
+        self.assertEqual(controller.metrics()['limit'], 4)
+
+    def test_mixed_call_latencies_are_not_congestion(self):
+        controller = kinesis.kinesis.ConcurrencyController(initial=4, window=4)
+
+        # fast calls of empty shards next to slower calls returning pages
+        for _ in range(10):
+            for latency in (0.01, 0.08, 0.01, 0.08):
+                controller.acquire()
+                controller.release(latency, record_count=25)
+
+        self.assertGreaterEqual(controller.metrics()['limit'], 4)
+
+    def test_history_keeps_recent_windows(self):
+        with patch('kinesis.concurrency.HISTORY_WINDOWS', 3):
+            controller = kinesis.kinesis.ConcurrencyController(initial=4, window=1)
+        for _ in range(5):
+            self._window(controller, 1, 0.01)
+
+        self.assertEqual(len(controller.history), 3)
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_batch_report_is_written(self):
+        stream = KinesisStream(source=copy.deepcopy(SOURCE), options={
+            'profile': {'path': self.path, 'interval': 0.001, 'allocations': True}
+        })
+
+        response_method = create_response(prepare_processing_data())
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            data = stream.read()
+
+        summary = stream.profiler.summary
+        self.assertEqual(len(data), 2)
+        self.assertEqual(summary['records'], 2)
+        self.assertEqual(set(summary['phases']), {'get_records', 'decode', 'join_wait'})
+        self.assertEqual(summary['phases']['get_records']['calls'], 2)
+        self.assertIn('allocations', summary)
+        self.assertGreaterEqual(summary['sampler_cpu_time'], 0)
+        self.assertEqual(summary['cpu_utilization'], summary['cpu_time'] / summary['wall_time'])
+        self.assertEqual(sorted(os.listdir(self.path)), ['batch-000001.folded', 'batch-000001.json'])
+
+    def test_only_every_nth_batch_is_profiled(self):
+        profiler = kinesis.kinesis.BatchProfiler(self.path, every=3)
+
+        self.assertEqual([profiler.start_batch() and profiler.stop_batch() is not None for _ in range(4)],
+                         [True, False, False, True])
+
+
+class TestSample(unittest.TestCase):
+    def test_recent_records_and_schema_are_sampled(self):
+        source = copy.deepcopy(SOURCE)
+        requests = []
+
+        def response_method(self, operation_name, kwarg):
+            requests.append((operation_name, kwarg))
+            return prepare_processing_data()[len(requests) - 1]['response']
+
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            sample = KinesisStream.sample_from_source(source, max_records=10, timeout=2)
+
+        self.assertEqual(len(sample['records']), 2)
+        self.assertEqual(sample['shards'], ['shardId-000000000002'])
+        self.assertEqual(sample['schema']['referrer'], {'count': 2, 'types': {'string': 2}})
+        self.assertEqual(requests[1][1]['ShardIteratorType'], 'AT_TIMESTAMP')
+        self.assertNotIn('shards', source)
+
+    def test_listing_stops_once_enough_shards_are_found(self):
+        operation_content = prepare_processing_data()
+        operation_content[0]['response']['StreamDescription']['HasMoreShards'] = True
+        requests = []
+
+        def response_method(self, operation_name, kwarg):
+            requests.append(operation_name)
+            return operation_content.pop(0)['response']
+
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            sample = KinesisStream.sample_from_source(copy.deepcopy(SOURCE), max_shards=1, timeout=2)
+
+        self.assertEqual(sample['shards'], ['shardId-000000000002'])
+        self.assertEqual(requests.count('DescribeStream'), 1)
+
+    def test_nested_fields_are_flattened(self):
+        from kinesis.sampling import infer_schema
+
+        schema = infer_schema([{'user': {'id': 1}}, {'user': {'id': 'a'}, 'score': 1.5}])
+
+        self.assertEqual(schema['user.id'], {'count': 2, 'types': {'integer': 1, 'string': 1}})
+        self.assertEqual(schema['score'], {'count': 1, 'types': {'number': 1}})
+
+
+class TestDeduplication(unittest.TestCase):
+    def test_redelivered_records_are_skipped(self):
+        source = copy.deepcopy(SOURCE)
+        stream = KinesisStream(source=source, options={'dedup': {'capacity': 1000}})
+
+        # the same page is delivered twice before the shard is up to date
+        operation_content = prepare_processing_data()
+        operation_content.insert(3, {
+            'name': 'GetRecords',
+            'response': test_fixtures.shard_with_records
+        })
+        response_method = create_response(operation_content)
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            data = stream.read()
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(stream.deduplicator.duplicates, 2)
+        self.assertIn('dedup_state', source)
+
+    def test_state_is_restored(self):
+        first = kinesis.RecordDeduplicator(capacity=1000)
+        self.assertFalse(first.seen(b'shardId-000000000002:1'))
+
+        second = kinesis.RecordDeduplicator(capacity=1000, state=first.to_state())
+        self.assertTrue(second.seen(b'shardId-000000000002:1'))
+        self.assertFalse(second.seen(b'shardId-000000000002:2'))
+
+        # state persisted uncompressed by previous versions
+        state = dict(first.to_state(), compressed=False,
+                     current=base64.b64encode(bytes(first.current)).decode('ascii'),
+                     previous=base64.b64encode(bytes(first.previous)).decode('ascii'))
+        third = kinesis.RecordDeduplicator(capacity=1000, state=state)
+        self.assertTrue(third.seen(b'shardId-000000000002:1'))
+
+    def test_records_without_key_field_use_sequence_number(self):
+        deduplicator = kinesis.RecordDeduplicator(capacity=1000, key='id')
+        records = [{'SequenceNumber': str(i)} for i in range(5)]
+
+        seen = [deduplicator.is_duplicate('shardId-000000000002', record, {'value': 1}) for record in records]
+        self.assertEqual(seen, [False] * 5)
+        self.assertFalse(deduplicator.is_duplicate('shardId-000000000002', records[0], {'id': 1}))
+        self.assertTrue(deduplicator.is_duplicate('shardId-000000000003', records[1], {'id': 1}))
+
+
+class TestDiscovery(unittest.TestCase):
+    CREDENTIALS = {
+        'aws_access_key_id': 'accesskey34535345',
+        'aws_secret_access_key': 'secretaccess34645365465',
+        'region_name': 'us-east-1',
+    }
+
+    def setUp(self):
+        kinesis.kinesis.discovery.clear()
+
+    def test_all_pages_are_kept(self):
+        first_page = copy.deepcopy(test_fixtures.stream_list)
+        first_page['HasMoreStreams'] = True
+        second_page = copy.deepcopy(test_fixtures.stream_list)
+        second_page['StreamNames'] = ['KinesisStream-2']
+
+        response_method = create_response([
+            {'name': 'ListStreams', 'response': first_page},
+            {'name': 'ListStreams', 'response': second_page}
+        ])
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            streams = KinesisStream.get_streams(**self.CREDENTIALS)
+
+        self.assertEqual(streams, ['KinesisStream-1J0FOY3HR4F5Q', 'KinesisStream-2'])
+
+    def test_streams_are_cached(self):
+        calls = []
+
+        def response_method(self, operation_name, kwarg):
+            calls.append(operation_name)
+            return test_fixtures.stream_list
+
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            KinesisStream.get_streams(**self.CREDENTIALS)
+            streams = KinesisStream.get_streams_from_source(self.CREDENTIALS)
+
+        self.assertEqual(streams, ['KinesisStream-1J0FOY3HR4F5Q'])
+        self.assertEqual(calls, ['ListStreams'])
+
+    def _describe_response(self, errors):
+        def response_method(self, operation_name, kwarg):
+            if operation_name == 'ListStreams':
+                return {'StreamNames': ['KinesisStream-1', 'KinesisStream-2'], 'HasMoreStreams': False}
+            code = errors.get(kwarg['StreamName'])
+            if code:
+                raise ClientError({'Error': {'Code': code, 'Message': code}}, operation_name)
+            return {'StreamDescriptionSummary': {'StreamStatus': 'ACTIVE', 'OpenShardCount': 2,
+                                                 'RetentionPeriodHours': 24}}
+        return response_method
+
+    def test_removed_streams_are_skipped(self):
+        response_method = self._describe_response({'KinesisStream-2': 'ResourceNotFoundException'})
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method):
+            streams = kinesis.kinesis.discovery.describe_streams(**self.CREDENTIALS)
+
+        self.assertEqual(streams, [{'name': 'KinesisStream-1', 'status': 'ACTIVE',
+                                    'shard_count': 2, 'retention_hours': 24}])
+
+    def test_throttled_region_is_reported_and_not_cached(self):
+        credentials = dict(self.CREDENTIALS)
+        credentials.pop('region_name')
+
+        response_method = self._describe_response({'KinesisStream-2': 'LimitExceededException'})
+        with patch('botocore.client.BaseClient._make_api_call', new=response_method), \
+             patch('kinesis.discovery.time.sleep') as sleep:
+            found = KinesisStream.scan_regions(regions=['us-east-1', 'eu-west-1'], **credentials)
+
+        self.assertEqual(found, {})
+        self.assertEqual(sleep.call_count, 4)
+        self.assertEqual(sorted(kinesis.kinesis.discovery.errors_for(**credentials)), ['eu-west-1', 'us-east-1'])
+        self.assertEqual(kinesis.kinesis.discovery.errors_for('otherkey', 'othersecret'), {})
+
+        with patch('botocore.client.BaseClient._make_api_call', new=self._describe_response({})):
+            found = KinesisStream.scan_regions(regions=['us-east-1'], **credentials)
+
+        self.assertEqual(len(found['us-east-1']), 2)
+        self.assertEqual(list(kinesis.kinesis.discovery.errors_for(**credentials)), ['eu-west-1'])
+
+    def test_clients_expire_and_are_cleared(self):
+        discovery = kinesis.discovery.StreamDiscovery(lambda *credentials: object(), ttl=60)
+        client = discovery.client(**self.CREDENTIALS)
+        self.assertIs(discovery.client(**self.CREDENTIALS), client)
+
+        with patch('kinesis.discovery.time.time', return_value=time.time() + 61):
+            self.assertIsNot(discovery.client(**self.CREDENTIALS), client)
+        self.assertEqual(len(discovery.clients), 1)
+
+        discovery.clear()
+        self.assertEqual(discovery.clients, {})
+
+
+class TestImport(unittest.TestCase):
+    def test_client_libraries_are_not_imported(self):
+        script = ('import sys, kinesis; '
+                  'print(sorted(m for m in ("boto3", "botocore", "panoply", "kinesis.kinesis") if m in sys.modules))')
+        output = subprocess.check_output([sys.executable, '-c', script],
+                                         cwd=os.path.dirname(os.path.abspath(__file__)))
+
+        self.assertEqual(output.decode('utf-8').strip(), '[]')
+
+    def test_config_is_loaded_on_access(self):
+        self.assertTrue(kinesis.CONFIG['icon'].startswith('data:image/png;base64,iVBORw0KGgo'))
+        self.assertEqual(kinesis.CONFIG['params'][2]['values'], kinesis.KINESIS_REGIONS)
+
+
 # run the tests
 if __name__ == "__main__":
     unittest.main()